@@ -0,0 +1,53 @@
+"""
+Benchmark: how long ``import cooked_input`` takes.
+
+Each sample imports the package in a fresh interpreter, so nothing is already cached in
+``sys.modules``. The time to start a bare interpreter is measured the same way and subtracted,
+leaving the cost of the import itself. The table names (``cooked_input.Table``) are timed too,
+since that is where prettytable now gets loaded.
+
+Run from the repository root::
+
+    python benchmarks/bench_import.py
+
+Author: Len Wanger
+Copyright: Len Wanger, 2017-2026
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import time
+
+SNIPPETS = {
+    'bare interpreter': 'pass',
+    'import cooked_input': 'import cooked_input',
+    '... and touch Table': 'import cooked_input; cooked_input.Table',
+    '... and DateConvertor': 'import cooked_input; cooked_input.DateConvertor()("January 2, 2026", None, "")',
+}
+
+
+def time_snippet(code: str, repeat: int) -> float:
+    """Best wall-clock time, in seconds, to run ``code`` in a new interpreter."""
+    best = float('inf')
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], check=True)
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main(repeat: int = 10) -> None:
+    baseline = time_snippet(SNIPPETS['bare interpreter'], repeat)
+    print('{:<24} {:>10}'.format('snippet', 'ms'))
+
+    for name, code in SNIPPETS.items():
+        elapsed = time_snippet(code, repeat) - baseline if name != 'bare interpreter' else baseline
+        print('{:<24} {:>10.1f}'.format(name, elapsed * 1e3))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark: the memory a large Table takes per row.
+
+Measures, with ``tracemalloc``, the bytes per row allocated to hold a table's rows and to refresh
+it: for a list of :class:`TableItem` (drawn the usual way and windowed), and for a
+:class:`ColumnStore` with its columns in lists, and with the number column in an ``array.array``.
+The cell values themselves are made beforehand and not counted, as they cost the same however the
+table holds them -- apart from the numbers for the column stores, which are made as the column is, as
+a list of float objects or in an array.array, where there are none.
+
+Run from the repository root::
+
+    python benchmarks/bench_table_memory.py
+
+Author: Len Wanger
+Copyright: Len Wanger, 2017-2026
+"""
+
+from __future__ import annotations
+
+import array
+import gc
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from cooked_input import ColumnStore, Table, TableItem
+
+COUNT = 200_000
+COL_NAMES = ['Name', 'Description', 'Weight']
+
+
+def measure(make_rows: Callable[[], Any], windowed: bool = False) -> tuple[float, float]:
+    """Bytes per row allocated by ``make_rows``, and by building and refreshing a table from what it returns."""
+    gc.collect()
+    tracemalloc.start()
+
+    rows = make_rows()
+    held = tracemalloc.get_traced_memory()[0]
+    table = Table(rows, col_names=COL_NAMES, windowed=windowed)
+    table.refresh_items(table._table_items)
+    refreshed = tracemalloc.get_traced_memory()[0] - held
+
+    tracemalloc.stop()
+    return held / COUNT, refreshed / COUNT
+
+
+def main() -> None:
+    names = ['item {}'.format(i) for i in range(COUNT)]
+    descriptions = ['a description of item {}'.format(i) for i in range(COUNT)]
+    weights = [i * 1.5 for i in range(COUNT)]
+
+    cases = [
+        ('TableItem list', lambda: [TableItem([names[i], descriptions[i], weights[i]]) for i in range(COUNT)], False),
+        ('TableItem list, windowed',
+         lambda: [TableItem([names[i], descriptions[i], weights[i]]) for i in range(COUNT)], True),
+        ('ColumnStore, lists', lambda: ColumnStore([list(names), list(descriptions), [w + 0.0 for w in weights]]),
+         False),
+        ('ColumnStore, array',
+         lambda: ColumnStore([list(names), list(descriptions), array.array('d', (w + 0.0 for w in weights))]), False),
+    ]
+
+    print('{} rows, bytes per row'.format(COUNT))
+    print('{:<26} {:>8} {:>10} {:>8}'.format('', 'rows', 'refresh', 'total'))
+
+    for name, make_rows, windowed in cases:
+        held, refreshed = measure(make_rows, windowed)
+        print('{:<26} {:>8.1f} {:>10.1f} {:>8.1f}'.format(name, held, refreshed, held + refreshed))
+
+
+if __name__ == '__main__':
+    main()
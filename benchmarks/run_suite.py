@@ -0,0 +1,599 @@
+"""
+Benchmark suite: time the clean, convert and validate pipeline and the Table engine, write the results as JSON
+and compare them against a stored baseline.
+
+One fixed set of cases -- every convertor and validator, cleaner chains, choices and commands by the ten thousand,
+``process_value``, ``process_values`` (with and without metrics, in parallel and from a pool of threads), prompts
+answered through ``input``, an async input source and batch mode, ``FormSchema`` records, ``process_column``,
+``create_rows``, table builds of 1,000, 100,000 and 1,000,000 rows, refreshes, paging, column widths, a table
+over a database query and ``get_menu`` with long lists of choices -- timed the same way each run, so a change that
+slows any of them shows up as a regression against the baseline. Nothing is fetched from the network and nothing
+is typed: the prompts read from a patched ``input`` and the tables draw to ``os.devnull``.
+
+The three ``bench_*.py`` scripts next to this one measure what timing the code as it is cannot:
+``bench_pipeline.py`` the compiled pipeline against the per-call dispatch it replaced, ``bench_import.py`` the
+import in a fresh interpreter, and ``bench_table_memory.py`` the bytes a table takes per row.
+
+Run from the repository root::
+
+    python benchmarks/run_suite.py --save-baseline        # make this run the baseline
+    python benchmarks/run_suite.py                        # run everything, compare to benchmarks/baseline.json
+    python benchmarks/run_suite.py --quick                # leave out the 1,000,000 row cases
+    python benchmarks/run_suite.py -k table --json out.json
+
+Each case is timed as the best of a few repeats of enough calls to take about 0.2 seconds (``timeit``'s
+autorange), as seconds per call. A case more than ``--threshold`` (default 0.25, i.e. 25%) slower than its
+baseline is a regression, and any regression makes the exit status 1. Timings only compare on the same machine,
+so no baseline is committed: each contributor makes one with ``--save-baseline`` on their own machine, and
+without one the suite just prints its timings. It warns when the baseline was made on a different platform or
+Python.
+
+Author: Len Wanger
+Copyright: Len Wanger, 2017-2026
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import datetime
+import importlib.util
+import io
+import itertools
+import json
+import os
+import platform
+import sqlite3
+import sys
+import timeit
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, NamedTuple
+from unittest import mock
+
+import cooked_input as ci
+from cooked_input import GetInput, silent_error
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / 'baseline.json'
+DEFAULT_THRESHOLD = 0.25
+REPEAT = 3
+
+# The table sizes built. The last is left out by --quick.
+TABLE_SIZES = (1_000, 100_000, 1_000_000)
+MENU_SIZES = (1_000, 100_000)
+
+
+class Case(NamedTuple):
+    """
+    One benchmark: ``setup()`` builds whatever the case needs and returns the function to time. ``number`` fixes
+    how many calls make up a timing, rather than leaving it to autorange -- for cases slow enough that one call is
+    plenty. ``large`` marks the cases --quick leaves out.
+    """
+    name: str
+    setup: Callable[[], Callable[[], Any]]
+    number: int | None = None
+    repeat: int = REPEAT
+    large: bool = False
+
+
+def _call(func: Callable[..., Any], *args: Any) -> Callable[[], Callable[[], Any]]:
+    """A setup for timing ``func(*args)``, where the arguments are cheap enough to build when the suite is listed."""
+    return lambda: lambda: func(*args)
+
+
+def _convertor_cases() -> Iterator[Case]:
+    elem_gi = GetInput(convertor=ci.IntConvertor())
+    convertors: list[tuple[str, ci.Convertor, str]] = [
+        ('IntConvertor', ci.IntConvertor(), '12345'),
+        ('FloatConvertor', ci.FloatConvertor(), '123.45'),
+        ('BooleanConvertor', ci.BooleanConvertor(), 'yes'),
+        ('YesNoConvertor', ci.YesNoConvertor(), 'n'),
+        ('DecimalConvertor', ci.DecimalConvertor(precision=2), '1234.567'),
+        ('ChoiceConvertor', ci.ChoiceConvertor({str(i): i for i in range(1000)}), '500'),
+        ('ListConvertor', ci.ListConvertor(), 'a,b,c,d,e,f,g,h'),
+        ('ListConvertor.int_elems', ci.ListConvertor(elem_get_input=elem_gi), ','.join(map(str, range(50)))),
+        ('DateConvertor.iso', ci.DateConvertor(iso=True), '2026-10-17'),
+        ('DateConvertor.format', ci.DateConvertor(formats=['%d/%m/%Y']), '17/10/2026'),
+        ('DateConvertor.natural', ci.DateConvertor(), 'October 17 2026'),
+        ('DateConvertor.natural.english', ci.DateConvertor(languages=['en']), 'October 17 2026'),
+        ('DateConvertor.natural.cached', ci.DateConvertor(cache_size=256), 'October 17 2026'),
+        ('ListConvertor.sniffed', ci.ListConvertor(delimiter=None), 'a, b, c, d, e, f, g, h'),
+        ('ListConvertor.int_elems.1k', ci.ListConvertor(elem_get_input=elem_gi), ','.join(map(str, range(1000)))),
+    ]
+
+    for name, convertor, value in convertors:
+        yield Case('convertor.' + name, _call(convertor, value, silent_error, ci.DEFAULT_CONVERTOR_ERROR))
+
+
+def _validator_cases() -> Iterator[Case]:
+    is_even = ci.SimpleValidator(lambda value: value % 2 == 0, name='even')
+    validators: list[tuple[str, Any, Any]] = [
+        ('LengthValidator', ci.LengthValidator(2, 20), 'a string value'),
+        ('EqualToValidator', ci.EqualToValidator(42), 42),
+        ('RangeValidator', ci.RangeValidator(1, 100), 50),
+        ('ChoiceValidator', ci.ChoiceValidator(['choice {}'.format(i) for i in range(1000)]), 'choice 500'),
+        ('NoneOfValidator', ci.NoneOfValidator([ci.EqualToValidator(i) for i in range(10)]), 50),
+        ('AnyOfValidator', ci.AnyOfValidator([ci.EqualToValidator(i) for i in range(10)]), 9),
+        ('IsFileValidator', ci.IsFileValidator(), __file__),
+        ('SimpleValidator', is_even, 42),
+        ('RegexValidator', ci.RegexValidator(r'^[a-z]+-\d{3}$'), 'widget-123'),
+        ('PasswordValidator', ci.PasswordValidator(8, 32, min_lower=1, min_upper=1, min_digits=1), 'Secret123!'),
+        ('ListValidator', ci.ListValidator(ci.RangeValidator(1, 100), ci.RangeValidator(0, 1000)), list(range(50))),
+    ]
+
+    for name, validator, value in validators:
+        yield Case('validator.' + name, _call(validator, value, silent_error, ci.DEFAULT_VALIDATOR_ERROR))
+
+    yield Case('validator.ChoiceValidator.50k', _call_setup(lambda: ci.ChoiceValidator(range(50_000)),
+                                                            lambda cv: cv(49_999, silent_error, '')))
+
+
+def _cleaner_cases() -> Iterator[Case]:
+    chains: list[tuple[str, list[Any], str]] = [
+        ('strip_lower', [ci.StripCleaner(), ci.CapitalizationCleaner('lower')], '   Some Mixed Case Value   '),
+        ('remove_replace_regex', [ci.RemoveCleaner(['-', '(', ')']), ci.ReplaceCleaner(' ', ''),
+                                  ci.RegexCleaner(r'^1', '')], '1 (555) 123-4567'),
+        ('strip_capwords_choice', [ci.StripCleaner(), ci.CapitalizationCleaner('all_words'),
+                                   ci.ChoiceCleaner(['Item {}'.format(i) for i in range(1000)])], '  item 99'),
+    ]
+
+    for name, cleaners, value in chains:
+        gi = GetInput(cleaners=cleaners)
+        yield Case('cleaners.' + name, _call(gi.process_value, value))
+
+    # A Table puts a ChoiceCleaner over every row, so these are a table of 50,000 rows: a prefix matching one row
+    # (the usual case) and one matching thousands.
+    for name, value in (('unique', 'row 49999'), ('ambiguous', 'row 1')):
+        yield Case('cleaner.ChoiceCleaner.50k.' + name,
+                   _call_setup(lambda: ci.ChoiceCleaner('row {}'.format(i) for i in range(50_000)),
+                               lambda cc, v=value: cc(v)))
+
+
+def _nop_command(cmd_str: str, cmd_vars: str, cmd_dict: Any) -> ci.CommandResponse:
+    return ci.CommandResponse(ci.COMMAND_ACTION_NOP, None)
+
+
+def _command_dispatch(count: int) -> Any:
+    commands = {'/command{}'.format(i): ci.GetInputCommand(_nop_command) for i in range(count)}
+    return GetInput(commands=commands)._commands()
+
+
+def _command_cases() -> Iterator[Case]:
+    # The last command registered, and a value calling no command: both should stay flat as the count grows.
+    yield Case('commands.match.10k', _call_setup(lambda: _command_dispatch(10_000),
+                                                 lambda trie: trie.match('/command9999 some arguments')))
+    yield Case('commands.no_match.10k', _call_setup(lambda: _command_dispatch(10_000), lambda trie: trie.match('42')))
+
+
+def _pipeline_cases() -> Iterator[Case]:
+    int_gi = GetInput(ci.StripCleaner(), ci.IntConvertor(), ci.RangeValidator(1, 1000), error_callback=silent_error)
+    money_gi = GetInput(ci.StripCleaner(), ci.DecimalConvertor(precision=2), ci.RangeValidator(Decimal(0)),
+                        error_callback=silent_error)
+    values = [' {} '.format(i % 1100) for i in range(10_000)]  # about one in eleven fails validation
+
+    yield Case('process_value.int', _call(int_gi.process_value, ' 500 '))
+    yield Case('process_value.decimal', _call(money_gi.process_value, ' 1234.50 '))
+    yield Case('process_values.10k', _call(int_gi.process_value_list, values))
+    yield Case('process_values.10k.metrics', _call(_with_metrics, int_gi.process_value_list, values))
+
+    # dateparser takes a few milliseconds a value, which is what is worth spreading over processes. The parallel
+    # time includes starting the workers.
+    date_gi = GetInput(ci.StripCleaner(), ci.DateConvertor())
+    dates = ['{} {} {}'.format(MONTHS[i % 12], i % 28 + 1, 2000 + i % 25) for i in range(500)]
+    yield Case('process_values.dates.500', _call(date_gi.process_value_list, dates), number=1)
+    yield Case('process_values_parallel.dates.500', _call(_parallel, date_gi, dates), number=1)
+    yield Case('process_value.shared_by_threads.20k', _threads, number=1)
+
+
+MONTHS = ('January', 'February', 'March', 'April', 'May', 'June', 'July', 'August', 'September', 'October',
+          'November', 'December')
+
+
+def _with_metrics(func: Callable[..., Any], *args: Any) -> Any:
+    """Call ``func(*args)`` with a :class:`PipelineMetrics` recording."""
+    previous = ci.set_metrics(ci.PipelineMetrics())
+
+    try:
+        return func(*args)
+    finally:
+        ci.set_metrics(previous)
+
+
+def _parallel(gi: GetInput, values: list[str]) -> list[Any]:
+    return list(gi.process_values_parallel(values, workers=2, chunk_size=100))
+
+
+def _threads() -> Callable[[], Any]:
+    """
+    One GetInput, with a cached DateConvertor, shared by eight threads as a threaded web server validating form
+    fields might share it, each call with its own ``error_callback``.
+    """
+    gi = GetInput(ci.StripCleaner(), ci.DateConvertor(cache_size=512, languages=['en']))
+    values = ['2026-{:02d}-{:02d}'.format(i % 12 + 1, i % 28 + 1) if i % 500 else '2026-13-{:02d}'.format(i % 28 + 1)
+              for i in range(20_000)]
+
+    def process(value: str) -> Any:
+        errors: list[str] = []
+        return gi.process_value(value, error_callback=lambda fmt, v, content: errors.append(
+            fmt.format(value=v, error_content=content)))
+
+    def run() -> list[Any]:
+        with ThreadPoolExecutor(8) as executor:
+            return list(executor.map(process, values, chunksize=256))
+
+    return run
+
+
+async def _answer(prompt: str, hidden: bool) -> str:
+    return '42'
+
+
+def _prompt_cases() -> Iterator[Case]:
+    # 1,000 prompts a call, answered at once, so what is timed is cooked_input rather than the typing.
+    gi = GetInput(convertor=ci.IntConvertor(), validators=ci.RangeValidator(1, 100))
+
+    def prompts() -> None:
+        with mock.patch('builtins.input', lambda prompt='': '42'):
+            for _ in range(1000):
+                gi.get_input()
+
+    async def async_prompts() -> None:
+        for _ in range(1000):
+            await gi.get_input_async(_answer)
+
+    def batch_prompts() -> None:
+        ci.set_batch_mode(True, io.StringIO('42\n' * 1000))
+
+        try:
+            for _ in range(1000):
+                gi.get_input()
+        finally:
+            ci.set_batch_mode(False)
+
+    yield Case('prompt.input.1k', lambda: prompts)
+    yield Case('prompt.async.1k', lambda: lambda: asyncio.run(async_prompts()))
+    yield Case('prompt.batch.1k', lambda: batch_prompts)
+
+
+def _form_schema() -> ci.FormSchema:
+    def field(*args: Any, **kwargs: Any) -> GetInput:
+        return GetInput(*args, error_callback=silent_error, **kwargs)
+
+    return ci.FormSchema({
+        'name': field(ci.StripCleaner(), validators=ci.LengthValidator(1, 40)),
+        'age': field(convertor=ci.IntConvertor(), validators=ci.RangeValidator(0, 130)),
+        'email': field(ci.StripCleaner(), validators=ci.RegexValidator(r'[^@\s]+@[^@\s]+$')),
+        'quantity': field(convertor=ci.IntConvertor(), validators=ci.RangeValidator(1, 100)),
+        'comment': field(ci.StripCleaner(), required=False),
+    }, error_callback=silent_error)
+
+
+def _form_records(count: int) -> list[dict[str, str]]:
+    """CSV-style records, one in ten of them invalid."""
+    return [{'name': ' user{} '.format(i), 'age': str(i % 90) if i % 10 else 'old',
+             'email': 'u{}@example.com'.format(i), 'quantity': str(i % 7 + 1), 'comment': '' if i % 3 else 'rush'}
+            for i in range(count)]
+
+
+def _record_cases() -> Iterator[Case]:
+    yield Case('forms.validate_records.10k', _call_setup(lambda: (_form_schema(), _form_records(10_000)),
+                                                         lambda made: list(made[0].validate_records(made[1]))))
+
+    if importlib.util.find_spec('numpy') is not None:    # process_column needs NumPy, an optional dependency
+        def prices() -> list[str]:
+            return ['{}.{:02d}'.format(i % 1000, i % 100) if i % 1000 else 'n/a' for i in range(100_000)]
+
+        def counts() -> list[str]:
+            return [str(i % 5000) if i % 1000 else '-1' for i in range(100_000)]
+
+        yield Case('process_column.float.100k', _call_setup(prices, lambda values: ci.process_column(
+            values, ci.FloatConvertor(), ci.RangeValidator(0.0, 999.99), error_callback=silent_error)))
+        yield Case('process_column.int.100k', _call_setup(counts, lambda values: ci.process_column(
+            values, ci.IntConvertor(), ci.RangeValidator(0, 10_000), error_callback=silent_error)))
+
+
+class _Record(object):
+    def __init__(self, i: int) -> None:
+        self.name = 'item {}'.format(i)
+        self.description = 'a description of item {}'.format(i)
+        self.weight = i * 1.5
+
+
+def _records(count: int) -> list[_Record]:
+    return [_Record(i) for i in range(count)]
+
+
+FIELDS = ['name', 'description', 'weight']
+ITEM_DATA = {'source': 'benchmark', 'editable': False}
+
+
+def _table_build(count: int) -> Callable[[], Any]:
+    records = _records(count)
+    return lambda: ci.Table(ci.create_rows(records, FIELDS, gen_tags=True), col_names=FIELDS, refresh=False)
+
+
+def _table_refresh(count: int) -> Callable[[], Any]:
+    table = ci.Table(ci.create_rows(_records(count), FIELDS, gen_tags=True), col_names=FIELDS, refresh=False)
+    return lambda: table.refresh_items(table._table_items, table.add_exit, table.item_filter)
+
+
+def _table_paging(count: int) -> Callable[[], Any]:
+    table = ci.Table(ci.create_rows(_records(count), FIELDS, gen_tags=True), col_names=FIELDS, refresh=False)
+
+    def page() -> None:
+        # Page down through the whole table and back to the top, drawing each page, so the page cache only helps
+        # as much as it would someone paging through it.
+        if table.table.start + table._page_size >= table.get_num_rows():
+            table.goto_home()
+        else:
+            table.page_down()
+
+    return page
+
+
+def _menu(count: int) -> Callable[[], Any]:
+    choices = ['menu choice {}'.format(i) for i in range(count)]
+    answer = str(count // 2)
+
+    def menu() -> Any:
+        with mock.patch('builtins.input', lambda prompt='': answer):
+            return ci.get_menu(choices, title='Pick one', refresh=False)
+
+    return menu
+
+
+def _table_cases() -> Iterator[Case]:
+    for count in TABLE_SIZES:
+        size = _size_name(count)
+        large = count >= 1_000_000
+        once = 1 if count >= 100_000 else None
+        yield Case('create_rows.' + size, _call_setup(lambda c=count: _records(c),
+                                                       lambda records: ci.create_rows(records, FIELDS, gen_tags=True)),
+                   number=once, large=large)
+        yield Case('table.build.' + size, lambda c=count: _table_build(c), number=once, large=large)
+        yield Case('table.refresh_items.' + size, lambda c=count: _table_refresh(c), number=once, large=large)
+        yield Case('table.paging.' + size, lambda c=count: _table_paging(c), large=large)
+
+    for count in MENU_SIZES:
+        yield Case('get_menu.' + _size_name(count), lambda c=count: _menu(c), number=1 if count >= 100_000 else None)
+
+    def records() -> list[_Record]:
+        return _records(100_000)
+
+    yield Case('create_rows.item_data.100k',
+               _call_setup(records, lambda r: ci.create_rows(r, FIELDS, item_data=ITEM_DATA)), number=1)
+    yield Case('create_rows.share_item_data.100k',
+               _call_setup(records, lambda r: ci.create_rows(r, FIELDS, item_data=ITEM_DATA, share_item_data=True)),
+               number=1)
+    yield Case('create_table.100k', _call_setup(records, lambda r: ci.create_table(r, FIELDS, FIELDS[1:])), number=1)
+
+
+def _item_table(count: int, **kwargs: Any) -> ci.Table:
+    return ci.Table(ci.create_rows(_records(count), FIELDS), col_names=FIELDS[1:], **kwargs)
+
+
+def _text_table(count: int, **kwargs: Any) -> ci.Table:
+    rows = [ci.TableItem(['item {}'.format(i), 'a long description of item {} '.format(i) * (1 + i % 3),
+                          'notes ' * (i % 7)]) for i in range(count)]
+    return ci.Table(rows, col_names=['Name', 'Description', 'Notes'], **kwargs)
+
+
+def _prompt_redraw(table: ci.Table) -> Callable[[], Any]:
+    """What a table does each time it prompts: refresh its rows and draw the current page."""
+    def redraw() -> None:
+        table.refresh_items(table._table_items, table.add_exit, table.item_filter)
+        table.refresh_screen()
+
+    return redraw
+
+
+def _dirty_row(table: ci.Table) -> Callable[[], Any]:
+    """The prompt after one row changed, on a table with ``refresh=TABLE_REFRESH_AUTO``."""
+    table._prep_get_input()
+    items = itertools.cycle(table._table_items)
+
+    def prompt() -> None:
+        table.mark_dirty(next(items))
+        table._prep_get_input()
+
+    return prompt
+
+
+def _tag_lookups(count: int) -> Callable[[], Any]:
+    table = ci.Table([ci.TableItem(['item {}'.format(i)]) for i in range(count)], col_names=['Name'])
+    table.refresh_items(table._table_items)
+    tags = [1 + (i * 7919) % count for i in range(1000)]
+    return lambda: table.get_rows(tags)
+
+
+def _page_flips() -> Callable[[], Any]:
+    """Flipping back and forth over the first five pages of a wide table, as the page cache is there for."""
+    rows = [ci.TableItem(['item {} column {}'.format(i, c) for c in range(12)]) for i in range(10_000)]
+    table = ci.Table(rows, col_names=['Column {}'.format(c) for c in range(12)], refresh=False)
+    flips = itertools.count()
+
+    def flip() -> None:
+        if (next(flips) // 4) % 2 == 0:
+            table.page_down()
+        else:
+            table.page_up()
+
+    return flip
+
+
+def _first_page(table: ci.Table) -> Callable[[], Any]:
+    """Laying out and drawing the first page afresh, rather than from the page cache."""
+    def draw() -> None:
+        table._page_cache.clear()
+        table.goto_home()
+
+    return draw
+
+
+def _query_table(count: int) -> Callable[[], Any]:
+    """A table over a database query: built, shown and paged down ten times, fetching only the pages shown."""
+    conn = sqlite3.connect(':memory:')
+    conn.execute('CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT, description TEXT, weight REAL)')
+    conn.executemany('INSERT INTO items VALUES (?, ?, ?, ?)',
+                     ((i, 'item {}'.format(i), 'a description of item {}'.format(i), i * 1.5) for i in range(count)))
+    query = 'SELECT name, description, weight FROM items ORDER BY id'
+
+    def browse() -> None:
+        table = ci.Table(ci.DBAPITableSource(conn, query), col_names=FIELDS)
+        table.show_table()
+        for _ in range(10):
+            table.page_down()
+
+    return browse
+
+
+def _table_engine_cases() -> Iterator[Case]:
+    yield Case('table.prompt.100k', lambda: _prompt_redraw(_item_table(100_000)), number=1)
+    yield Case('table.prompt.windowed.100k', lambda: _prompt_redraw(_item_table(100_000, windowed=True)), number=1)
+    yield Case('table.dirty_row.100k', lambda: _dirty_row(_item_table(100_000, refresh=ci.TABLE_REFRESH_AUTO)))
+    yield Case('table.get_rows.100k', lambda: _tag_lookups(100_000))
+    yield Case('table.page_flips.wide', _page_flips)
+
+    widths: list[tuple[str, Any]] = [('page', ci.TABLE_WIDTHS_PAGE), ('table', ci.TABLE_WIDTHS_TABLE),
+                                     ('fixed', [10, 40, 20])]
+    for name, col_widths in widths:
+        yield Case('table.widths.{}.100k'.format(name),
+                   lambda w=col_widths: _first_page(_text_table(100_000, refresh=False,
+                                                                style=ci.TableStyle(col_widths=w))))
+
+    yield Case('table.widths.table.dirty_row.100k',
+               lambda: _dirty_row(_text_table(100_000, refresh=ci.TABLE_REFRESH_AUTO,
+                                              style=ci.TableStyle(col_widths=ci.TABLE_WIDTHS_TABLE))))
+    yield Case('table.query.100k', lambda: _query_table(100_000))
+
+
+def _call_setup(make: Callable[[], Any], func: Callable[[Any], Any]) -> Callable[[], Callable[[], Any]]:
+    """A setup calling ``make()`` once, outside the timing, and then timing ``func`` on what it made."""
+    def setup() -> Callable[[], Any]:
+        made = make()
+        return lambda: func(made)
+
+    return setup
+
+
+def _size_name(count: int) -> str:
+    return '1m' if count >= 1_000_000 else '{}k'.format(count // 1000)
+
+
+def all_cases() -> list[Case]:
+    """Every case in the suite, in the order run."""
+    return [*_convertor_cases(), *_validator_cases(), *_cleaner_cases(), *_command_cases(), *_pipeline_cases(),
+            *_prompt_cases(), *_record_cases(), *_table_cases(), *_table_engine_cases()]
+
+
+def time_case(case: Case) -> float:
+    """Time ``case``, returning the best seconds per call over its repeats."""
+    func = case.setup()
+    timer = timeit.Timer(func)
+    number = case.number if case.number is not None else timer.autorange()[0]
+    return min(timer.repeat(repeat=case.repeat, number=number)) / number
+
+
+def machine() -> dict[str, str]:
+    """What the timings were taken on, stored with them so a comparison can say when it is not like for like."""
+    return {'python': platform.python_version(), 'implementation': platform.python_implementation(),
+            'platform': platform.platform(), 'machine': platform.machine(), 'cooked_input': ci.__version__}
+
+
+def compare(results: dict[str, float], baseline: dict[str, float], threshold: float) -> list[str]:
+    """
+    Print each result against its baseline.
+
+    :return: the names of the cases more than ``threshold`` slower than their baseline
+    """
+    regressions = []
+    print('{:<40} {:>12} {:>12} {:>8}'.format('case', 'us/call', 'baseline', 'change'))
+
+    for name, seconds in results.items():
+        base = baseline.get(name)
+
+        if base is None:
+            print('{:<40} {:>12.3f} {:>12} {:>8}'.format(name, seconds * 1e6, '-', 'new'))
+            continue
+
+        change = seconds / base - 1.0
+        flag = ''
+        if change > threshold:
+            regressions.append(name)
+            flag = '  REGRESSION'
+
+        print('{:<40} {:>12.3f} {:>12.3f} {:>+7.0%}{}'.format(name, seconds * 1e6, base * 1e6, change, flag))
+
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description='Run the cooked_input benchmark suite.')
+    parser.add_argument('-k', dest='filter', default=None, help='only run the cases whose name contains this')
+    parser.add_argument('--quick', action='store_true', help='leave out the 1,000,000 row cases')
+    parser.add_argument('--list', action='store_true', help='list the cases and exit')
+    parser.add_argument('--json', type=Path, default=None, help='write the results to this file')
+    parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE, help='the baseline to compare against')
+    parser.add_argument('--save-baseline', action='store_true', help='write the results as the baseline')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='the slowdown, as a fraction, counted as a regression (default 0.25)')
+    args = parser.parse_args(argv)
+
+    if args.threshold < 0:
+        parser.error('--threshold must be 0 or more -- got {!r}'.format(args.threshold))
+
+    cases = [case for case in all_cases()
+             if (args.filter is None or args.filter in case.name) and not (args.quick and case.large)]
+
+    if args.list:
+        for case in cases:
+            print(case.name)
+        return 0
+
+    results: dict[str, float] = {}
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        for case in cases:
+            results[case.name] = time_case(case)
+            print('{:<40} {:>12.3f} us'.format(case.name, results[case.name] * 1e6), file=sys.stderr)
+
+    report = {'machine': machine(), 'created': datetime.datetime.now().isoformat(timespec='seconds'),
+              'results': results}
+
+    if args.json is not None:
+        args.json.write_text(json.dumps(report, indent=2) + '\n')
+
+    if args.save_baseline:
+        if args.baseline.exists():
+            # Keep the cases this run left out (by -k or --quick) rather than dropping them from the baseline.
+            old = json.loads(args.baseline.read_text())['results']
+            report['results'] = {**old, **results}
+        args.baseline.write_text(json.dumps(report, indent=2) + '\n')
+        print('saved the baseline to {}'.format(args.baseline))
+        return 0
+
+    if not args.baseline.exists():
+        # The usual state of a fresh checkout, as the baseline is not committed: show the timings on their own.
+        print('no baseline at {} -- run with --save-baseline to make one\n'.format(args.baseline))
+        compare(results, {}, args.threshold)
+        return 0
+
+    stored = json.loads(args.baseline.read_text())
+    if stored.get('machine') != report['machine']:
+        print('warning: the baseline was made on {}, not this machine -- timings may not compare'.format(
+            stored.get('machine')))
+
+    print()
+    regressions = compare(results, stored['results'], args.threshold)
+
+    if regressions:
+        print('\n{} regression(s) beyond {:.0%}: {}'.format(len(regressions), args.threshold, ', '.join(regressions)))
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
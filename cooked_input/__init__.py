@@ -1,25 +1,24 @@
 # -*- coding: utf-8 -*-
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .get_input import GetInput
 from .input_convenience import get_input, process_value
 from .input_convenience import get_string, get_int, get_float, get_boolean, get_date, get_yes_no, get_money, get_list
+from .input_convenience import get_input_async, get_string_async, get_int_async, get_float_async, get_boolean_async
+from .input_convenience import get_date_async, get_yes_no_async, get_money_async, get_list_async
 from .get_input import GetInputInterrupt
 from .get_input import RefreshScreenInterrupt
 from .get_input import PageUpRequest, PageDownRequest, FirstPageRequest, LastPageRequest, UpOneRowRequest, DownOneRowRequest
 from .get_input import GetInputCommand, CommandResponse, COMMAND_ACTION_USE_VALUE, COMMAND_ACTION_CANCEL, COMMAND_ACTION_NOP
+from .get_input import set_batch_mode, in_batch_mode, BATCH_MODE_AUTO
+from .get_input import set_metrics, get_metrics
+from .metrics import PipelineMetrics, LatencyHistogram
+from .forms import FormSchema, FormResponse, DEFAULT_CONSTRAINT_ERROR
+from .vectorized import process_column, ColumnResponse
 
-from .get_table import Table, TableItem
-from .table_convenience import get_table_input, create_table, create_rows, show_table, get_menu
-from .get_table import TABLE_ITEM_EXIT, TABLE_ITEM_RETURN, TABLE_ITEM_DEFAULT, TABLE_ADD_EXIT, TABLE_ADD_RETURN
-from .get_table import TABLE_ADD_NONE
-from .get_table import TABLE_RETURN_TAG, TABLE_RETURN_FIRST_VAL, TABLE_RETURN_ROW, TABLE_RETURN_TABLE_ITEM
-from .get_table import TableStyle, RULE_ALL, RULE_NONE, RULE_FRAME, RULE_HEADER
-
-from .get_table import return_table_item_action, return_row_action, return_tag_action, return_first_col_action
-from .get_table import first_page_cmd_action, last_page_cmd_action, next_page_cmd_action, prev_page_cmd_action
-from .get_table import scroll_up_one_row_cmd_action, scroll_down_one_row_cmd_action
-
-from .error_callbacks import MaxRetriesError, ConvertorError, ValidationError
+from .error_callbacks import MaxRetriesError, ConvertorError, ValidationError, InputExhaustedError
 from .error_callbacks import print_error, log_error, silent_error, DEFAULT_CONVERTOR_ERROR, DEFAULT_VALIDATOR_ERROR
 from .convertors import TABLE_ID, TABLE_VALUE, TABLE_ID_OR_VALUE
 from .convertors import Convertor, IntConvertor, FloatConvertor, BooleanConvertor
@@ -37,3 +36,97 @@ from .input_utils import make_pretty_table
 from .input_utils import put_in_a_list, isstring
 
 from .version import __version__
+
+# The table half of the package is loaded on first use rather than here. get_table builds its
+# RULE_* constants from prettytable at import time, so importing it eagerly made every program
+# pay for prettytable -- a short-lived CLI that only ever calls get_int included. The names are
+# still reached as cooked_input.Table and so on: the module __getattr__ below (PEP 562) imports
+# the module that defines one the first time it is asked for. dateparser is deferred the same
+# way, inside DateConvertor, and so is asyncio, which only the async input sources need.
+_LAZY_ATTRS = {
+    name: 'get_table' for name in (
+        'Table', 'TableItem', 'TableStyle', 'TableDataSource', 'DBAPITableSource', 'ColumnStore',
+        'TABLE_ITEM_EXIT', 'TABLE_ITEM_RETURN', 'TABLE_ITEM_DEFAULT', 'TABLE_ADD_EXIT', 'TABLE_ADD_RETURN',
+        'TABLE_ADD_NONE',
+        'TABLE_RETURN_TAG', 'TABLE_RETURN_FIRST_VAL', 'TABLE_RETURN_ROW', 'TABLE_RETURN_TABLE_ITEM',
+        'TABLE_REFRESH_AUTO', 'TABLE_WIDTHS_PAGE', 'TABLE_WIDTHS_TABLE',
+        'RULE_ALL', 'RULE_NONE', 'RULE_FRAME', 'RULE_HEADER',
+        'return_table_item_action', 'return_row_action', 'return_tag_action', 'return_first_col_action',
+        'first_page_cmd_action', 'last_page_cmd_action', 'next_page_cmd_action', 'prev_page_cmd_action',
+        'scroll_up_one_row_cmd_action', 'scroll_down_one_row_cmd_action',
+    )
+}
+_LAZY_ATTRS.update({
+    name: 'async_input' for name in ('thread_input', 'StreamInputSource')
+})
+_LAZY_ATTRS.update({
+    name: 'table_convenience' for name in (
+        'get_table_input', 'create_table', 'create_rows', 'iter_rows', 'show_table', 'get_menu',
+    )
+})
+
+# `from cooked_input import *` only sees the names bound in the module, so without this list it would miss every
+# name in _LAZY_ATTRS -- Table, get_menu and the rest -- that __getattr__ supplies. It lists both, the lazy names
+# taken from _LAZY_ATTRS so a name added there is exported too, and a star import loads the table half of the package,
+# as it always did.
+__all__ = [
+    'GetInput', 'GetInputInterrupt', 'RefreshScreenInterrupt',
+    'get_input', 'process_value',
+    'get_string', 'get_int', 'get_float', 'get_boolean', 'get_date', 'get_yes_no', 'get_money', 'get_list',
+    'get_input_async', 'get_string_async', 'get_int_async', 'get_float_async', 'get_boolean_async',
+    'get_date_async', 'get_yes_no_async', 'get_money_async', 'get_list_async',
+    'PageUpRequest', 'PageDownRequest', 'FirstPageRequest', 'LastPageRequest', 'UpOneRowRequest', 'DownOneRowRequest',
+    'GetInputCommand', 'CommandResponse', 'COMMAND_ACTION_USE_VALUE', 'COMMAND_ACTION_CANCEL', 'COMMAND_ACTION_NOP',
+    'set_batch_mode', 'in_batch_mode', 'BATCH_MODE_AUTO',
+    'set_metrics', 'get_metrics', 'PipelineMetrics', 'LatencyHistogram',
+    'FormSchema', 'FormResponse', 'DEFAULT_CONSTRAINT_ERROR',
+    'process_column', 'ColumnResponse',
+    'MaxRetriesError', 'ConvertorError', 'ValidationError', 'InputExhaustedError',
+    'print_error', 'log_error', 'silent_error', 'DEFAULT_CONVERTOR_ERROR', 'DEFAULT_VALIDATOR_ERROR',
+    'TABLE_ID', 'TABLE_VALUE', 'TABLE_ID_OR_VALUE',
+    'Convertor', 'IntConvertor', 'FloatConvertor', 'BooleanConvertor',
+    'ListConvertor', 'DateConvertor', 'YesNoConvertor', 'ChoiceConvertor', 'DecimalConvertor',
+    'Validator', 'LengthValidator', 'EqualToValidator', 'RangeValidator',
+    'AnyOfValidator', 'NoneOfValidator', 'ChoiceValidator', 'RegexValidator', 'PasswordValidator',
+    'IsFileValidator', 'ListValidator', 'SimpleValidator', 'validate',
+    'Cleaner', 'CapitalizationCleaner', 'LOWER_CAP_STYLE', 'UPPER_CAP_STYLE', 'FIRST_WORD_CAP_STYLE',
+    'LAST_WORD_CAP_STYLE', 'ALL_WORDS_CAP_STYLE',
+    'StripCleaner', 'RemoveCleaner', 'ReplaceCleaner', 'ChoiceCleaner', 'RegexCleaner',
+    'make_pretty_table', 'put_in_a_list', 'isstring',
+] + sorted(_LAZY_ATTRS)
+
+# The submodules themselves, which an eager import used to leave bound as attributes of the package.
+_LAZY_MODULES = {'get_table', 'table_convenience'}
+
+if TYPE_CHECKING:
+    # What a type checker and an IDE need to see -- the names __getattr__ supplies at run time.
+    from .get_table import Table, TableItem, TableDataSource, DBAPITableSource, ColumnStore
+    from .table_convenience import get_table_input, create_table, create_rows, iter_rows, show_table, get_menu
+    from .async_input import thread_input, StreamInputSource
+    from .get_table import TABLE_ITEM_EXIT, TABLE_ITEM_RETURN, TABLE_ITEM_DEFAULT, TABLE_ADD_EXIT, TABLE_ADD_RETURN
+    from .get_table import TABLE_ADD_NONE
+    from .get_table import TABLE_RETURN_TAG, TABLE_RETURN_FIRST_VAL, TABLE_RETURN_ROW, TABLE_RETURN_TABLE_ITEM
+    from .get_table import TABLE_REFRESH_AUTO, TABLE_WIDTHS_PAGE, TABLE_WIDTHS_TABLE
+    from .get_table import TableStyle, RULE_ALL, RULE_NONE, RULE_FRAME, RULE_HEADER
+
+    from .get_table import return_table_item_action, return_row_action, return_tag_action, return_first_col_action
+    from .get_table import first_page_cmd_action, last_page_cmd_action, next_page_cmd_action, prev_page_cmd_action
+    from .get_table import scroll_up_one_row_cmd_action, scroll_down_one_row_cmd_action
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_MODULES:
+        return importlib.import_module('.' + name, __name__)
+
+    try:
+        module_name = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name)) from None
+
+    value = getattr(importlib.import_module('.' + module_name, __name__), name)
+    globals()[name] = value  # later lookups find it directly and never come back here
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS) | _LAZY_MODULES)
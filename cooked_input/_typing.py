@@ -24,7 +24,7 @@ Copyright: Len Wanger, 2017-2026
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Awaitable, Iterable
 from typing import TYPE_CHECKING, Any, Callable, TypeAlias
 
 from .cleaners import Cleaner
@@ -84,3 +84,8 @@ RowAction: TypeAlias = Callable[["TableItem", dict[str, Any]], Any]
 #: returning a ``(hidden, enabled)`` pair. Returning anything else is reported as a
 #: ``RuntimeError`` by :meth:`~cooked_input.get_table.Table.refresh_items`.
 ItemFilter: TypeAlias = Callable[["TableItem", dict[str, Any]], tuple[bool, bool]]
+
+#: Where :meth:`~cooked_input.get_input.GetInput.get_input_async` gets each line, invoked as
+#: ``await input_source(prompt, hidden)`` and returning the line typed, without its newline.
+#: ``hidden`` is **True** when the line should not be shown as it is typed.
+AsyncInputSource: TypeAlias = Callable[[str, bool], Awaitable[str]]
@@ -0,0 +1,107 @@
+"""
+Input sources for getting values from inside an asyncio program.
+
+:meth:`GetInput.get_input_async`, the ``get_*_async`` convenience functions and
+:meth:`Table.get_table_choice_async` and :meth:`Table.run_async` wait for each line typed by awaiting an
+input source -- an async function called as ``await input_source(prompt, hidden)``, returning the line
+typed without its newline. This module holds the two that come with cooked_input:
+:func:`thread_input`, the default, and :class:`StreamInputSource`. Any other async function with the
+same signature will do, for instance one reading from a websocket. An input source may also have a
+``write(text)`` coroutine, which is used to show everything else -- the blank line before each prompt, and a
+table's pages -- where the prompts go.
+
+Kept out of ``get_input.py`` so that ``import cooked_input`` does not import asyncio for the programs
+that never use it (see ``__init__.py``.)
+
+Author: Len Wanger
+Copyright: Len Wanger, 2017-2026
+"""
+
+from __future__ import annotations
+
+import asyncio
+import getpass
+
+
+async def thread_input(prompt: str, hidden: bool) -> str:
+    """
+    The default input source: call `input` (or `getpass.getpass` for a hidden value) on a worker thread.
+
+    :param prompt: the prompt to show
+    :param hidden: **True** to keep what is typed off the screen
+
+    :return: the line typed
+
+    The event loop carries on while the worker thread waits for the user. Like `input`, raises **EOFError**
+    at the end of the input. Cancelling the coroutine stops the wait, but not the worker thread, which
+    still takes the next line typed.
+    """
+    if hidden:
+        return await asyncio.to_thread(getpass.getpass, prompt)
+    else:
+        return await asyncio.to_thread(input, prompt)
+
+
+class StreamInputSource(object):
+    """
+    An input source reading lines from an asyncio stream -- such as the reader
+    `asyncio.start_server <https://docs.python.org/3/library/asyncio-stream.html#asyncio.start_server>`_
+    hands a connection, for an admin console on a socket.
+
+    :param reader: the `asyncio.StreamReader` to read lines from
+    :param writer: the `asyncio.StreamWriter` to write prompts to. If **None** (default) prompts are written
+        to ``sys.stdout``.
+    :param encoding: the encoding of the lines read and the prompts written. Defaults to **'utf-8'**
+
+    :return: the line read, without its line ending. Raises **EOFError**, as `input` does, at the end of the stream.
+
+    A stream cannot be told to stop echoing what is typed, so a hidden value is read like any other -- hiding it,
+    if that matters, is up to whatever is at the other end of the stream.
+
+    The blank line before each prompt, and the pages of a :class:`Table` prompting through a StreamInputSource, are
+    shown with :meth:`write`, so they go to the ``writer`` along with the prompts. Errors still go to the
+    ``error_callback``, which prints to ``sys.stderr`` unless another is given.
+
+    For instance, to read from standard input without a worker thread (not on Windows)::
+
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader()
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+        age = await ci.get_int_async(prompt='Age', input_source=ci.StreamInputSource(reader))
+    """
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter | None = None,
+                 encoding: str = 'utf-8') -> None:
+        self.reader = reader
+        self.writer = writer
+        self.encoding = encoding
+
+    async def __call__(self, prompt: str, hidden: bool) -> str:
+        if self.writer is None:
+            print(prompt, end='', flush=True)
+        else:
+            self.writer.write(prompt.encode(self.encoding))
+            await self.writer.drain()
+
+        line = await self.reader.readline()
+
+        if not line:
+            raise EOFError('StreamInputSource: end of the stream')
+
+        return line.decode(self.encoding).rstrip('\r\n')
+
+    async def write(self, text: str) -> None:
+        """
+        Write ``text``, followed by a newline, to where the prompts go.
+
+        :param text: the text to write
+
+        :return: None
+        """
+        if self.writer is None:
+            print(text, flush=True)
+        else:
+            self.writer.write((text + '\n').encode(self.encoding))
+            await self.writer.drain()
+
+    def __repr__(self) -> str:
+        return 'StreamInputSource(reader={!r}, writer={!r})'.format(self.reader, self.writer)
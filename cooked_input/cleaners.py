@@ -9,6 +9,7 @@ Copyright: Len Wanger, 2017-2026
 from __future__ import annotations
 
 import re
+from bisect import bisect_left
 from string import capwords
 from abc import ABCMeta, abstractmethod
 from collections.abc import Iterable
@@ -191,6 +192,24 @@ class ChoiceCleaner(Cleaner):
         else:
             self._str_choices = {str(choice).lower(): choice for choice in choices}
 
+        # The keys in sorted order. Every key starting with a given prefix sorts into one run,
+        # beginning where bisect would insert the prefix, so finding out whether a prefix is
+        # unique is a binary search and a look at the two keys there, not a scan of every
+        # choice. Table puts one of these over all of its row tags.
+        self._sorted_keys = sorted(self._str_choices)
+
+    def _unique_match(self, prefix: str) -> str | None:
+        # The one key starting with prefix, or None if there are none or more than one.
+        keys = self._sorted_keys
+        i = bisect_left(keys, prefix)
+
+        if i == len(keys) or not keys[i].startswith(prefix):
+            return None     # no key starts with prefix
+        elif i + 1 < len(keys) and keys[i + 1].startswith(prefix):
+            return None     # at least two do
+        else:
+            return keys[i]
+
     def __call__(self, value: Any) -> Any:
         # The one cleaner that is not str -> str: choices may hold any object, and a
         # match returns the choice itself rather than the text that selected it.
@@ -198,10 +217,10 @@ class ChoiceCleaner(Cleaner):
             str_value = str(value)
         else:
             str_value = str(value).lower()
-        matches = [v for k, v in self._str_choices.items() if k.startswith(str_value)]
+        match = self._unique_match(str_value)
 
-        if len(matches) == 1:
-            return matches[0]
+        if match is not None:
+            return self._str_choices[match]
         elif value in self._str_choices:  # one value is an exact subset of another
             return self._str_choices[value]
         else:
@@ -8,8 +8,12 @@ Copyright: Len Wanger, 2017-2026
 from __future__ import annotations
 
 import csv
-import dateparser
 import decimal
+import functools
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
 from datetime import datetime
 from io import StringIO
 from abc import ABCMeta, abstractmethod
@@ -22,12 +26,61 @@ from .error_callbacks import ConvertorError
 if TYPE_CHECKING:
     # get_input imports this module, so the reverse import only exists for annotations.
     from .get_input import GetInput
+    from dateparser.date import DateDataParser
+    import _csv
 
 
 TABLE_ID = 0
 TABLE_VALUE = 1
 TABLE_ID_OR_VALUE = -1
 
+# The ISO 8601 / RFC 3339 shapes DateConvertor parses without dateparser: a full date, optionally
+# followed by a time and an offset. The form is limited to what datetime.fromisoformat accepts on
+# every supported Python version (3.11 takes more) so the fast path behaves the same on all of them.
+_ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}([T ]\d{2}:\d{2}(:\d{2}(\.\d{3}(\d{3})?)?)?(Z|[+-]\d{2}:\d{2})?)?\Z',
+                          re.IGNORECASE)
+_ISO_ZULU_RE = re.compile(r'Z\Z', re.IGNORECASE)
+_DATE_RELATIVE_BASE = datetime(1900, 1, 1)
+
+
+def _compile_dialect(dialect: type[csv.Dialect]) -> _csv.Dialect:
+    # csv.reader reads every attribute of a Dialect class each time it is handed one. The
+    # reader's own .dialect is the checked, ready-to-use form, and costs nothing to reuse.
+    # Making it also checks the dialect, raising TypeError for e.g. a two character delimiter.
+    return csv.reader([], dialect).dialect
+
+
+def _make_list_dialect(delimiter: str) -> _csv.Dialect:
+    # The dialect ListConvertor has always used: the excel dialect (which quotes minimally) with
+    # the given delimiter, and the spaces after each delimiter dropped.
+    return _compile_dialect(type('ListDialect', (csv.excel,), {'delimiter': delimiter, 'skipinitialspace': True}))
+
+
+# The longest value whose sniffed dialect is cached. The cache lives as long as the process, so it only holds short
+# values -- a typed or retried list -- rather than keeping up to 128 pasted blocks of text alive. Longer values are
+# sniffed each time, which is little next to splitting and converting them anyway.
+_SNIFF_CACHE_MAX_LEN = 1024
+
+
+def _sniff_list_dialect(value: str) -> _csv.Dialect:
+    if len(value) > _SNIFF_CACHE_MAX_LEN:
+        return _sniff_dialect(value)
+    return _cached_sniff_dialect(value)
+
+
+def _sniff_dialect(value: str) -> _csv.Dialect:
+    # What was sniffed (delimiter, quote character, ...) is kept; only skipinitialspace is
+    # changed, as it always has been.
+    return _compile_dialect(type('ListDialect', (csv.Sniffer().sniff(value),), {'skipinitialspace': True}))
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_sniff_dialect(value: str) -> _csv.Dialect:
+    # Sniffing runs a handful of regular expressions over the whole value, and the same list is
+    # often converted again (a retried prompt, a default, a batch with repeats), so the answer is
+    # kept. lru_cache does not cache a raise, so an unsniffable value is tried afresh each time.
+    return _sniff_dialect(value)
+
 
 ###
 ### Convertors:
@@ -165,43 +218,75 @@ class ListConvertor(Convertor):
         self._elem_get_input = elem_get_input
         super(ListConvertor, self).__init__(value_error_str)
 
+        # Fixing: __call__ used to csv.register_dialect('my_dialect', ...) on every value. That
+        # wrote to the csv module's global registry each time, and two ListConvertors with
+        # different delimiters (e.g. nested lists, or two threads) shared the one name, so each
+        # only got its own delimiter if nothing re-registered it in between. The dialect is now
+        # this convertor's own, built once, so a bad delimiter (e.g. '::') is reported here
+        # rather than on the first value.
+        self._dialect = None if delimiter is None else _make_list_dialect(delimiter)
+
+    def _fields(self, value: str) -> list[str]:
+        # Split value into its (unconverted) elements. Only the first line of a multi-line value is used.
+        dialect = _sniff_list_dialect(value) if self._dialect is None else self._dialect
+
+        try:
+            return next(csv.reader(StringIO(value), dialect))
+        except StopIteration:
+            return []
+
+    def _convert_fields(self, elem_get_input: GetInput, fields: list[str]) -> Iterator[Any]:
+        for valid, converted_elem in elem_get_input.process_values(fields):
+            if valid is not True:
+                raise ConvertorError(self.value_error_str)
+            yield converted_elem
+
     def __call__(self, value: str, error_callback: ErrorCallback, convertor_fmt_str: str) -> list[Any]:
-        buffer = StringIO(value)
+        fields = self._fields(value)
 
-        if self._delimeter is None:
-            dialect = csv.Sniffer().sniff(value)
-            dialect.skipinitialspace = True
-        else:
-            csv.register_dialect('my_dialect', delimiter=self._delimeter, quoting=csv.QUOTE_MINIMAL, skipinitialspace=True)
-            dialect = csv.get_dialect('my_dialect')
+        if not self._elem_get_input:
+            return fields
 
+        # A plain loop rather than list(iter_convert(...)): it skips a generator step per element.
+        process_value = self._elem_get_input.process_value
         converted_list: list[Any] = []
-        reader = csv.reader(buffer, dialect)
 
-        try:
-            lst = next(reader)
-        except (StopIteration):
-            return converted_list
+        for item in fields:
+            # Not `value`: that is the whole comma-separated string this method was handed,
+            # and rebinding it to one converted element made the two different things share a name.
+            valid, converted_elem = process_value(item)
 
-        try:
-            if self._elem_get_input:
-                for item in lst:
-                    # Not `value`: that is the whole comma-separated string this method
-                    # was handed, and rebinding it to one converted element made the two
-                    # different things share a name.
-                    valid, converted_elem = self._elem_get_input.process_value(item)
-
-                    if valid is True:
-                        converted_list.append(converted_elem)
-                    else:
-                        raise ConvertorError
+            if valid is True:
+                converted_list.append(converted_elem)
             else:
-                converted_list = lst
-        except ConvertorError:
-            raise ConvertorError(self.value_error_str)
+                raise ConvertorError(self.value_error_str)
 
         return converted_list
 
+    def iter_convert(self, value: str) -> Iterator[Any]:
+        """
+        :param value: the string to convert
+
+        :return: an iterator over the converted elements of ``value``
+        :raises ConvertorError: (from the iterator) when an element fails ``elem_get_input``'s
+            :meth:`GetInput.process_value`
+
+        The streaming form of calling the convertor. Elements are converted one at a time as the iterator is
+        advanced, so a very long list can be consumed without building the whole converted list first, and a
+        consumer that stops early never converts the rest. Elements before a bad one have already been
+        produced when the error is raised. As with the convertor itself, the error for the bad element is
+        reported by ``elem_get_input``'s ``error_callback``.
+
+        ``value`` is split into its elements by the csv module, up front and in one go -- only the conversion is
+        lazy. A sniffing error (``delimiter=None``) is raised by this call rather than by the iterator.
+        """
+        fields = self._fields(value)
+
+        if not self._elem_get_input:
+            return iter(fields)
+
+        return self._convert_fields(self._elem_get_input, fields)
+
     def __repr__(self) -> str:
         return 'ListConvertor(%s)' % self.value_error_str
 
@@ -211,6 +296,18 @@ class DateConvertor(Convertor):
     convert to a `datetime <https://docs.python.org/3/library/datetime.html#datetime.datetime>`_ value.
 
     :param value_error_str: (optional) the error string to use when an improper value is input
+    :param formats: (optional) a list of `strptime <https://docs.python.org/3/library/datetime.html#strftime-and-strptime-format-codes>`_
+        format strings to try, in order, before falling back to dateparser
+    :param iso: (optional) if **True** values in ISO 8601 / RFC 3339 form (e.g. '2026-01-02' or '2026-01-02T10:30:00Z')
+        are parsed directly, without calling dateparser. Default is **True** unless ``date_order`` or ``settings`` is
+        given (see below)
+    :param cache_size: (optional) the number of recently converted values to remember. Default is **0** (no cache)
+    :param languages: (optional) a list of language codes (e.g. ``['en']``) dateparser should try. Default is to detect
+        the language from the value
+    :param locales: (optional) a list of locale codes (e.g. ``['en-GB']``) dateparser should try
+    :param date_order: (optional) the order of an ambiguous numeric date: 'DMY', 'MDY', 'YMD', etc. Default is dateparser's
+        (taken from the locale)
+    :param settings: (optional) a dictionary of `dateparser settings <https://dateparser.readthedocs.io/en/latest/settings.html>`_
 
     :return: ``value`` converted to a `datetime <https://docs.python.org/3/library/datetime.html#datetime.datetime>`_
     :raises ConvertorError: if dateparser is unable to convert ``value`` to a
@@ -220,18 +317,160 @@ class DateConvertor(Convertor):
     Converts the cleaned input to an datetime value. Dateparser is used for the parsing, allowing
     a lot of flexibility in how date input is entered (e.g. '12/12/12', 'October 1, 2015', 'today', or 'next Tuesday').
     For more information about dateparser see: `<https://dateparser.readthedocs.io/en/latest/>`_
+
+    Dateparser's flexibility is paid for on every value: it detects the language and tries a long list of formats
+    even when the input is a plain ISO date. When a lot of dates are converted (e.g. with
+    :meth:`GetInput.process_values`) the cheaper checks are tried first: the ISO 8601 form, then each of
+    ``formats``. Dateparser is only called for values none of them match. A time zone offset in an ISO value
+    gives an aware datetime, as dateparser does, though with a :class:`datetime.timezone` as its ``tzinfo``.
+
+    With ``cache_size`` set, the last ``cache_size`` distinct values and their datetimes are kept, so a repeated
+    value is not parsed again. Only values that mean the same date whenever they are parsed come from the cache:
+    relative dates such as 'today', 'next Tuesday' or 'October 1' (no year) are parsed every time. Telling the two
+    apart takes a second parse by dateparser, which is made the second time a value is seen, so a value seen only
+    once is parsed only once.
+
+    By default dateparser works out the language of every value by trying each of the locales it knows. When the input
+    is known to be in one language, passing it in ``languages`` (or ``locales``) skips the detection, which is most of
+    dateparser's time. ``date_order`` and ``settings`` are passed on to dateparser too. A ``date_order`` or ``settings``
+    can change how dateparser reads even an ISO date (with ``date_order='DMY'`` it reads '2026-01-02' as February 1),
+    so when either is given ISO values go to dateparser as well, unless ``iso=True`` is passed. The dateparser
+    parser is built from these options the first time a thread needs it and reused for every value after that.
+
+    A DateConvertor can be used from several threads at once: the cache is changed under a lock, and each thread
+    builds and uses dateparser parsers of its own.
     """
-    def __init__(self, value_error_str: str = 'a date') -> None:
+    def __init__(self, value_error_str: str = 'a date', formats: Iterable[str] | None = None, iso: bool | None = None,
+                 cache_size: int = 0, languages: Iterable[str] | None = None, locales: Iterable[str] | None = None,
+                 date_order: str | None = None, settings: dict[str, Any] | None = None) -> None:
+        if cache_size < 0:
+            raise ValueError('DateConvertor: cache_size must be 0 or more -- got {!r}'.format(cache_size))
+
         super(DateConvertor, self).__init__(value_error_str)
+        self.formats = list(formats) if formats else []
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str, tuple[datetime | None, bool]] = OrderedDict()
+        # Guards the cache. A cache hit is a lookup and a move_to_end, and another thread dropping the value in
+        # between would make the move raise KeyError.
+        self._lock = threading.Lock()
+
+        self.languages = list(languages) if languages else None
+        self.locales = list(locales) if locales else None
+        self.settings = dict(settings) if settings else {}
+        if date_order:
+            self.settings['DATE_ORDER'] = date_order
+
+        self.iso = (not self.settings) if iso is None else iso
+
+        # The dateparser parsers, built by _dateparser on first use, as attributes 'parser' and
+        # 'relative_base_parser'. Constructing one here would import dateparser with cooked_input, and a
+        # convertor that only ever sees ISO dates would never need it. Each thread has its own, so that
+        # nothing rests on how well a DateDataParser guards the state it keeps between parses (the
+        # locales it last matched), which has varied between dateparser releases.
+        self._parsers = threading.local()
+
+    def _dateparser(self, relative_base: bool = False) -> DateDataParser:
+        # The same parser is used for every value in a thread: dateparser.parse builds a new one on each
+        # call whenever it is given languages, locales or settings. The second parser, pinned to a fixed
+        # RELATIVE_BASE, is only needed to keep relative dates out of the cache.
+        name = 'relative_base_parser' if relative_base else 'parser'
+        parser = getattr(self._parsers, name, None)
+
+        if parser is None:
+            # dateparser takes hundreds of milliseconds to import, so it is loaded the first time a
+            # date is parsed rather than whenever cooked_input is. The import is cached after that.
+            from dateparser.date import DateDataParser
+
+            settings = dict(self.settings, RELATIVE_BASE=_DATE_RELATIVE_BASE) if relative_base else self.settings
+            parser = DateDataParser(languages=self.languages, locales=self.locales, settings=settings or None)
+            setattr(self._parsers, name, parser)
+
+        return parser
+
+    def _parse_fast(self, value: str) -> datetime | None:
+        # The parses that do not need dateparser. Both give the same datetime no matter when
+        # they are run, so anything found here can go in the cache.
+        if self.iso and _ISO_DATE_RE.match(value):
+            # fromisoformat only learned the trailing Z in Python 3.11.
+            try:
+                return datetime.fromisoformat(_ISO_ZULU_RE.sub('+00:00', value))
+            except ValueError:
+                pass    # the right shape but not a real date (e.g. month 13) -- let the others try
+
+        for fmt in self.formats:
+            try:
+                return datetime.strptime(value, fmt)
+            except ValueError:
+                pass
+
+        return None
 
     def __call__(self, value: str, error_callback: ErrorCallback, convertor_fmt_str: str) -> datetime:
-        result = dateparser.parse(value)
-        if result:
-            return result
-        else:
+        entry = None
+
+        if self.cache_size:
+            with self._lock:
+                entry = self._cache.get(value)
+                if entry is not None:
+                    self._cache.move_to_end(value)
+
+        if entry is not None:
+            result, checked = entry
+
+            if not checked:
+                # Parsed by dateparser once before, and not yet known to mean the same date whenever it is
+                # parsed. A relative date ('today', 'in 2 days', 'May 5' with no year) comes out differently
+                # when parsed as of another moment, and one far in the past can never be mistaken for now.
+                # Checked the second time a value is seen rather than the first, so that values seen once
+                # are parsed once.
+                if self._dateparser(relative_base=True).get_date_data(value).date_obj != result:
+                    result = None
+
+                self._remember(value, result, True)
+
+            if result is not None:
+                return result
+
+        # A result found without dateparser, or with a RELATIVE_BASE of the caller's own, is already fixed.
+        result = self._parse_fast(value)
+        checked = result is not None or 'RELATIVE_BASE' in self.settings
+
+        if result is None:
+            result = self._dateparser().get_date_data(value).date_obj
+
+        if not result:
             error_callback(convertor_fmt_str, value, self.value_error_str)
             raise ConvertorError('value not a valid date')
 
+        if self.cache_size and entry is None:
+            self._remember(value, result, checked)
+
+        return result
+
+    def _remember(self, value: str, result: datetime | None, checked: bool) -> None:
+        # Cache entries are (datetime, checked) for a value not yet checked for being a relative date,
+        # (datetime, True) for one that is not, and (None, True) for one that is.
+        with self._lock:
+            self._cache[value] = (result, checked)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Neither the lock nor the thread-local parsers can be pickled, as GetInput.process_values_parallel
+        # needs to. The parsers are built again on first use.
+        state = self.__dict__.copy()
+        del state['_lock'], state['_parsers']
+
+        with self._lock:
+            state['_cache'] = OrderedDict(self._cache)
+
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._parsers = threading.local()
+
     def __repr__(self) -> str:
         return 'DateConvertor(%s)' % self.value_error_str
 
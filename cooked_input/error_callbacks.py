@@ -22,6 +22,13 @@ class MaxRetriesError(RuntimeError):
     """
     pass
 
+class InputExhaustedError(EOFError):
+    """
+    raised when the input runs out -- the end of a piped stdin, say -- while a value is still wanted. A
+    subclass of **EOFError**, which is what `input` raises at the end of the input.
+    """
+    pass
+
 class ValidationError(ValueError):
     """
     raised when a value does not pass validation.
@@ -50,8 +57,13 @@ def print_error(fmt_str: str, value: Any, error_content: str) -> None:
     :param error_content: additional information for the error
 
     :return: None
+
+    The message and its newline are written in one call, so messages from threads sharing a :class:`GetInput`
+    come out whole, one to a line, rather than run together.
     """
-    print(fmt_str.format(value=value, error_content=error_content), file=sys.stderr)
+    # Dropped print(..., file=sys.stderr): it writes the message and the newline separately, and another
+    # thread's message can land in between.
+    sys.stderr.write(fmt_str.format(value=value, error_content=error_content) + '\n')
 
 
 def silent_error(fmt_str: str, value: Any, error_content: str) -> None:
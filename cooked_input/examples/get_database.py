@@ -77,9 +77,9 @@ def build_a_burger_v2(conn):
     # Get the options - note: allow an arbitrary of options, and keep track of how many of each
     prompt_str = 'Which kind of extra do you want (hit return when done choosing extras)'
     extras = []
-    cursor.execute('SELECT * FROM extras')
-    tis = [table_item_factory(row) for row in cursor]
-    tbl = ci.Table(tis, col_names=col_names.split(), title=None, prompt=prompt_str, add_exit=False,
+    # The extras are fetched from the database a page at a time, as they are shown, rather than all up front.
+    extras_source = ci.DBAPITableSource(conn, 'SELECT * FROM extras ORDER BY id', item_factory=table_item_factory)
+    tbl = ci.Table(extras_source, col_names=col_names.split(), title=None, prompt=prompt_str, add_exit=False,
                    default_action='table_item', required=False, refresh=False)
 
     while True:
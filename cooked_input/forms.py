@@ -0,0 +1,241 @@
+"""
+Validating whole records -- a form's fields, a row of a CSV file, a line of JSONL -- with a :class:`GetInput` per
+field.
+
+A :class:`FormSchema` maps each field name to the :class:`GetInput` whose cleaning, conversion and validation the
+field gets, and can add constraints between fields (a start date before an end date, say). Validating a record runs
+every field through its pipeline and then the constraints, and hands back a :class:`FormResponse` with the result
+for each field. :meth:`FormSchema.validate_records` does the same for any number of records, working out
+everything that does not depend on the record once rather than once per record.
+
+Author: Len Wanger
+Copyright: Len Wanger, 2017-2026
+"""
+
+from __future__ import annotations
+
+import collections
+import itertools
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from typing import Any, overload
+
+from ._typing import ErrorCallback, ValidatorArg
+from .error_callbacks import print_error
+from .get_input import GetInput
+from .input_utils import put_in_a_list
+
+#: The default format string for a failed constraint. Gets **{value}** (the record's converted values, as a
+#: dictionary) and **{error_content}** set by the constraint.
+DEFAULT_CONSTRAINT_ERROR = 'record {error_content}'
+
+FormResponse = collections.namedtuple('FormResponse', 'valid values failed')
+FormResponse.__doc__ = """\
+The result of validating a record with :class:`FormSchema`.
+
+``valid``: **True** if every field and every constraint passed
+
+``values``: a dictionary of the converted value of each field in the schema -- **None** for a field that failed (or
+was left blank)
+
+``failed``: a tuple of the names of the fields that failed, in the schema's order. It is empty when every field
+passed, even if a constraint then failed.
+"""
+
+
+class FormSchema(object):
+    """
+    Validate records -- dictionaries of field name to value -- with a :class:`GetInput` for each field.
+
+    :param fields: a dictionary of field name to the :class:`GetInput` to clean, convert and validate the field with.
+        The fields are processed in the order given.
+    :param constraints: (optional) a validator, or list of validators, checking the fields against each other. Each is
+        called like any other `validator <validators.html>`_, with the dictionary of converted values as the value,
+        and only once every field has passed. A constraint raising **TypeError** when a field is **None** -- a blank
+        optional field compared with ``<=``, say -- is skipped, as a blank field's validators are.
+    :param error_callback: (optional) the callback to report errors to. Defaults to :func:`print_error`
+    :param constraint_error_fmt: (optional) the format string for failed constraints. Defaults to
+        **DEFAULT_CONSTRAINT_ERROR**
+
+    A field's :class:`GetInput` is used as it would be for a prompt: a field missing from the record, or given as
+    **None** or an empty string (as an empty CSV cell is), is blank. A blank field takes the ``default`` if the
+    :class:`GetInput` has one, passes as **None** if it is not ``required``, and otherwise fails as 'cannot be blank'.
+    Anything else goes through :meth:`GetInput.process_value`, as a string: a value that is not one (a number from a
+    JSON record, say) is passed through `str` first, as a :class:`GetInput`'s ``default`` is. Fields in the record
+    that are not in the schema are ignored.
+
+    Errors all go to the schema's ``error_callback`` (or the one given for the call), not those of the fields'
+    :class:`GetInput`, with the field name in front -- **age: "x" cannot be converted to an integer number** -- so
+    a record's errors say where they are. For example::
+
+        schema = FormSchema({
+                'name': GetInput(StripCleaner(), validators=LengthValidator(1, 40)),
+                'start': GetInput(convertor=DateConvertor()),
+                'end': GetInput(convertor=DateConvertor()),
+            },
+            constraints=SimpleValidator(lambda rec: rec['start'] <= rec['end'], name='start on or before the end'))
+
+        response = schema.validate({'name': 'Len', 'start': '2026-01-02', 'end': '2026-01-09'})
+
+        with open('bookings.csv', newline='') as f:
+            for response in schema.validate_records(csv.DictReader(f)):
+                ...
+
+        with open('bookings.jsonl') as f:
+            bad = sum(not response.valid for response in schema.validate_records(map(json.loads, f)))
+
+    A schema holds nothing that changes as records are validated, so one can be shared between threads (see
+    :class:`GetInput`).
+    """
+    def __init__(self, fields: Mapping[str, GetInput], constraints: ValidatorArg = None,
+                 *, error_callback: ErrorCallback = print_error,
+                 constraint_error_fmt: str = DEFAULT_CONSTRAINT_ERROR) -> None:
+        for name, gi in fields.items():
+            if not isinstance(gi, GetInput):
+                raise TypeError('FormSchema: field {!r} must be a GetInput -- got {!r}'.format(name, gi))
+
+        constraints = put_in_a_list(constraints)
+        for constraint in constraints:
+            if not callable(constraint):
+                raise TypeError('FormSchema: a constraint must be a validator -- got {!r}'.format(constraint))
+
+        self.fields = dict(fields)
+        self.constraints = constraints
+        self.error_callback = error_callback
+        self.constraint_error_fmt = constraint_error_fmt
+
+    def validate(self, record: Mapping[str, Any], error_callback: ErrorCallback | None = None) -> FormResponse:
+        """
+        :param record: a dictionary of field name to value
+        :param error_callback: (optional) the callback to report this record's errors to, in place of the schema's
+            ``error_callback``
+
+        :return: a :class:`FormResponse` namedtuple ``(valid, values, failed)``
+        """
+        return next(self.validate_records((record,), error_callback=error_callback))
+
+    # One FormResponse per record without a chunk_size, lists of them with one. The pair below says that to a type
+    # checker.
+    @overload
+    def validate_records(self, records: Iterable[Mapping[str, Any]], chunk_size: None = ...,
+                         error_callback: ErrorCallback | None = ...) -> Iterator[FormResponse]: ...
+    @overload
+    def validate_records(self, records: Iterable[Mapping[str, Any]], chunk_size: int,
+                         error_callback: ErrorCallback | None = ...) -> Iterator[list[FormResponse]]: ...
+    def validate_records(self, records: Iterable[Mapping[str, Any]], chunk_size: int | None = None,
+                         error_callback: ErrorCallback | None = None
+                         ) -> Iterator[FormResponse] | Iterator[list[FormResponse]]:
+        """
+        :param records: an iterable of records (dictionaries of field name to value), such as a
+            `csv.DictReader <https://docs.python.org/3/library/csv.html#csv.DictReader>`_. It is read lazily, so it
+            can be a generator or a file of any length.
+        :param chunk_size: if **None** (the default) yield one :class:`FormResponse` per record. Otherwise yield lists
+            of up to ``chunk_size`` of them.
+        :param error_callback: (optional) the callback to report errors to, in place of the schema's
+            ``error_callback``
+
+        :return: a generator of :class:`FormResponse` namedtuples, one per record and in the same order -- or of lists
+            of them when ``chunk_size`` is set.
+
+        The plan for the records -- each field's compiled pipeline, how it treats a blank, and the callback its errors
+        go to -- is worked out once, when the first record is wanted, as :meth:`GetInput.process_values` does for
+        values. Changes to the fields' :class:`GetInput` made after that are not seen until the next call.
+        """
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError('FormSchema.validate_records: chunk_size must be at least 1 -- got {!r}'.format(
+                chunk_size))
+
+        if error_callback is None:
+            error_callback = self.error_callback
+
+        validate_record = self._compile(error_callback)
+        record_iter = iter(records)
+
+        if chunk_size is None:
+            for record in record_iter:
+                yield validate_record(record)
+        else:
+            while True:
+                chunk = list(itertools.islice(record_iter, chunk_size))
+                if not chunk:
+                    return
+                yield [validate_record(record) for record in chunk]
+
+    def _compile(self, error_callback: ErrorCallback) -> Callable[[Mapping[str, Any]], FormResponse]:
+        """
+        Build one function validating a record, with everything that does not depend on the record decided here, as
+        :meth:`GetInput._compile_pipeline` does for a value: each field's compiled pipeline, the error callback
+        putting the field's name in front of its errors, and how the field treats a blank.
+
+        :return: a function ``validate_record(record)`` returning a :class:`FormResponse`
+        """
+        plan = tuple((name, gi._pipeline(), _field_error_callback(name, error_callback), gi.required, gi.default_val,
+                      gi.validator_error_fmt) for name, gi in self.fields.items())
+        constraints = tuple(self.constraints)
+        constraint_fmt = self.constraint_error_fmt
+
+        def validate_record(record: Mapping[str, Any]) -> FormResponse:
+            values: dict[str, Any] = {}
+            failed: list[str] | None = None     # made only for the records with a field that fails
+
+            for name, pipeline, field_error, required, default_val, blank_fmt in plan:
+                value = record.get(name)
+
+                if value.__class__ is not str:
+                    # The pipelines are built for typed text -- IntConvertor will not take an int -- so the numbers
+                    # and booleans of a JSON record go in as the strings a user would have typed, as GetInput's
+                    # default does. (0 and False are values, not blanks.)
+                    value = '' if value is None else str(value)
+
+                if value:
+                    valid, values[name] = pipeline(value, field_error)
+                elif default_val is not None:
+                    valid, values[name] = pipeline(default_val, field_error)
+                else:
+                    values[name] = None
+                    valid = not required
+
+                    if required:
+                        field_error(blank_fmt, value, 'cannot be blank')
+
+                if not valid:
+                    if failed is None:
+                        failed = []
+                    failed.append(name)
+
+            if failed is not None:
+                return FormResponse(False, values, tuple(failed))
+
+            for constraint in constraints:
+                try:
+                    passed = constraint(values, error_callback, constraint_fmt)
+                except TypeError:
+                    if not any(value is None for value in values.values()):
+                        raise
+                    # A blank optional field has no value to check, so a constraint tripping over its None (comparing
+                    # it with a date, say) is skipped, as the field's own validators were.
+                    continue
+
+                # As with a field's validators, the first failure stops the run.
+                if not passed:
+                    return FormResponse(False, values, ())
+
+            return FormResponse(True, values, ())
+
+        return validate_record
+
+    def __repr__(self) -> str:
+        return 'FormSchema({})'.format(', '.join(self.fields))
+
+
+def _field_error_callback(name: str, error_callback: ErrorCallback) -> ErrorCallback:
+    """
+    Return an error callback passing errors on to ``error_callback`` with ``name`` in front of them.
+    """
+    # The name goes into the format string, so any braces in it have to be doubled to come out as themselves.
+    prefix = '{}: '.format(name).replace('{', '{{').replace('}', '}}')
+
+    def field_error(fmt_str: str, value: Any, error_content: str) -> None:
+        error_callback(prefix + fmt_str, value, error_content)
+
+    return field_error
+
@@ -18,14 +18,20 @@ from __future__ import annotations
 import collections
 import collections.abc
 import getpass
-from typing import Any
-
-from ._typing import CleanerArg, CommandAction, CommandsArg, ErrorCallback, GetInputValidatorArg
-from .error_callbacks import MaxRetriesError, ValidationError, ConvertorError
+import itertools
+import os
+import sys
+import time
+from collections.abc import Generator, Iterable, Iterator
+from typing import Any, Callable, TextIO
+
+from ._typing import AsyncInputSource, CleanerArg, CommandAction, CommandsArg, ErrorCallback, GetInputValidatorArg
+from ._typing import ValidatorFunc
+from .error_callbacks import MaxRetriesError, ValidationError, ConvertorError, InputExhaustedError
 from .error_callbacks import print_error, DEFAULT_CONVERTOR_ERROR, DEFAULT_VALIDATOR_ERROR
-from .validators import _in_all
 from .convertors import Convertor
-from .input_utils import compose
+from .input_utils import put_in_a_list
+from .metrics import PipelineMetrics, stage_name
 
 
 # Custom exceptions for get_input
@@ -195,6 +201,171 @@ class GetInputCommand(object):
 # Named tuple for return values of GetInput.process_value
 ProcessValueResponse = collections.namedtuple('ProcessValueResponse', 'valid value')
 
+# Every failure looks the same to the caller, so one instance serves them all.
+_INVALID_RESPONSE = ProcessValueResponse(False, None)
+
+#: A compiled clean/convert/validate pipeline, called as ``pipeline(value, error_callback)``.
+Pipeline = Callable[[Any, ErrorCallback], ProcessValueResponse]
+
+# The cleaners and the validators a pipeline is compiled from, as tuples (see GetInput._stages).
+_Stages = tuple[tuple[Any, ...], tuple[Any, ...]]
+
+# The GetInput attributes a compiled pipeline is built from. Assigning to any of them discards it.
+_PIPELINE_ATTRS = frozenset({'cleaners', 'convertor', 'validators', 'convertor_error_fmt', 'validator_error_fmt'})
+
+
+class _CommandTrie(object):
+    """
+    Internal class matching a response to the command it calls, by the longest command string it starts with.
+
+    :param commands: the commands dictionary given to :class:`GetInput`
+
+    The command strings are laid out one character per level of nested dictionaries, with the command ending at
+    a level stored under the ``''`` key (never a character.) Matching walks the response down from the top,
+    remembering the last command passed, so it takes as many steps as the command typed is long, however many
+    commands there are. When a response starts with several command strings the longest is called: **/help** is
+    not called as **/h** with **elp** as its arguments.
+    """
+    def __init__(self, commands: dict[str, GetInputCommand]) -> None:
+        self._root: dict[str, Any] = {}
+
+        for cmd_str, command in commands.items():
+            node = self._root
+            for char in cmd_str:
+                node = node.setdefault(char, {})
+            node[''] = (cmd_str, command)
+
+    def match(self, response: str) -> tuple[str, str, GetInputCommand] | None:
+        """
+        :param response: the response typed
+
+        :return: a tuple of the command string (stripped of white space), the rest of the response (its arguments,
+            also stripped) and the command for the longest command string ``response`` starts with after any leading
+            white space, or **None** if it starts with none of them
+        """
+        text = response.lstrip()
+        node = self._root
+        found = node.get('')
+
+        for char in text:
+            node = node.get(char)
+            if node is None:
+                break
+            elif '' in node:
+                found = node['']
+
+        if found is None:
+            return None
+
+        cmd_str, command = found
+        return cmd_str.strip(), text[len(cmd_str):].strip(), command
+
+
+BATCH_MODE_AUTO = 'auto'
+
+class _BatchReader(object):
+    """
+    Internal class handing out the lines of a stream for batch mode.
+    """
+    def __init__(self, stream: TextIO) -> None:
+        self.stream = stream
+        self._at_end = False
+
+    def readline(self) -> str | None:
+        """
+        :return: the next line, without its newline (as `input` returns it), or **None** at the end of the stream
+        """
+        if self._at_end:    # a terminal can be read again after the end of its input -- but not by us
+            return None
+
+        # readline, not read(size): on a pipe read(size) waits for size characters or the end of the input, so a
+        # program sending one answer at a time and waiting for the next prompt (an expect script, say) would wait
+        # forever. readline returns as soon as a line is there, and is served from the stream's own buffer, which
+        # reads what is available a block at a time.
+        line = self.stream.readline()
+
+        if not line:
+            self._at_end = True
+            return None
+
+        return line[:-1] if line.endswith('\n') else line    # the last line may have no newline after it
+
+
+# The reader for batch mode, or None when not in batch mode. See set_batch_mode.
+_batch_reader: _BatchReader | None = None
+
+
+def set_batch_mode(mode: bool | str = BATCH_MODE_AUTO, stream: TextIO | None = None) -> bool:
+    """
+    Turn batch mode on or off. Batch mode is for running a program non-interactively, with its answers piped in
+    (``my_wizard.py < answers.txt``) rather than typed.
+
+    :param mode: **True** to turn batch mode on, **False** to turn it off, or ``BATCH_MODE_AUTO`` (default) to turn
+        it on only if ``stream`` is not a terminal.
+    :param stream: the stream to read the answers from. Defaults to ``sys.stdin``.
+
+    :return: **True** if batch mode is now on, otherwise **False**
+
+    In batch mode :class:`GetInput` (and so the ``get_*`` functions and :class:`Table`) reads each answer with the
+    stream's ``readline``, rather than through `input`, and shows no prompts and no tables -- only the messages for
+    rejected values, which go to ``sys.stderr``. Hidden values are read the same way. When the answers run out, the
+    prompt waiting for one raises :class:`InputExhaustedError`.
+
+    Each answer is taken as soon as its line arrives, so a program driving this one can send the answers one at a
+    time, waiting for each to be used. The stream's own buffering may read ahead of the answers asked for, so
+    anything else reading the same file descriptor may find data gone. The coroutine versions (see
+    :meth:`GetInput.get_input_async`) read from their input source either way.
+    """
+    global _batch_reader
+
+    if stream is None:
+        stream = sys.stdin
+
+    if mode == BATCH_MODE_AUTO:
+        mode = not stream.isatty()
+    elif not isinstance(mode, bool):
+        raise ValueError('set_batch_mode: mode must be True, False or BATCH_MODE_AUTO -- got {!r}'.format(mode))
+
+    _batch_reader = _BatchReader(stream) if mode else None
+    return mode
+
+
+def in_batch_mode() -> bool:
+    """
+    :return: **True** if batch mode is on. See :func:`set_batch_mode`.
+    """
+    return _batch_reader is not None
+
+
+# The metrics being recorded, or None when not recording any. See set_metrics.
+_metrics: PipelineMetrics | None = None
+
+
+def set_metrics(metrics: PipelineMetrics | None) -> PipelineMetrics | None:
+    """
+    Start recording timings and counts for the clean, convert and validate pipeline, or stop.
+
+    :param metrics: the :class:`PipelineMetrics` to record into, or **None** to stop recording
+
+    :return: the metrics that were being recorded before, or **None** if there were none, so a caller can put them
+        back when done
+
+    While no metrics are set every :class:`GetInput` runs the pipeline built without any timing, so recording
+    nothing costs nothing.
+    """
+    global _metrics
+
+    previous = _metrics
+    _metrics = metrics
+    return previous
+
+
+def get_metrics() -> PipelineMetrics | None:
+    """
+    :return: the :class:`PipelineMetrics` being recorded into, or **None** if there are none. See :func:`set_metrics`.
+    """
+    return _metrics
+
 
 class GetInput(object):
     """
@@ -246,7 +417,25 @@ class GetInput(object):
                 "/help": GetInputCommand(show_help_action)),
             }
 
+        A response starting with more than one command string calls the longest of them, so **/h** and **/help**
+        can both be commands. The commands can be changed between prompts, by assigning a new dictionary to
+        ``commands`` or by changing the one given.
+
         For more information see :class:`GetInputCommand`
+
+    Sharing between threads:
+
+        Once built, a :class:`GetInput` can be shared by any number of threads calling :meth:`process_value`,
+        :meth:`process_values` and :meth:`process_value_list` at once, as a threaded web server validating form
+        fields might: nothing in processing a value changes the instance, or the built-in cleaners, convertors and
+        validators it holds. (The one cache among them, :class:`DateConvertor`'s, is kept under a lock.) Pass each
+        call its own ``error_callback`` to keep one request's errors apart from another's; the default,
+        :func:`print_error`, writes each message in one piece, so messages from several threads do not run
+        together.
+
+        Assigning to an attribute while other threads are processing values with the instance is not safe -- a
+        thread may run a value through the old pipeline or the new one. Set everything up first, or give each
+        thread its own instance.
     """
     def __init__(self, cleaners: CleanerArg = None, convertor: Convertor | None = None,
                  validators: GetInputValidatorArg = None, *,
@@ -260,6 +449,10 @@ class GetInput(object):
                  error_callback: ErrorCallback = print_error,
                  convertor_error_fmt: str = DEFAULT_CONVERTOR_ERROR,
                  validator_error_fmt: str = DEFAULT_VALIDATOR_ERROR) -> None:
+        # The compiled pipeline and the metrics it records into, as one tuple so that a thread never sees one
+        # without the other. See _pipeline.
+        self._compiled_pipeline: tuple[Pipeline, PipelineMetrics | None, _Stages] | None = None
+        self._command_trie: tuple[_CommandTrie, dict[str, GetInputCommand]] | None = None
         self.cleaners = cleaners
         self.convertor = convertor
         self.validators = validators
@@ -308,77 +501,174 @@ class GetInput(object):
 
         This method prompts the user for an input, and returns the cleaned, converted, and validated input.
         """
+        steps = self._input_steps()
+        metrics = _metrics
+
+        if _batch_reader is None:   # nobody to show it to in batch mode
+            print('')
+
+        try:
+            input_str = next(steps)
+            while True:
+                batch_reader = _batch_reader
+                start = time.perf_counter()
+
+                try:
+                    if batch_reader is not None:
+                        response = batch_reader.readline()
+                        if response is None:
+                            raise EOFError
+                    elif self.hidden:
+                        response = getpass.getpass(prompt=input_str)
+                    else:
+                        response = input(input_str)
+                except EOFError as error:
+                    raise _input_exhausted(self.prompt_str) from error
+
+                if metrics is not None:
+                    metrics.wait.record(time.perf_counter() - start)
+
+                input_str = steps.send(response)
+        except StopIteration as stop:
+            return stop.value
+
+
+    async def get_input_async(self, input_source: AsyncInputSource | None = None) -> Any:
+        """
+        Coroutine version of :meth:`get_input`, for prompting from inside an asyncio program without
+        blocking its event loop.
+
+        :param input_source: an async function called as ``await input_source(prompt, hidden)`` for each
+            line typed, returning the line without its newline. **None** (default) uses
+            :func:`thread_input`, which calls `input` (or `getpass`) on a worker thread. See
+            :class:`StreamInputSource` to read from an asyncio stream instead.
+
+        :return: the cleaned, converted, validated input, as for :meth:`get_input`
+
+        The cleaning, conversion, validation, retries and commands are the same as :meth:`get_input`'s --
+        both run the same steps, and differ only in how they wait for each line.
+        """
+        if input_source is None:
+            from .async_input import thread_input
+            input_source = thread_input
+
+        steps = self._input_steps()
+        metrics = _metrics
+
+        if _batch_reader is None:
+            # Through the input source, as the prompts go: to the stream a StreamInputSource writes to, say.
+            await _show_async('', input_source)
+
+        try:
+            input_str = next(steps)
+            while True:
+                start = time.perf_counter()
+
+                try:
+                    response = await input_source(input_str, self.hidden)
+                except EOFError as error:
+                    raise _input_exhausted(self.prompt_str) from error
+
+                if metrics is not None:
+                    metrics.wait.record(time.perf_counter() - start)
+
+                input_str = steps.send(response)
+        except StopIteration as stop:
+            return stop.value
+
+
+    def _input_steps(self) -> Generator[str, str, Any]:
+        """
+        Internal generator doing the work of :meth:`get_input` and :meth:`get_input_async`, other than reading lines.
+
+        :return: a generator that yields the prompt each time it needs a line, is sent the line typed, and returns
+            the cleaned, converted, validated input
+
+        Leaving the reading to the caller is what lets a coroutine wait for each line while all of the rest --
+        commands, defaults, retries -- is written once.
+        """
         retries = 0
         # Fixing: `valid_response` used to be assigned only inside the loop, so
         # retries=0 -- a loop whose body never runs -- reached the check after it with
         # the name unbound and raised UnboundLocalError instead of the MaxRetriesError
         # the caller asked for by setting a retry limit.
         valid_response = False
-        input_str = '{}{}: '.format(self.prompt_str, self.default_string)
-        print('')
+        metrics = _metrics
+        finished = True
 
-        while (self.max_retries is None) or (retries < self.max_retries):
-            if self.hidden:
-                response = getpass.getpass(prompt=input_str)
-            else:
-                response = input(input_str)
-
-            if self.commands:
-                command_action = None
-                for cmd in self.commands:
-                    if response.lstrip().startswith(cmd):
-                        idx = response.find(cmd)
-                        cmd_str = response[:idx+len(cmd)].strip()
-                        cmd_vars = response[idx+len(cmd):].strip()
-                        command_action, command_value = self.commands[cmd](cmd_str, cmd_vars)
-                        break
-
-                if command_action:
-                    if command_action == COMMAND_ACTION_USE_VALUE:
-                        response = command_value
-                    elif command_action == COMMAND_ACTION_NOP:
-                        continue
-                    elif command_action == COMMAND_ACTION_CANCEL:
-                        raise GetInputInterrupt
+        try:
+            input_str = '{}{}: '.format(self.prompt_str, self.default_string)
+
+            while (self.max_retries is None) or (retries < self.max_retries):
+                response = yield input_str
+
+                if self.commands:
+                    # Dropped walking the dictionary with startswith for each command: the first
+                    # match in dictionary order won, so /h could shadow /help, and every line cost a
+                    # test per command. The trie takes the longest match, in steps per character.
+                    command_action = None
+                    match = self._commands().match(response)
+
+                    if match is not None:
+                        cmd_str, cmd_vars, command = match
+                        command_action, command_value = command(cmd_str, cmd_vars)
+
+                    if command_action:
+                        if command_action == COMMAND_ACTION_USE_VALUE:
+                            response = command_value
+                        elif command_action == COMMAND_ACTION_NOP:
+                            continue
+                        elif command_action == COMMAND_ACTION_CANCEL:
+                            raise GetInputInterrupt
+                        else:
+                            raise RuntimeError('GetInput.get_input: Unknown command action specified ({})'.format(command_action))
+
+                if not self.required and not response:
+                    return None
+                elif self.default_val and not response:
+                    valid_response, converted_response = self.process_value(self.default_val)
+
+                    if valid_response:
+                        return converted_response
                     else:
-                        raise RuntimeError('GetInput.get_input: Unknown command action specified ({})'.format(command_action))
-
-            if not self.required and not response:
-                return None
-            elif self.default_val and not response:
-                valid_response, converted_response = self.process_value(self.default_val)
-
-                if valid_response:
-                    return converted_response
-                else:
-                    raise ValidationError('default value "{!r}" did not pass validation.'.format(self.default_val))
-            elif response:
-                valid_response, converted_response = self.process_value(response)
+                        raise ValidationError('default value "{!r}" did not pass validation.'.format(self.default_val))
+                elif response:
+                    valid_response, converted_response = self.process_value(response)
 
-                if valid_response:
-                    break
+                    if valid_response:
+                        break
+                    else:
+                        retries += 1
+                        # TODO: show validation error messages
+                        continue
                 else:
+                    # Fixing: a blank response for a required value with no default used to
+                    # match none of the branches above, so retries was never incremented and
+                    # the loop spun forever. Blank is just another rejected value here --
+                    # report it, count the retry, and re-prompt, so max_retries is reachable.
+                    self.error_callback(self.validator_error_fmt, response, 'cannot be blank')
                     retries += 1
-                    # TODO: show validation error messages
                     continue
-            else:
-                # Fixing: a blank response for a required value with no default used to
-                # match none of the branches above, so retries was never incremented and
-                # the loop spun forever. Blank is just another rejected value here --
-                # report it, count the retry, and re-prompt, so max_retries is reachable.
-                self.error_callback(self.validator_error_fmt, response, 'cannot be blank')
-                retries += 1
-                continue
-
-        if valid_response:
-            return converted_response
-        else:
-            raise MaxRetriesError('Maximum retries exceeded')
-
 
-    def process_value(self, value: Any) -> ProcessValueResponse:
+            if valid_response:
+                return converted_response
+            else:
+                raise MaxRetriesError('Maximum retries exceeded')
+        except GeneratorExit:
+            # Closed part way through, as when the input runs out: not a prompt answered or given up on.
+            finished = False
+            raise
+        finally:
+            if metrics is not None and finished:
+                with metrics._lock:
+                    metrics.retries[retries] += 1
+
+
+    def process_value(self, value: Any, error_callback: ErrorCallback | None = None) -> ProcessValueResponse:
         """
         :param value: the value to process
+        :param error_callback: (optional) the callback to report errors in this value to, in place of the
+            instance's ``error_callback``
 
         :return: Return a **ProcessValueResponse** namedtuple (valid, converted_value)
 
@@ -389,30 +679,433 @@ class GetInput(object):
         The **ProcessValueResponse** namedtuple has elements **valid** and **value**. If the value was
         successfully cleaned, converted and validated, **valid** is True and **value** is the converted and cleaned
         value. If not, **valid** is **False**, and **value** is **None**.
+
+        Giving the ``error_callback`` here rather than setting it on the instance is what lets one :class:`GetInput`
+        be shared between threads -- one per request in a web server, say -- with each collecting its own errors::
+
+            errors = []
+            valid, value = gi.process_value(field, error_callback=lambda fmt, v, content: errors.append(
+                fmt.format(value=v, error_content=content)))
         """
-        if self.cleaners:
-            cleaned_response = compose(value, self.cleaners)
+        return self._pipeline()(value, self.error_callback if error_callback is None else error_callback)
+
+
+    def process_values(self, values: Iterable[Any], chunk_size: int | None = None,
+                       error_callback: ErrorCallback | None = None) -> Iterator[Any]:
+        """
+        :param values: an iterable of values to process. It is read lazily, one chunk at a time,
+            so it can be a generator or a file of any length.
+        :param chunk_size: if **None** (the default) yield one **ProcessValueResponse** per value.
+            Otherwise yield lists of up to ``chunk_size`` responses, which suits callers that write
+            their results out in batches.
+        :param error_callback: (optional) the callback to report errors to, in place of the
+            instance's ``error_callback``
+
+        :return: a generator of **ProcessValueResponse** namedtuples ``(valid, value)``, one per
+            value and in the same order -- or of lists of them when ``chunk_size`` is set.
+
+        Run every value in ``values`` through the same cleaning, conversion and validation as
+        :meth:`GetInput.process_value`. This is the bulk form, for validating an import with the
+        rules used for keyboard input. Each failure is reported through ``error_callback`` exactly
+        as it would be for a single value.
+
+        The work that does not depend on the value -- sorting out whether ``cleaners`` is one
+        cleaner or a list, and turning ``validators`` into a list -- is done once per call rather
+        than once per value. Nothing is collected along the way, so memory use stays flat however
+        many values come through. :meth:`process_value_list` is the same thing returning a list.
+        """
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError('GetInput.process_values: chunk_size must be at least 1 -- got {!r}'.format(chunk_size))
+
+        pipeline = self._pipeline()
+        if error_callback is None:
+            error_callback = self.error_callback
+        value_iter = iter(values)
+
+        if chunk_size is None:
+            for value in value_iter:
+                yield pipeline(value, error_callback)
         else:
-            cleaned_response = value
+            while True:
+                chunk = list(itertools.islice(value_iter, chunk_size))
+                if not chunk:
+                    return
+                yield [pipeline(value, error_callback) for value in chunk]
+
+
+    def process_value_list(self, values: Iterable[Any],
+                           error_callback: ErrorCallback | None = None) -> list[ProcessValueResponse]:
+        """
+        :param values: an iterable of values to process
+        :param error_callback: (optional) the callback to report errors to, in place of the
+            instance's ``error_callback``
+
+        :return: a list of **ProcessValueResponse** namedtuples ``(valid, value)``, one per value and
+            in the same order.
+
+        :meth:`process_values` for when the whole result is wanted at once.
+        """
+        return list(self.process_values(values, error_callback=error_callback))
+
+
+    def process_values_parallel(self, values: Iterable[Any], workers: int | None = None,
+                                chunk_size: int = 256,
+                                error_callback: ErrorCallback | None = None) -> Generator[ProcessValueResponse, None, None]:
+        """
+        :param values: an iterable of values to process. It is read lazily, a few chunks ahead of the results
+            handed back, so it can be a generator or a file of any length.
+        :param workers: the number of worker processes to use. Defaults to the number of CPUs.
+        :param chunk_size: the number of values sent to a worker at a time (default **256**). Larger chunks cost less
+            to send; smaller ones share the work out more evenly.
+        :param error_callback: (optional) the callback to report errors to, in place of the instance's
+            ``error_callback``
+
+        :return: a generator of **ProcessValueResponse** namedtuples ``(valid, value)``, one per value and in the same
+            order, as from :meth:`process_values`. The workers are shut down when it finishes, or when it is closed
+            before then.
+
+        :meth:`process_values` spread over a pool of worker processes, for pipelines slow enough to keep a CPU busy --
+        a :class:`DateConvertor` parsing free-form dates, say, or a heavy :class:`SimpleValidator`. Each worker is
+        sent the cleaners, convertor and validators once, when it starts, and then chunks of values.
+
+        The workers do not call ``error_callback``. They collect the calls it would have had for each value, and they
+        are made here, in this process and in the order of the values, before that value's response is handed back.
+        So the messages come out just as they would from :meth:`process_values`, rather than interleaved from
+        several processes, and ``error_callback`` itself need not be sent anywhere. That is only this instance's
+        callback, though: a :class:`GetInput` inside the pipeline -- the ``elem_get_input`` of a
+        :class:`ListConvertor`, say -- keeps its own ``error_callback``, which is sent to the workers and called
+        there. Its messages (printed by :func:`print_error`, by default) come from the workers, as they happen,
+        and not in order with the rest.
+
+        The values and their results go between processes by `pickle <https://docs.python.org/3/library/pickle.html>`_,
+        and so do the cleaners, convertor and validators unless the workers are forked, so all of them should be
+        picklable -- functions and classes defined at the top level of a module, not lambdas or nested functions.
+        Starting the workers takes
+        a while (more on platforms that start them by spawning a new interpreter, such as Windows and macOS), so
+        this only pays for itself when there are many values, or the values are slow to process. Metrics
+        (see :func:`set_metrics`) are not recorded in the workers.
+        """
+        if workers is not None and workers < 1:
+            raise ValueError('GetInput.process_values_parallel: workers must be at least 1 -- got {!r}'.format(workers))
+        if chunk_size < 1:
+            raise ValueError('GetInput.process_values_parallel: chunk_size must be at least 1 -- got {!r}'.format(
+                chunk_size))
+
+        # Imported here rather than at the top, as it is only needed by programs that use a process pool.
+        import concurrent.futures
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        value_iter = iter(values)
+        chunks = iter(lambda: list(itertools.islice(value_iter, chunk_size)), [])
+        first_chunk = next(chunks, None)
+
+        if first_chunk is None:
+            return  # nothing to do, so no pool to start
+
+        pipeline_parts = (self.cleaners, self.convertor, self.validators, self.convertor_error_fmt,
+                          self.validator_error_fmt)
+        if error_callback is None:
+            error_callback = self.error_callback
+
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=_start_parallel_worker,
+                                                          initargs=(pipeline_parts,))
 
         try:
-            if self.convertor:
-                converted_response = self.convertor(cleaned_response, self.error_callback, self.convertor_error_fmt)
-            else:
-                converted_response = cleaned_response
-        except ConvertorError:
-            # Was a bare (False, None) tuple. It unpacks the same, but a caller reaching
-            # for .valid or .value -- which the docstring invites -- got AttributeError
-            # on exactly the failure path this branch exists to report.
-            return ProcessValueResponse(False, None)
+            # Keep two chunks per worker in flight: enough that no worker waits for its next chunk, and few enough
+            # that the values are not all read in and the results not all held before the first is handed back.
+            pending: collections.deque[Any] = collections.deque()
+
+            for chunk in itertools.chain((first_chunk,), chunks):
+                pending.append(executor.submit(_process_parallel_chunk, chunk))
 
-        valid_response = _in_all(converted_response, self.validators, self.error_callback, self.validator_error_fmt)
+                if len(pending) >= 2 * workers:
+                    yield from _parallel_results(pending.popleft().result(), error_callback)
+
+            while pending:
+                yield from _parallel_results(pending.popleft().result(), error_callback)
+        finally:
+            # Not a with block: leaving one waits for every chunk sent, so closing the generator early would wait
+            # for results nobody wants. The chunks not yet started are dropped instead.
+            executor.shutdown(cancel_futures=True)
+
+    def _cleaner_list(self) -> list[Any]:
+        """
+        Return ``cleaners`` as a list, resolving once what :func:`compose` would otherwise work out
+        on every call: a single callable is one cleaner, and anything else has to be iterable.
+        """
+        if not self.cleaners:
+            return []
+        elif callable(self.cleaners):
+            return [self.cleaners]
+        elif isinstance(self.cleaners, Iterable):
+            return list(self.cleaners)
+        else:
+            raise RuntimeError('funcs cannot be called')
 
-        if valid_response:
-            # return (True, converted_response)
-            return ProcessValueResponse(True, converted_response)
 
+    def _pipeline(self) -> Pipeline:
+        """
+        Return the compiled pipeline for this instance, building it on first use.
+
+        Assigning to ``cleaners``, ``convertor``, ``validators`` or either format string throws the
+        compiled pipeline away (see :meth:`__setattr__`), so the next call builds a fresh one. So does
+        turning metrics on or off with :func:`set_metrics`: the pipeline built records into the metrics
+        set when it was built, or into nothing. And so does changing the ``cleaners`` or ``validators``
+        list in place -- ``gi.validators.append(v)`` -- as the lists are compared with the ones the
+        pipeline was built from on every call.
+        """
+        compiled = self._compiled_pipeline
+        metrics = _metrics
+        stages = self._stages()
+
+        # Comparing the tuples compares their items by identity first, so for lists that have not changed this
+        # costs a pass over a few references.
+        if compiled is not None and compiled[1] is metrics and compiled[2] == stages:
+            return compiled[0]
+
+        # Threads asking at once may each build one. They are alike, so whichever is kept does not matter -- what
+        # matters is that the pipeline, its metrics and its stages are stored in a single assignment, never some
+        # of each.
+        if metrics is None:
+            pipeline = self._compile_pipeline(stages)
         else:
-            # return (False, None)
-            return ProcessValueResponse(False, None)
+            pipeline = self._compile_timed_pipeline(stages, metrics)
+
+        self._compiled_pipeline = (pipeline, metrics, stages)
+        return pipeline
+
+
+    def _stages(self) -> _Stages:
+        """
+        Return the cleaners and the validators as they are now, as tuples: what a pipeline is compiled from, and
+        what it is checked against to see whether either list has been changed in place since.
+        """
+        return tuple(self._cleaner_list()), tuple(put_in_a_list(self.validators))
+
+
+    def _commands(self) -> _CommandTrie:
+        """
+        Return the command trie for this instance, building it on first use. Assigning to ``commands`` throws it
+        away, as assigning to the pipeline's attributes does the compiled pipeline, and so does changing the
+        dictionary in place: it is compared with a copy of the one the trie was built from each time.
+        """
+        cached = self._command_trie
+        commands = self.commands
+
+        # Comparing the dictionaries compares the commands by identity first, so for a dictionary that has not
+        # changed this costs a pass over a few references -- once per line typed, not per character.
+        if cached is not None and cached[1] == commands:
+            return cached[0]
+
+        trie = _CommandTrie(commands)
+        self._command_trie = (trie, dict(commands))
+        return trie
+
+
+    def _compile_pipeline(self, stages: _Stages) -> Pipeline:
+        """
+        Build one function that cleans, converts and validates a value the way :func:`compose` and
+        ``_in_all`` do, with everything that does not depend on the value decided here instead of
+        on every call.
+
+        :param stages: the cleaners and validators to build it from, as from :meth:`_stages`
+
+        :return: a function ``pipeline(value, error_callback)`` returning a **ProcessValueResponse**
+
+        What is decided once: whether ``cleaners`` is one cleaner or a list, whether there is a
+        convertor, which validators are callables and which are bare values to compare for
+        equality (each bare value becomes a small function, so the loop below never has to ask),
+        and the two format strings. The error callback is left as an argument so that it can still
+        be changed after the pipeline is built.
+        """
+        cleaners, validators = stages[0], tuple(v if callable(v) else _equal_to(v) for v in stages[1])
+        convertor = self.convertor if self.convertor else None
+        convertor_fmt = self.convertor_error_fmt
+        validator_fmt = self.validator_error_fmt
+
+        def pipeline(value: Any, error_callback: ErrorCallback) -> ProcessValueResponse:
+            for cleaner in cleaners:
+                value = cleaner(value)
+
+            if convertor is not None:
+                try:
+                    value = convertor(value, error_callback, convertor_fmt)
+                except ConvertorError:
+                    return _INVALID_RESPONSE
+
+            for validator in validators:
+                # The first failure stops the run, as it does in _in_all: carrying on would report
+                # failures the user has not yet had a chance to fix.
+                if not validator(value, error_callback, validator_fmt):
+                    return _INVALID_RESPONSE
+
+            return ProcessValueResponse(True, value)
+
+        return pipeline
+
+
+    def _compile_timed_pipeline(self, stages: _Stages, metrics: PipelineMetrics) -> Pipeline:
+        """
+        :meth:`_compile_pipeline` recording into ``metrics`` as well: the time each stage takes, and the values that
+        fail conversion or validation. Kept apart so the pipeline built with no metrics set has none of it.
+
+        :return: a function ``pipeline(value, error_callback)`` returning a **ProcessValueResponse**
+        """
+        cleaners = tuple((cleaner, metrics.stage('cleaner', stage_name(cleaner))) for cleaner in stages[0])
+        convertor = self.convertor if self.convertor else None
+        convertor_times = metrics.stage('convertor', stage_name(convertor)) if convertor is not None else None
+        validators = tuple((validator, metrics.stage('validator', stage_name(validator)))
+                           for validator in (v if callable(v) else _equal_to(v) for v in stages[1]))
+        convertor_fmt = self.convertor_error_fmt
+        validator_fmt = self.validator_error_fmt
+        clock = time.perf_counter
+
+        # The counts are changed under the metrics' lock, as += is a read and a write another thread can come
+        # between. The histograms take their own.
+        lock = metrics._lock
+
+        def pipeline(value: Any, error_callback: ErrorCallback) -> ProcessValueResponse:
+            with lock:
+                metrics.values += 1
+
+            for cleaner, times in cleaners:
+                start = clock()
+                value = cleaner(value)
+                times.record(clock() - start)
+
+            if convertor is not None and convertor_times is not None:
+                start = clock()
+                try:
+                    value = convertor(value, error_callback, convertor_fmt)
+                except ConvertorError:
+                    with lock:
+                        metrics.conversion_failures += 1
+                    return _INVALID_RESPONSE
+                finally:
+                    convertor_times.record(clock() - start)
+
+            for validator, times in validators:
+                start = clock()
+                valid = validator(value, error_callback, validator_fmt)
+                times.record(clock() - start)
+
+                if not valid:
+                    with lock:
+                        metrics.validation_failures += 1
+                    return _INVALID_RESPONSE
+
+            return ProcessValueResponse(True, value)
+
+        return pipeline
+
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The compiled pipeline is a closure, which pickle cannot send -- and would be thrown away on arrival
+        # anyway, being built for this process's metrics. The command trie goes too. Both are rebuilt on first use.
+        state = self.__dict__.copy()
+        state.update(_compiled_pipeline=None, _command_trie=None)
+        return state
+
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+
+        if name in _PIPELINE_ATTRS:
+            object.__setattr__(self, '_compiled_pipeline', None)
+        elif name == 'commands':
+            object.__setattr__(self, '_command_trie', None)
+
+
+# The GetInput a process_values_parallel worker runs values through, set when the worker starts.
+_worker_get_input: GetInput | None = None
+
+
+def _start_parallel_worker(pipeline_parts: tuple[Any, ...]) -> None:
+    """
+    Internal function run in each :meth:`GetInput.process_values_parallel` worker process as it starts, to build the
+    :class:`GetInput` the worker processes values with from the parts of the pipeline it was sent.
+    """
+    global _worker_get_input
+
+    cleaners, convertor, validators, convertor_error_fmt, validator_error_fmt = pipeline_parts
+    _worker_get_input = GetInput(cleaners, convertor, validators, convertor_error_fmt=convertor_error_fmt,
+                                 validator_error_fmt=validator_error_fmt)
+
+
+def _process_parallel_chunk(chunk: list[Any]) -> list[tuple[bool, Any, list[tuple[str, Any, str]]]]:
+    """
+    Internal function run in a :meth:`GetInput.process_values_parallel` worker process to process a chunk of values.
+
+    :return: a list of ``(valid, value, errors)`` tuples, one per value in the chunk, where errors is a list of the
+        arguments of each call to the error callback made processing the value
+    """
+    if _worker_get_input is None:
+        raise RuntimeError('GetInput.process_values_parallel: the worker process was not started with the pipeline')
+
+    pipeline = _worker_get_input._pipeline()
+    errors: list[tuple[str, Any, str]] = []
+    results = []
+
+    def collect_error(fmt_str: str, error_value: Any, error_content: str) -> None:
+        errors.append((fmt_str, error_value, error_content))
+
+    for value in chunk:
+        valid, converted = pipeline(value, collect_error)
+        results.append((valid, converted, errors.copy()))
+        errors.clear()
+
+    return results
+
+
+def _parallel_results(results: list[tuple[bool, Any, list[tuple[str, Any, str]]]],
+                      error_callback: ErrorCallback) -> Iterator[ProcessValueResponse]:
+    """
+    Internal generator handing back the results of a chunk processed by :func:`_process_parallel_chunk`, making the
+    error callback calls collected for each value before its response.
+    """
+    for valid, value, errors in results:
+        for error in errors:
+            error_callback(*error)
+
+        yield ProcessValueResponse(valid, value)
+
+
+def _input_exhausted(prompt: str) -> InputExhaustedError:
+    """
+    Make the error for running out of input at ``prompt``. Raised in place of the bare **EOFError** `input`
+    raises, which said nothing about which prompt was still waiting for an answer.
+    """
+    return InputExhaustedError('GetInput.get_input: ran out of input at the prompt {!r}'.format(prompt))
+
+
+async def _show_async(text: str, input_source: AsyncInputSource | None) -> None:
+    """
+    Internal function to show text, followed by a newline, for a prompt read through an async input source: with
+    the source's ``write`` coroutine if it has one, as :class:`StreamInputSource` does, so that the text goes where
+    the prompts go. Otherwise it is printed.
+
+    :param text: the text to show
+    :param input_source: the input source the prompt is read through
+
+    :return: None
+    """
+    write = getattr(input_source, 'write', None)
+
+    if write is None:
+        print(text)
+    else:
+        await write(text)
+
+
+def _equal_to(target: Any) -> ValidatorFunc:
+    """
+    Wrap a bare validator value -- ``validators=16`` meaning "must equal 16" -- in a validator
+    function, so the compiled pipeline can call every validator the same way. Like ``_in_all`` it
+    reports nothing through the error callback.
+    """
+    def equal_to(value: Any, error_callback: ErrorCallback, validator_fmt_str: str) -> bool:
+        return value == target
 
+    return equal_to
@@ -19,12 +19,15 @@ from __future__ import annotations
 
 import sys
 import string
-from collections.abc import Iterable, Sequence
+import inspect
+from abc import ABCMeta, abstractmethod
+from collections import Counter, OrderedDict
+from collections.abc import Callable, Iterable, Sequence
 from typing import Any, NoReturn
 
 import prettytable as pt  # note: pt.TableStyle is prettytable's style enum, not our TableStyle class below
 
-from cooked_input import get_input
+from cooked_input import get_input, get_input_async
 # GetInputCommand is not used in the code below, only in the ``CommandsArg`` annotation -- but
 # that alias leaves the class name quoted (see ``_typing``), and a quoted forward reference is
 # resolved in the module that *uses* the alias. Without the name here, sphinx_autodoc_typehints
@@ -33,7 +36,8 @@ from cooked_input import GetInputCommand  # noqa: F401
 from cooked_input import GetInputInterrupt, RefreshScreenInterrupt
 from cooked_input import PageUpRequest, PageDownRequest, FirstPageRequest, LastPageRequest, UpOneRowRequest, DownOneRowRequest
 
-from ._typing import CommandsArg, ErrorCallback, ItemFilter, RowAction
+from .get_input import in_batch_mode, _show_async
+from ._typing import AsyncInputSource, CommandsArg, ErrorCallback, ItemFilter, RowAction
 from .error_callbacks import print_error, DEFAULT_CONVERTOR_ERROR, DEFAULT_VALIDATOR_ERROR
 from .input_utils import put_in_a_list, isstring
 from .cleaners import Cleaner, CapitalizationCleaner, StripCleaner, ChoiceCleaner
@@ -55,12 +59,39 @@ TABLE_RETURN_FIRST_VAL = 'first_value'
 TABLE_RETURN_ROW = 'row'
 TABLE_RETURN_TABLE_ITEM = 'table_item'
 
+TABLE_REFRESH_AUTO = 'auto'
+
+TABLE_WIDTHS_PAGE = 'page'
+TABLE_WIDTHS_TABLE = 'table'
+
 RULE_FRAME = pt.HRuleStyle.FRAME
 RULE_HEADER = pt.HRuleStyle.HEADER
 RULE_ALL = pt.HRuleStyle.ALL
 RULE_NONE = pt.HRuleStyle.NONE
 
 
+# What the paging commands raise out of a table's prompt. See Table._page_request.
+_PAGE_REQUESTS = (FirstPageRequest, LastPageRequest, PageUpRequest, PageDownRequest, UpOneRowRequest,
+                  DownOneRowRequest, RefreshScreenInterrupt)
+
+# How many laid out pages a Table keeps, to show again without laying them out again. See Table._render.
+_PAGE_CACHE_SIZE = 16
+
+# The prettytable options a page's layout depends on, besides the rows and columns shown: those set from the
+# TableStyle, and any a program sets on Table.table itself -- the alignment and widths of the columns, say. Their
+# values are part of the key a laid out page is kept under (see _layout_key.)
+_LAYOUT_OPTIONS = ('title', 'header', 'header_style', 'use_header_width', 'border', 'preserve_internal_border',
+                   'hrules', 'vrules', 'align', 'valign', 'min_width', 'max_width', 'min_table_width',
+                   'max_table_width', 'padding_width', 'left_padding_width', 'right_padding_width', 'int_format',
+                   'float_format', 'custom_format', 'none_format', 'vertical_char', 'horizontal_char', 'junction_char',
+                   'break_on_hyphens', 'sortby', 'sort_key', 'reversesort')
+
+
+# The Table attributes its rows are derived from. Assigning any of them makes a table with
+# refresh=TABLE_REFRESH_AUTO derive its rows again on the next prompt. See Table.__setattr__.
+_TABLE_REFRESH_ATTRS = frozenset({'_table_items', 'action_dict', 'item_filter', 'add_exit', 'windowed'})
+
+
 def _as_vrule(rule: pt.HRuleStyle | pt.VRuleStyle) -> pt.VRuleStyle:
     """
     Translate a ``RULE_*`` constant into the vertical rule style prettytable expects.
@@ -96,6 +127,27 @@ def _as_vrule(rule: pt.HRuleStyle | pt.VRuleStyle) -> pt.VRuleStyle:
                          'and RULE_HEADER for hrules.'.format(hrule.name)) from None
 
 
+def _text_width(value: Any) -> int:
+    """
+    Internal function to measure how wide a value's column needs to be: the longest line of it, as a string.
+
+    prettytable measures it the same way, but counts characters that print double width (and so on) as
+    they print. The widths worked out from this are only ever minimums, so a page holding such a value
+    widens its column as it always did.
+    """
+    return max(len(line) for line in str(value).split('\n'))
+
+
+def _layout_key(table: pt.PrettyTable) -> tuple[Any, ...]:
+    """
+    Internal function to take the values of the options in ``_LAYOUT_OPTIONS`` from a prettytable, as part of the key
+    a page laid out with them is kept under. The ones that are dictionaries (by column) are taken as tuples of their
+    items.
+    """
+    values = (getattr(table, name) for name in _LAYOUT_OPTIONS)
+    return tuple(tuple(value.items()) if isinstance(value, dict) else value for value in values)
+
+
 def _as_row_action(action: str | RowAction | None) -> RowAction | None:
     """
     Return ``action`` if it is a row action worth calling, otherwise **None**.
@@ -257,6 +309,7 @@ class TableStyle():
     :param vrules: whether to draw vertical lines between rows. See below for allowed RULE values.
     :param rows_per_page: The maximum number of rows to display in the table. Used for paginated tables (None
         for no maximum).
+    :param col_widths: how wide to make the columns. See below for allowed values.
 
     ``hrules`` and ``vrules`` can use the following ``RULE`` values for the rows and columns respectively:
 
@@ -274,16 +327,39 @@ class TableStyle():
 
     ``RULE_HEADER`` is the one exception: a rule around the header has no vertical equivalent, so
     it is legal for ``hrules`` only. Passing it as ``vrules`` raises a **ValueError**.
+
+    ``col_widths`` can be one of the following:
+
+        +--------------------+-------------------------------------------------------------------------------+
+        | value              | column widths                                                                 |
+        +====================+===============================================================================+
+        | TABLE_WIDTHS_PAGE  | fit the rows on the page shown (default), so columns can change width from    |
+        |                    | page to page.                                                                 |
+        +--------------------+-------------------------------------------------------------------------------+
+        | TABLE_WIDTHS_TABLE | fit the widest value in each column of the whole table, so columns keep their |
+        |                    | widths as the table is paged. Not for windowed tables or data sources.        |
+        +--------------------+-------------------------------------------------------------------------------+
+        | a list of widths   | fixed widths, one for each column in ``col_names`` (**None** to fit the page  |
+        |                    | for that column.) Longer values are wrapped.                                  |
+        +--------------------+-------------------------------------------------------------------------------+
+
+    Fixed widths leave the tag column to fit the page.
+
+    Working out the widths for a page only looks at the rows on it, so with ``TABLE_WIDTHS_PAGE`` or fixed widths the
+    time it takes does not grow with the size of the table. :class:`Table` keeps the ``TABLE_WIDTHS_TABLE`` widths up
+    to date as it derives rows, rather than measuring every row each time a page is shown.
     """
     def __init__(self, show_cols: bool = True, show_border: bool = True,
                  hrules: pt.HRuleStyle = RULE_FRAME,
                  vrules: pt.HRuleStyle | pt.VRuleStyle = RULE_ALL,
-                 rows_per_page: int | None = 20) -> None:
+                 rows_per_page: int | None = 20,
+                 col_widths: str | Sequence[int | None] = TABLE_WIDTHS_PAGE) -> None:
         self.show_cols = show_cols
         self.show_border = show_border
         self.hrules = hrules
         self.vrules = vrules
         self.rows_per_page = rows_per_page
+        self.col_widths = col_widths
         #TODO -- add:   header fmt str, footer fmt str, alignment, tag_alignment.
 
     @property
@@ -301,6 +377,26 @@ class TableStyle():
     def vrules(self, rule: pt.HRuleStyle | pt.VRuleStyle) -> None:
         self._vrules = _as_vrule(rule)
 
+    @property
+    def col_widths(self) -> str | list[int | None]:
+        """
+        How wide to make the columns: ``TABLE_WIDTHS_PAGE``, ``TABLE_WIDTHS_TABLE`` or a list of fixed widths.
+
+        Checked here, where it was written, like ``vrules``.
+        """
+        return self._col_widths
+
+    @col_widths.setter
+    def col_widths(self, col_widths: str | Sequence[int | None]) -> None:
+        if col_widths in (TABLE_WIDTHS_PAGE, TABLE_WIDTHS_TABLE):
+            self._col_widths: str | list[int | None] = col_widths
+        elif isinstance(col_widths, str) or not isinstance(col_widths, Sequence) or not all(
+                w is None or (isinstance(w, int) and w > 0) for w in col_widths):
+            raise ValueError('TableStyle: col_widths must be TABLE_WIDTHS_PAGE, TABLE_WIDTHS_TABLE or a list of '
+                             'positive widths (or None) -- got {!r}'.format(col_widths))
+        else:
+            self._col_widths = list(col_widths)
+
 
 class TableItem(object):
     """
@@ -346,7 +442,13 @@ class TableItem(object):
 
             * **row** (TableItem) -- The ``TableItem`` instance selected (i.e. this table item)
             * **action_dict** (Dict) --  The parent table's ``action_dict``.
+
+    A TableItem has ``__slots__``, so it has no ``__dict__`` and no attributes other than those above. A table
+    holds two of them for each row -- the table item it was given and the row derived from it -- and without a
+    ``__dict__`` each is around a third smaller. Keep any other data for a row in ``item_data``.
     """
+    __slots__ = ('values', 'tag', 'action', 'item_data', 'hidden', 'enabled')
+
     # action includes None because _as_row_action -- the only thing that consumes it -- is
     # annotated for None and handles it, returning "nothing to call". The narrower type here
     # rejected TableItem(..., None), which the examples have always passed and which works.
@@ -367,13 +469,188 @@ class TableItem(object):
                                                     self.tag, self.action, self.item_data, self.hidden, self.enabled)
 
 
+def _table_item(values: list[Any], tag: Any, action: str | RowAction | None, item_data: dict[str, Any] | None,
+                hidden: bool, enabled: bool) -> TableItem:
+    """
+    Make a :class:`TableItem` holding the ``values`` list itself. :class:`TableItem` copies the values it is given,
+    which for a list just built for the item is a second list made for nothing.
+    """
+    item = TableItem.__new__(TableItem)
+    item.values = values
+    item.tag = tag
+    item.action = action
+    item.item_data = item_data
+    item.hidden = hidden
+    item.enabled = enabled
+    return item
+
+
+class TableDataSource(metaclass=ABCMeta):
+    """
+    Abstract base class for the rows of a :class:`Table` that are fetched a page at a time rather than held in a
+    list. Subclasses must implement :meth:`count` and :meth:`fetch`.
+
+    A table built from a list of table items has every row in memory, and formats them all each time it is
+    refreshed. A table built from a data source asks it how many rows there are, and fetches only the rows on the
+    page being shown -- again when the table is refreshed, and whenever it is paged. Memory stays proportional to
+    ``rows_per_page`` however many rows the source has. See :class:`DBAPITableSource` for a source that pages a
+    database query.
+    """
+    @abstractmethod
+    def count(self) -> int:
+        """
+        :return: the number of rows in the source
+        """
+        pass
+
+    @abstractmethod
+    def fetch(self, offset: int, limit: int) -> list[TableItem]:
+        """
+        :param offset: the position of the first row to fetch, counting from 0
+        :param limit: the maximum number of rows to fetch
+
+        :return: the table items for up to ``limit`` rows starting at row ``offset``. Fewer, or none, past the end
+            of the source.
+        """
+        pass
+
+
+class DBAPITableSource(TableDataSource):
+    """
+    A :class:`TableDataSource` for the results of a query on a DB-API 2.0 (`PEP 249
+    <https://peps.python.org/pep-0249/>`_) database connection, such as one from ``sqlite3.connect``.
+
+    :param connection: the database connection
+    :param query: the ``SELECT`` statement for the rows of the table. Give it an ``ORDER BY``, or the rows may not
+        come back in the same order from one page to the next. It should not have a ``LIMIT`` of its own.
+    :param params: the parameters for ``query``, in the database module's ``paramstyle``
+    :param item_factory: makes the :class:`TableItem` for a result row. Defaults to one with the row's values
+        as its column values.
+
+    Rows are counted with ``SELECT COUNT(*) FROM (query)`` and fetched a page at a time with ``LIMIT`` and
+    ``OFFSET`` added to ``query``. For example, a menu over every row of a large table::
+
+        conn = sqlite3.connect('parts.db')
+        source = DBAPITableSource(conn, 'SELECT name, price FROM parts ORDER BY name',
+                                  item_factory=lambda row: TableItem(row[1:], tag=row[0]))
+        part = Table(source, col_names=['Price'], tag_str='Name').get_table_choice()
+    """
+    def __init__(self, connection: Any, query: str, params: Sequence[Any] | dict[str, Any] = (),
+                 item_factory: Callable[[Any], TableItem] | None = None) -> None:
+        self.connection = connection
+        self.query = query.strip().rstrip(';')
+        self.params = params
+        self.item_factory = item_factory
+
+    def _execute(self, sql: str) -> list[Any]:
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(sql, self.params)
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+
+    def count(self) -> int:
+        return self._execute('SELECT COUNT(*) FROM ({}) AS table_source'.format(self.query))[0][0]
+
+    def fetch(self, offset: int, limit: int) -> list[TableItem]:
+        # The page bounds are put in the SQL text rather than passed as parameters, as the
+        # placeholder to use differs from one database module to the next (the paramstyle), and
+        # the query's own parameters are already written in it. Formatting them with :d means only
+        # integers can get there.
+        rows = self._execute('{} LIMIT {:d} OFFSET {:d}'.format(self.query, limit, offset))
+
+        if self.item_factory is None:
+            return [TableItem(list(row)) for row in rows]
+        else:
+            return [self.item_factory(row) for row in rows]
+
+    def __repr__(self) -> str:
+        return 'DBAPITableSource(query={!r}, params={!r})'.format(self.query, self.params)
+
+
+class ColumnStore(TableDataSource):
+    """
+    A :class:`TableDataSource` holding the values of a table by column rather than by row.
+
+    :param columns: the table's columns, each a sequence of values -- a list, a tuple, or an ``array.array`` -- all
+        of the same length
+    :param tags: the tag for each row. If **None** (default) the rows are numbered by position, as in any table.
+    :param action: the action for every row. See :class:`TableItem`.
+
+    A :class:`TableItem` for each row of a table costs an object and a list on top of the values themselves, and the
+    table derives a second one for each row when it is refreshed. A column store holds each column in one sequence,
+    which costs a pointer per value for a list -- or nothing, for numbers in an ``array.array`` -- and makes table
+    items only for the rows on the page shown, when it is fetched. For example, a million-row table::
+
+        names = [...]
+        weights = array.array('d', [...])
+        Table(ColumnStore([names, weights]), col_names=['Name', 'Weight']).get_table_choice()
+
+    The columns are read as they are, so rows appended to them show up when the table is next refreshed. Call
+    :meth:`Table.invalidate` after changing them if the table was made with ``refresh=TABLE_REFRESH_AUTO``.
+    """
+    def __init__(self, columns: Sequence[Sequence[Any]], tags: Sequence[Any] | None = None,
+                 action: str | RowAction | None = TABLE_ITEM_DEFAULT) -> None:
+        self.columns = list(columns)
+        self.tags = tags
+        self.action = action
+
+        lengths = {len(column) for column in self.columns}
+        if tags is not None:
+            lengths.add(len(tags))
+
+        if len(lengths) > 1:
+            raise ValueError('ColumnStore: the columns (and tags) must all be the same length -- got lengths '
+                             '{}'.format([len(column) for column in self.columns]
+                                         + ([] if tags is None else [len(tags)])))
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence[Any]], tags: Sequence[Any] | None = None,
+                  action: str | RowAction | None = TABLE_ITEM_DEFAULT) -> ColumnStore:
+        """
+        Make a column store from rows of values, such as the result of a database query, in one pass.
+
+        :param rows: the rows, each a sequence of the values for the row's columns
+        :param tags: the tag for each row. See :class:`ColumnStore`.
+        :param action: the action for every row. See :class:`ColumnStore`.
+
+        :return: the column store
+        """
+        columns: list[list[Any]] = []
+
+        for row in rows:
+            if not columns:
+                columns = [[] for _ in row]
+
+            for column, value in zip(columns, row, strict=True):
+                column.append(value)
+
+        return cls(columns, tags, action)
+
+    def count(self) -> int:
+        return len(self.columns[0]) if self.columns else 0
+
+    def fetch(self, offset: int, limit: int) -> list[TableItem]:
+        columns = self.columns
+        tags = self.tags
+        end = min(offset + limit, self.count())
+
+        return [_table_item([column[i] for column in columns], None if tags is None else tags[i], self.action,
+                            None, False, True) for i in range(offset, end)]
+
+    def __repr__(self) -> str:
+        return 'ColumnStore(columns={}, rows={})'.format(len(self.columns), self.count())
+
+
 class Table(object):
     """
     The Table class is used to display a table of data. Each row of data has the same number of
     columns (specified by the ``col_name`` parameter) as is represented by a :class:`TableItem` instance. Tables are
     often used for menus.
 
-    :param rows: The rows of the table. Each row is a :class:`TableItem` instance.
+    :param rows: The rows of the table. Each row is a :class:`TableItem` instance. Can also be a
+        :class:`TableDataSource`, to fetch the rows a page at a time. See below.
     :param col_names: An optional list of the column names (strings) for the table. If no list is given the number
         of columns is determined by the length of the data list for the first row (:class:`TableItem`).
     :param title: An optional title for the table.
@@ -395,13 +672,17 @@ class Table(object):
         value the action to take for the command. See :class:`GetInput` and :class:`GetInputCommand`
         for further details
     :param refresh: refresh table items each time the table is shown (**True** - default), or just when
-        created (**False**). Useful for dynamic tables
+        created (**False**). Useful for dynamic tables. ``TABLE_REFRESH_AUTO`` refreshes only what has changed
+        since the last time the table was shown -- see below.
     :param item_filter: a function used to determine which table items to display. Displays all items if
         **None**. See below for more details.
     :param header: a format string to print before the table, can use any value from ``action_dict`` as
         well as pagination information
     :param footer: a format string to print after the table, can use any values from ``action_dict`` as
         well as pagination information
+    :param windowed: if **True**, only the rows on the page being shown are formatted and laid out, each time the
+        page is drawn. If **False** (default) every row is formatted and handed to prettytable whenever the table
+        is refreshed. See below for more details.
 
     Every parameter from ``required`` onwards is keyword-only. They used to be collected from a
     ``**options`` bag, which silently ignored anything it did not recognise -- so a misspelled option,
@@ -471,8 +752,57 @@ class Table(object):
                 TableItem('Add a new user', action=user_add_action, item_data=admin_only)
                 TableItem('list users', action=user_list_action) ]
             menu = Table(menu_items=rows, action_dict=action_dict, item_filter=user_role_filter)
+
+    windowed tables:
+
+        A table normally formats every string in every row (substituting values from ``action_dict``) and adds every
+        row to its prettytable each time it is refreshed -- by default, every time it prompts -- though only
+        ``rows_per_page`` rows are ever on the screen. For a table of many thousands of rows that is most of the time
+        spent on each prompt. With ``windowed=True`` a refresh only works out which rows are in the table; the rows
+        on the page being shown are formatted when the page is drawn, and a chosen row when it is returned. The table
+        looks the same either way. Two things differ: formatting uses ``action_dict`` as it is when a row is shown
+        rather than when the table was refreshed, and the ``table`` attribute (the prettytable) holds no rows between
+        draws.
+
+    refreshing only what changed:
+
+        ``refresh=True`` derives every row again -- runs the item filter, formats the values, assigns tags -- and rebuilds
+        the choice list each time the table prompts, which in a menu is after every action. That is the only safe
+        choice when an item filter depends on things the table cannot see, such as the time of day or a database.
+        With ``refresh=TABLE_REFRESH_AUTO`` the table keeps what it derived and does it again only when something it
+        can see has changed:
+
+            * a different ``action_dict`` value for a key (a value rebound, not one changed in place), or a key
+              added or removed. This refreshes every row.
+            * a new value assigned to the table's ``action_dict``, ``item_filter``, ``add_exit`` or ``windowed``.
+              This refreshes every row.
+            * a call to :meth:`invalidate`. This refreshes every row.
+            * a call to :meth:`mark_dirty` for the table items that changed. Only those rows are refreshed, unless
+              the item filter now hides a row it showed or shows one it hid, which renumbers the rows after it.
+
+        Anything else -- a table item changed in place, or an item filter whose answer depends on something outside
+        the table -- needs a :meth:`mark_dirty` or :meth:`invalidate` call, or it may not show until the next
+        refresh. That includes an action that changes the row it was called with: the row is the table's copy, so
+        change the :class:`TableItem` the table was built from and mark it dirty.
+
+    tables from a data source:
+
+        ``rows`` can be a :class:`TableDataSource` instead of a list of table items -- for instance a
+        :class:`DBAPITableSource` over a database query. The table then holds only the page being shown: refreshing
+        it counts the rows in the source and fetches that page, and paging fetches the new one. A few things follow
+        from having one page at a time:
+
+            * the rows that can be chosen are the ones on the page shown, and :meth:`get_row` finds only those.
+            * rows without a tag are numbered by their position in the source, so a row's tag is the same on every
+              page. The item filter is run on the rows of each page as it is fetched, and a row it hides leaves a gap
+              in the numbering (and the page) rather than moving the rows after it up.
+            * an exit or return row (``add_exit``) is on every page.
+            * ``windowed`` has no effect, as only the one page is ever formatted.
+            * with ``refresh=False`` or ``refresh=TABLE_REFRESH_AUTO`` the rows are not counted again until the
+              table is refreshed, or :meth:`invalidate` is called, and :meth:`mark_dirty` works for the rows on the
+              page shown. Paging still fetches the page from the source.
     """
-    def __init__(self, rows: Iterable[TableItem], col_names: str | Sequence[str] | None = None,
+    def __init__(self, rows: Iterable[TableItem] | TableDataSource, col_names: str | Sequence[str] | None = None,
                  title: str | None = None, prompt: str | None = None, default_choice: Any = None,
                  default_str: str | None = None, default_action: str | RowAction | None = None,
                  style: TableStyle | None = None, *,
@@ -482,10 +812,26 @@ class Table(object):
                  action_dict: dict[str, Any] | None = None,
                  case_sensitive: bool = False,
                  commands: CommandsArg = None,
-                 refresh: bool = True,
+                 refresh: bool | str = True,
                  item_filter: ItemFilter | bool | None = None,
                  header: str | None = None,
-                 footer: str | None = None) -> None:
+                 footer: str | None = None,
+                 windowed: bool = False) -> None:
+
+        # What refresh=TABLE_REFRESH_AUTO compares against to decide whether the rows need deriving
+        # again. _version goes up whenever an attribute in _TABLE_REFRESH_ATTRS is assigned (see
+        # __setattr__) or invalidate() is called; refresh_items records the version it derived the rows
+        # at, and what action_dict held then.
+        self._version = 0
+        self._refreshed_version: int | None = None
+        self._action_dict_snapshot: dict[str, Any] = {}
+        self._dirty_rows: list[TableItem] = []
+        self._refreshed_items: list[TableItem] = []    # the table items the rows were last derived from
+        self._refreshed_filter: ItemFilter | bool | None = None
+        self._row_sources: list[TableItem] = []    # the table item each row (bar an exit row) came from
+        self._source_index: dict[int, int | None] | None = None
+        self._prepped: tuple[dict[str, int], list[Cleaner], ChoiceConvertor, ChoiceValidator] | None = None
+        self._source_add_exit: bool | str = False    # the add_exit the page of a data source table is derived with
 
         # Fixing: TABLE_ADD_NONE was missing from this set, so the one value this method
         # assigns as its own default was the one value a caller could not pass -- it went
@@ -508,6 +854,7 @@ class Table(object):
         self.item_filter = item_filter
         self.header = header
         self.footer = footer
+        self.windowed = windowed
 
         if prompt is None:
             self.prompt = 'Choose a table item'
@@ -535,12 +882,35 @@ class Table(object):
             self.style = style
 
         self.rows_per_page = self.style.rows_per_page
-        self._table_items = put_in_a_list(rows)  # the original, raw table items for the table
+
+        # A table from a data source holds the rows of one page, fetched by _load_page, and _rows is
+        # just that page. _page_start is where the page held starts -- 0 to begin with, so that the
+        # show_rows(0) below does not fetch rows before there is a count of them.
+        if isinstance(rows, TableDataSource):
+            self._source: TableDataSource | None = rows
+            self._table_items = []
+        else:
+            self._source = None
+            self._table_items = put_in_a_list(rows)  # the original, raw table items for the table
+
+        self._source_count = 0
+        self._page_start: int | None = 0
         self._rows = []  # the expanded, refreshed table items for the table used to create the pretty table
+        # Where the first row with each tag is in _rows, built when a tag is first looked up (see _find_tag)
+        # and thrown away whenever the rows are derived again. _unhashable_tag_rows are the rows whose tags
+        # could not go in it.
+        self._tag_index: dict[Any, int] | None = None
+        self._unhashable_tag_rows: list[int] = []
+        self._visible_rows: list[TableItem] = []  # the rows of _rows not hidden (windowed tables only)
+        # Pages already laid out by _render, most recently used last, and what each was laid out from.
+        self._page_cache: OrderedDict[tuple[Any, ...], tuple[tuple[tuple[str, Any], ...], str]] = OrderedDict()
         self.table = pt.PrettyTable()  # the pretty table to display
 
         if col_names is None:
-            num_cols = len(self._table_items[0].values)
+            if self._source is not None:
+                num_cols = len(self._source.fetch(0, 1)[0].values)
+            else:
+                num_cols = len(self._table_items[0].values)
             field_names = ['col {}'.format(i) for i in range(1, num_cols+1)]
         elif isinstance(col_names, str):
             # A single string is shorthand for whitespace-separated column names. This tested
@@ -568,35 +938,160 @@ class Table(object):
         self.table.hrules = self.style.hrules
         self.table.vrules = self.style.vrules
 
+        # Column widths -- see TableStyle. For TABLE_WIDTHS_TABLE, _width_counts holds how many of the rows shown
+        # have values of each width, for each column of the prettytable, so that when a row is derived again the
+        # widths can change without measuring all of the other rows again (see _count_widths.)
+        self._width_counts: list[Counter[int]] | None = None
+        col_widths = self.style.col_widths
+
+        if isinstance(col_widths, list):
+            if len(col_widths) != len(field_names):
+                raise ValueError('Table: col_widths needs a width for each of the {} columns -- got {!r}'.format(
+                    len(field_names), col_widths))
+
+            fixed_widths = {name: width for name, width in zip(field_names, col_widths) if width is not None}
+            self.table.min_width = fixed_widths
+            self.table.max_width = fixed_widths
+        elif col_widths == TABLE_WIDTHS_TABLE:
+            # A windowed table, and one from a data source, only ever has the values on the page in hand.
+            if windowed or self._source is not None:
+                raise ValueError('Table: col_widths=TABLE_WIDTHS_TABLE cannot be used with a windowed table or a '
+                                 'data source, which only format the rows on the page shown')
+
+            self._width_counts = [Counter() for _ in self.table.field_names]
+
         if self.refresh is False:   # set up rows to start as won't be refreshed each time called
-            self.refresh_items(rows=rows, add_exit=True, item_filter=self.item_filter)
+            self.refresh_items(rows=self._table_items, add_exit=True, item_filter=self.item_filter)
 
         self.show_rows(0)
 
 
     def __repr__(self) -> str:
-        return 'Table(rows={}, col_name={}, title={}, prompt={}, default_choice={}, action_dict={})'.format(self._table_items,
+        rows = self._table_items if self._source is None else self._source
+        return 'Table(rows={}, col_name={}, title={}, prompt={}, default_choice={}, action_dict={})'.format(rows,
                                             self.field_names, self.title, self.prompt, self.default_choice, self.action_dict)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+
+        if name in _TABLE_REFRESH_ATTRS:
+            object.__setattr__(self, '_version', getattr(self, '_version', 0) + 1)
+
+    def invalidate(self) -> None:
+        """
+        Have a table with ``refresh=TABLE_REFRESH_AUTO`` derive all of its rows again the next time it is shown. Use
+        this after a change the table cannot see, such as to the data an item filter looks at. See :class:`Table`.
+
+        :return: None
+        """
+        self._version += 1
+
+    def mark_dirty(self, rows: TableItem | Iterable[TableItem]) -> None:
+        """
+        Have a table with ``refresh=TABLE_REFRESH_AUTO`` derive the rows for some of its table items again the next
+        time it is shown. Use this after changing a :class:`TableItem` in place. See :class:`Table`.
+
+        :param rows: the changed table item, or a list of them. These are the items the table was built from, not
+            rows it handed back.
+
+        :return: None
+
+        Only the rows for these items are derived again, unless the item filter now hides one it showed, or shows one
+        it hid. Then every row is, as the rows after it are renumbered. An item that is not one of the table's is
+        treated the same way.
+        """
+        if isinstance(rows, TableItem):
+            self._dirty_rows.append(rows)
+        else:
+            self._dirty_rows.extend(rows)
+
     def get_num_rows(self) -> int:
         """
         Get the number of rows in the table.
 
-        :return: the number of rows in the table
+        :return: the number of rows in the table. For a table from a data source, the number of rows in the source
+            when the table was last refreshed.
         """
+        if self._source is not None:
+            return self._source_count
+
         return len(self._rows)
 
+    def _find_tag(self, tag: Any) -> int | None:
+        """
+        Internal function to find the first row with a tag.
+
+        :param tag: the tag to look for
+
+        :return: the row's index in ``_rows``, or **None** if no row has the tag
+
+        This was a scan of every row comparing tags, which made an action that looks up other rows by tag a scan of
+        the table each time. The rows are now indexed by tag the first time one is looked up after they are derived.
+        A tag that cannot be hashed (a list, say) cannot be indexed, so a row with one is kept aside and compared the
+        old way, as is a lookup for one.
+        """
+        if self._tag_index is None:
+            index: dict[Any, int] = {}
+            unhashable_rows = []
+
+            for i, row in enumerate(self._rows):
+                try:
+                    index.setdefault(row.tag, i)     # setdefault: the first row with a tag is the one found
+                except TypeError:
+                    unhashable_rows.append(i)
+
+            self._tag_index = index
+            self._unhashable_tag_rows = unhashable_rows
+
+        try:
+            found = self._tag_index.get(tag)
+        except TypeError:
+            return next((i for i, row in enumerate(self._rows) if row.tag == tag), None)
+
+        # An unhashable tag can still equal a hashable one, if its class says so. First match wins, so
+        # only rows before the one found need comparing -- and there are none of these as a rule.
+        for i in self._unhashable_tag_rows:
+            if found is not None and i > found:
+                break
+            elif self._rows[i].tag == tag:
+                return i
+
+        return found
+
     def get_row(self, tag: Any) -> TableItem:
         """
         Get the first row matching the specified tag.
 
-        :param tag: the tag to search for
+        :param tag: the tag to search for. For a table from a data source, only the rows on the page shown are
+            searched.
         :return: the first row containing the tag. Raises a **ValueError** exception if the tag is not found
         """
-        for row in self._rows:
-            if row.tag == tag:
-                return row
-        raise ValueError('Table.get_row: tag ({}) not in the table'.format(tag))
+        i = self._find_tag(tag)
+
+        if i is None:
+            raise ValueError('Table.get_row: tag ({}) not in the table'.format(tag))
+
+        return self._formatted_row(self._rows[i])
+
+    def get_rows(self, tags: Iterable[Any]) -> list[TableItem]:
+        """
+        Get the first row matching each of the specified tags.
+
+        :param tags: the tags to search for
+        :return: a list of the rows, in the same order as ``tags``. Raises a **ValueError** exception if a tag is not
+            found
+        """
+        rows = []
+
+        for tag in tags:
+            i = self._find_tag(tag)
+
+            if i is None:
+                raise ValueError('Table.get_rows: tag ({}) not in the table'.format(tag))
+
+            rows.append(self._formatted_row(self._rows[i]))
+
+        return rows
 
     def get_action(self, tag: Any) -> str | RowAction | None:
         """
@@ -607,8 +1102,12 @@ class Table(object):
             one of the ``TABLE_ITEM_*`` sentinel strings, or **None** for a row that carries no
             action of its own. Raises a **ValueError** exception if the tag is not found
         """
-        row = self.get_row(tag)
-        return row.action
+        i = self._find_tag(tag)
+
+        if i is None:
+            raise ValueError('Table.get_action: tag ({}) not in the table'.format(tag))
+
+        return self._rows[i].action     # not get_row, which would format the row's values to no purpose
 
     def do_action(self, row: TableItem) -> Any:
         """
@@ -665,6 +1164,14 @@ class Table(object):
 
         return self.rows_per_page
 
+    @property
+    def _formats_on_draw(self) -> bool:
+        """
+        Whether the rows are formatted as the page is drawn (a windowed table) rather than when they are derived.
+        A table from a data source only ever derives the one page, so it is never windowed.
+        """
+        return self.windowed and self._source is None
+
     def show_rows(self, start_row: int) -> None:
         """
         Set the starting row for to display in the table. Last row shown is the ``start_row`` plus the number of
@@ -696,6 +1203,9 @@ class Table(object):
 
         self.table.end = table_end
 
+        if self._source is not None and self.table.start != self._page_start:
+            self._load_page()
+
     def page_up(self) -> None:
         """
         Display the previous page of the table (if available)
@@ -703,7 +1213,7 @@ class Table(object):
         :return: None
         """
         self.show_rows(self.table.start - self._page_size)
-        print(self.table.get_string())
+        self._show_page()
 
     def page_down(self) -> None:
         """
@@ -712,7 +1222,7 @@ class Table(object):
         :return: None
         """
         self.show_rows(self.table.start + self._page_size)
-        print(self.table.get_string())
+        self._show_page()
 
     def goto_home(self) -> None:
         """
@@ -721,7 +1231,7 @@ class Table(object):
         :return: None
         """
         self.show_rows(0)
-        print(self.table.get_string())
+        self._show_page()
 
     def goto_end(self) -> None:
         """
@@ -730,7 +1240,7 @@ class Table(object):
         :return: None
         """
         self.show_rows(self.get_num_rows() - self._page_size)
-        print(self.table.get_string())
+        self._show_page()
 
     def scroll_up_one_row(self) -> None:
         """
@@ -743,7 +1253,7 @@ class Table(object):
         # the view down. They now agree with their own docstrings and with page_up and
         # page_down, which have always had up meaning earlier.
         self.show_rows(self.table.start - 1)
-        print(self.table.get_string())
+        self._show_page()
 
     def scroll_down_one_row(self) -> None:
         """
@@ -752,7 +1262,137 @@ class Table(object):
         :return: None
         """
         self.show_rows(self.table.start + 1)
-        print(self.table.get_string())
+        self._show_page()
+
+    def _show_page(self) -> None:
+        """
+        Internal function to print the page moved to by :meth:`page_up` and the rest -- unless in batch mode, where
+        there is no one to show it to (see :func:`set_batch_mode`.)
+
+        :return: None
+        """
+        if not in_batch_mode():
+            print(self._render())
+
+    def _render(self, fields: list[str] | None = None) -> str:
+        """
+        Internal function to lay out the current page of the table -- rows ``table.start`` to ``table.end``.
+
+        :param fields: the columns to show. **None** shows all of them, including the action column.
+
+        :return: the page as a string, ready to print
+
+        Laying out a page -- working out the column widths and drawing every line -- is most of the time it takes to
+        show one, and paging back and forth shows the same few pages again and again. So the last few pages laid out
+        are kept, keyed on which rows and columns they show, the table's look (every prettytable option in
+        ``_LAYOUT_OPTIONS``, from the rules to the column alignment and widths) and the version of its rows, and shown
+        again as they are. Deriving the rows again (:meth:`refresh_items`, or paging a table from a data source) throws
+        them away. A windowed table formats its page from ``action_dict`` as it lays it out, so for one of those a
+        page is only shown again while each value in ``action_dict`` is the same object it was.
+        """
+        table = self.table
+        key = (table.start, table.end, None if fields is None else tuple(fields), self._version, _layout_key(table))
+        action_dict_values = tuple(self.action_dict.items()) if self._formats_on_draw else ()
+        cached = self._page_cache.get(key)
+
+        if cached is not None and len(cached[0]) == len(action_dict_values) and all(
+                k1 == k2 and v1 is v2 for (k1, v1), (k2, v2) in zip(cached[0], action_dict_values)):
+            self._page_cache.move_to_end(key)
+            return cached[1]
+
+        page = self._lay_out_page(fields)
+        self._page_cache[key] = (action_dict_values, page)
+        self._page_cache.move_to_end(key)
+
+        if len(self._page_cache) > _PAGE_CACHE_SIZE:
+            self._page_cache.popitem(last=False)
+
+        return page
+
+    def _lay_out_page(self, fields: list[str] | None) -> str:
+        """
+        Internal function to lay out the current page of the table, for :meth:`_render`.
+
+        :param fields: the columns to show. **None** shows all of them, including the action column.
+
+        :return: the page as a string, ready to print
+
+        A windowed table's prettytable is empty between draws, so the rows on the page are formatted and added here,
+        and taken out again once laid out. prettytable works out column widths from the rows it is asked to show, so
+        the page looks the same as the one the table would have drawn with every row added.
+        """
+        options: dict[str, Any] = {} if fields is None else {'fields': fields}
+
+        if self._source is not None:
+            # The prettytable holds just the page, where table.start and table.end count from the
+            # start of the source.
+            return self.table.get_string(start=0, end=len(self._rows), **options)
+        elif not self._formats_on_draw:
+            return self.table.get_string(**options)
+
+        formatter = string.Formatter()
+        page = self._visible_rows[self.table.start:self.table.end]
+        self.table.add_rows([[r.tag] + self._format_values(r.values, formatter) + [r.action] for r in page])
+
+        try:
+            return self.table.get_string(start=0, end=len(page), **options)
+        finally:
+            self.table.clear_rows()
+
+    def _format_values(self, values: list[Any], formatter: string.Formatter) -> list[Any]:
+        """
+        Internal function to substitute ``action_dict`` values into the strings in a row.
+
+        :param values: the row's column values
+        :param formatter: the formatter to use
+
+        :return: a new list of the values, with the strings formatted
+        """
+        formatted_values = []
+
+        for v in values:
+            if not isstring(v):
+                formatted_values.append(v)
+                continue
+
+            str_v = str(v)
+
+            if '{' not in str_v and '}' not in str_v:
+                # Nothing to substitute, which is most cells, and vformat would hand back the same
+                # text -- after parsing it.
+                formatted_values.append(str_v)
+                continue
+
+            try:
+                formatted_val = formatter.vformat(str_v, (), self.action_dict)
+            except (ValueError, KeyError):
+                # A curly brace in the value breaks the format string, so double the
+                # braces up and format the literal text instead. An unmatched brace
+                # raises ValueError; Fixing: a cell like '{literal}' parses as a
+                # perfectly good field reference and raises KeyError instead, which
+                # nothing caught -- so any table holding data with a {word} in it,
+                # such as a template or a log line, crashed on display.
+                v2 = str_v.replace('}', '}}').replace('{', '{{')
+                formatted_val = formatter.vformat(v2, (), self.action_dict)
+
+            formatted_values.append(formatted_val)
+
+        return formatted_values
+
+    def _formatted_row(self, row: TableItem) -> TableItem:
+        """
+        Internal function to give a row as it is shown. A windowed table keeps its rows unformatted, so a row it hands
+        out is formatted first, the same way its page is. Other tables' rows were formatted when the table was refreshed.
+
+        :param row: one of the table's rows
+
+        :return: the row, formatted
+        """
+        if not self._formats_on_draw:
+            return row
+
+        return TableItem(self._format_values(row.values, string.Formatter()), row.tag, row.action,
+                         item_data=row.item_data, hidden=row.hidden, enabled=row.enabled)
 
 
     def _prep_get_input(self, force_refresh: bool = False) -> tuple[
@@ -763,15 +1403,57 @@ class Table(object):
 
         :return: a tuple of (choices, cleaners, convertor, validator) to use for getting input from the table.
         """
-        if self.refresh or force_refresh:
+        auto = self.refresh == TABLE_REFRESH_AUTO
+
+        if force_refresh or (self.refresh and not auto):
             self.refresh_items(self._table_items, self.add_exit, self.item_filter)
+        elif auto:
+            self._refresh_changed()
+
+            # Nothing the choices are built from has changed since they were last built. Only
+            # kept for TABLE_REFRESH_AUTO: with refresh=False an action may still change the row
+            # it was handed (its enabled, say), which is then expected to show on the next prompt.
+            if self._prepped is not None:
+                return self._prepped
 
+        prepped = self._build_choices()
+        if auto:
+            self._prepped = prepped
+
+        return prepped
+
+    def _show_first_page(self, prepped: tuple[dict[str, int], list[Cleaner], ChoiceConvertor, ChoiceValidator]
+                         ) -> tuple[dict[str, int], list[Cleaner], ChoiceConvertor, ChoiceValidator]:
+        """
+        Internal function to go back to the first page of the table before prompting.
+
+        :param prepped: the choices, cleaners, convertor and validators from :meth:`_prep_get_input`
+
+        :return: the choices, cleaners, convertor and validators to prompt with
+        """
+        page_start = self._page_start
+        self.show_rows(0)
+
+        if self._source is not None and self._page_start != page_start:
+            # A table from a data source left on a later page (by the last prompt, say) has just fetched the first
+            # one, so the choices made from the rows it held are for the wrong page.
+            prepped = self._build_choices()
+
+        return prepped
+
+    def _build_choices(self) -> tuple[dict[str, int], list[Cleaner], ChoiceConvertor, ChoiceValidator]:
+        """
+        Internal function to make the choices, cleaners, convertor and validators for choosing one of the table's
+        rows, as they are now.
+
+        :return: a tuple of (choices, cleaners, convertor, validator)
+        """
         if self.case_sensitive:
             choices = {str(item.tag): i for i, item in enumerate(self._rows) if item.enabled is True}
         else:
             choices = {str(item.tag).lower(): i for i, item in enumerate(self._rows) if item.enabled is True}
 
-        cleaners = [StripCleaner()]
+        cleaners: list[Cleaner] = [StripCleaner()]
         if not self.case_sensitive:
             cleaners.append(CapitalizationCleaner('lower'))
         cleaners.append(ChoiceCleaner(choices))
@@ -781,32 +1463,125 @@ class Table(object):
 
         return choices, cleaners, convertor, validators
 
+    def _refresh_changed(self) -> None:
+        """
+        Internal function for ``refresh=TABLE_REFRESH_AUTO``: refresh whatever has changed since the rows were last
+        derived -- all of them, some of them (those passed to :meth:`mark_dirty`), or none.
+
+        :return: None
+        """
+        snapshot = self._action_dict_snapshot
+        action_dict_changed = (self.action_dict.keys() != snapshot.keys()
+                               or any(self.action_dict[key] is not value for key, value in snapshot.items()))
+
+        if self._refreshed_version != self._version or action_dict_changed:
+            self.refresh_items(self._table_items, self.add_exit, self.item_filter)
+        elif self._dirty_rows and not self._refresh_dirty_rows():
+            self.refresh_items(self._table_items, self.add_exit, self.item_filter)
+
+    def _refresh_dirty_rows(self) -> bool:
+        """
+        Internal function to derive the rows for the table items passed to :meth:`mark_dirty` again.
+
+        :return: **True** if done, or **False** if it cannot be done row by row and all of the rows need deriving again
+
+        Tags are numbered by position among the rows the item filter lets through, so a row can only be refreshed on
+        its own while the filter keeps letting it through (or keeps it out). For a table from a data source these are
+        the rows on the page shown.
+        """
+        if self._source_index is None:
+            index: dict[int, int | None] = {id(item): None for item in self._refreshed_items}
+            index.update((id(item), i) for i, item in enumerate(self._row_sources))
+
+            if len(index) != len(self._refreshed_items):
+                return False    # an item is in the table twice, and only one of its rows would be found
+
+            self._source_index = index
+
+        formatter = string.Formatter()
+        item_filter = self._refreshed_filter
+        choices_changed = False
+
+        for item in self._dirty_rows:
+            try:
+                pos = self._source_index[id(item)]
+            except KeyError:
+                return False    # not one of the table's items
+
+            if callable(item_filter):
+                self._apply_item_filter(item, item_filter)
+                if (pos is not None) != (item.hidden is False):
+                    return False    # it has come into or gone out of the table, renumbering the rest
+
+            if pos is None:
+                continue    # still filtered out
+
+            if item.tag is not None:
+                tag = item.tag
+            elif self._source is None:
+                tag = pos + 1
+            else:
+                # numbered by position in the source -- see _load_page. The page is short.
+                tag = (self._page_start or 0) + self._refreshed_items.index(item) + 1
+
+            old_row = self._rows[pos]
+            row = self._derive_row(item, tag, formatter)
+            self._rows[pos] = row
+            self._count_widths([old_row], -1)
+            self._count_widths([row], 1)
+
+            choices_changed = choices_changed or (row.tag, row.enabled) != (old_row.tag, old_row.enabled)
+
+        self._dirty_rows = []
+
+        if choices_changed:
+            self._prepped = None
+            self._tag_index = None
+
+        # The prettytable (or, for a windowed table, the list of shown rows) holds the old rows and
+        # has no way to replace one, so they are all handed over again -- from the rows already
+        # derived, which is the cheap part.
+        self._fill_table()
+
+        return True
+
     def refresh_screen(self) -> None:
         """
         Display the current page of the table (including any header or footer)
 
         :return: None
         """
+        print(self._screen())
+
+    def _screen(self) -> str:
+        """
+        Internal function to lay out what :meth:`refresh_screen` shows: the header, title, current page and footer.
+
+        :return: the text, one line of it for each of the parts shown
+        """
         formatter = string.Formatter()
+        lines = []
 
-        # print header
+        # header
         if self.header:
             # vformat's second argument is the sequence of positional format arguments, and
             # was None here. Header and footer strings reference action_dict by name only, so
             # nothing ever indexed it -- but a caller who wrote {0} got TypeError instead of
             # the IndexError that says what is actually wrong. An empty tuple is the honest
             # "no positional arguments".
-            print(formatter.vformat(self.header, (), self.action_dict))
+            lines.append(formatter.vformat(self.header, (), self.action_dict))
 
-        # print table
+        # table
         if self.title is not None:
-            print('{}'.format(self.title))
+            lines.append('{}'.format(self.title))
 
-        print(self.table.get_string(fields=self.field_names))  # don't show action
+        lines.append(self._render(self.field_names))  # don't show action
 
-        # print footer
+        # footer
         if self.footer:
-            print(formatter.vformat(self.footer, (), self.action_dict))
+            lines.append(formatter.vformat(self.footer, (), self.action_dict))
+
+        return '\n'.join(lines)
 
 
     def show_table(self) -> None:
@@ -815,7 +1590,9 @@ class Table(object):
 
         :return: None
         """
-        if self.refresh is True:
+        if self.refresh == TABLE_REFRESH_AUTO:
+            self._refresh_changed()
+        elif self.refresh is True:
             self.refresh_items(self._table_items, self.add_exit, self.item_filter)
 
         self.refresh_screen()
@@ -846,42 +1623,133 @@ class Table(object):
         The first five options fall back to the table's own settings when left at **None**; the rest
         are :func:`get_input` defaults. See :meth:`get_table_choice` for what each one does.
         """
-        use_prompt = self.prompt if prompt is None else prompt
-        use_required = self.required if required is None else required
-        use_default = self.default_choice if default is None else default
-        use_default_str = self.default_str if default_str is None else default_str
-        use_commands = self.commands if commands is None else commands
+        options = self._choice_options(prompt, required, default, default_str, hidden, retries, commands,
+                                       error_callback, convertor_error_fmt, validator_error_fmt)
+        prepped = (table_choices, table_cleaners, table_convertor, table_validators)
 
         while True:
-            try:
+            if not in_batch_mode():     # no one to show the table to -- see set_batch_mode
                 self.refresh_screen()
-                result = get_input(cleaners=table_cleaners, convertor=table_convertor,
-                                   validators=table_validators, prompt=use_prompt,
-                                   required=use_required, default=use_default,
-                                   default_str=use_default_str, hidden=hidden, retries=retries,
-                                   commands=use_commands, error_callback=error_callback,
-                                   convertor_error_fmt=convertor_error_fmt,
-                                   validator_error_fmt=validator_error_fmt)
-
-                if result is None:
-                    return None
-                else:
-                    return self._rows[result]
-            except (FirstPageRequest):
-                self.goto_home()
-            except (LastPageRequest):
-                self.goto_end()
-            except (PageUpRequest):
-                self.page_up()
-            except (PageDownRequest):
-                self.page_down()
-            except (UpOneRowRequest):
-                self.scroll_up_one_row()
-            except (DownOneRowRequest):
-                self.scroll_down_one_row()
-            except (RefreshScreenInterrupt):
-                table_choices, table_cleaners, table_convertor, table_validators = self._prep_get_input(force_refresh=True)
-                self.show_rows(0)
+
+            try:
+                result = get_input(*prepped[1:], **options)
+            except _PAGE_REQUESTS as request:
+                prepped = self._page_request(request, prepped)
+                continue
+
+            if result is None:
+                return None
+            else:
+                return self._formatted_row(self._rows[result])
+
+    async def _get_choice_async(self, prepped: tuple[dict[str, int], list[Cleaner], ChoiceConvertor, ChoiceValidator],
+                                options: dict[str, Any], input_source: AsyncInputSource | None) -> TableItem | None:
+        """
+        Internal coroutine version of :meth:`_get_choice`.
+
+        :param prepped: the choices, cleaners, convertor and validators built by :meth:`_prep_get_input`
+        :param options: the :func:`get_input` options, from :meth:`_choice_options`
+        :param input_source: the async function to read each line with
+
+        :return:  the table row for the choice picked
+        """
+        while True:
+            if not in_batch_mode():     # as for _get_choice
+                await _show_async(self._screen(), input_source)
+
+            try:
+                result = await get_input_async(*prepped[1:], input_source=input_source, **options)
+            except _PAGE_REQUESTS as request:
+                # Not shown as the request is done: the page is shown, through the input source, as the loop goes
+                # round again.
+                prepped = self._page_request(request, prepped, show=False)
+                continue
+
+            if result is None:
+                return None
+            else:
+                return self._formatted_row(self._rows[result])
+
+    def _choice_options(self, prompt: str | None, required: bool | None, default: Any, default_str: str | None,
+                        hidden: bool, retries: int | None, commands: CommandsArg, error_callback: ErrorCallback,
+                        convertor_error_fmt: str, validator_error_fmt: str) -> dict[str, Any]:
+        """
+        Internal function to work out the :func:`get_input` options for choosing a row, from those passed to
+        :meth:`get_table_choice`. The first five fall back to the table's own settings when left at **None**.
+
+        :return: the options, as keyword arguments for :func:`get_input`
+        """
+        return {
+            'prompt': self.prompt if prompt is None else prompt,
+            'required': self.required if required is None else required,
+            'default': self.default_choice if default is None else default,
+            'default_str': self.default_str if default_str is None else default_str,
+            'hidden': hidden,
+            'retries': retries,
+            'commands': self.commands if commands is None else commands,
+            'error_callback': error_callback,
+            'convertor_error_fmt': convertor_error_fmt,
+            'validator_error_fmt': validator_error_fmt,
+        }
+
+    def _page_request(self, request: Exception,
+                      prepped: tuple[dict[str, int], list[Cleaner], ChoiceConvertor, ChoiceValidator],
+                      show: bool = True) -> tuple[dict[str, int], list[Cleaner], ChoiceConvertor, ChoiceValidator]:
+        """
+        Internal function to do what a paging command asked for, by raising one of the requests in ``_PAGE_REQUESTS``
+        out of the prompt.
+
+        :param request: the request raised
+        :param prepped: the choices, cleaners, convertor and validators the prompt was using
+        :param show: **True** to print the page moved to, as :meth:`page_up` and the rest do
+
+        :return: the choices, cleaners, convertor and validators to prompt with now
+        """
+        if isinstance(request, RefreshScreenInterrupt):
+            prepped = self._prep_get_input(force_refresh=True)
+            self.show_rows(0)
+        elif not show:
+            self.show_rows(self._requested_start(request))
+        elif isinstance(request, FirstPageRequest):
+            self.goto_home()
+        elif isinstance(request, LastPageRequest):
+            self.goto_end()
+        elif isinstance(request, PageUpRequest):
+            self.page_up()
+        elif isinstance(request, PageDownRequest):
+            self.page_down()
+        elif isinstance(request, UpOneRowRequest):
+            self.scroll_up_one_row()
+        else:   # DownOneRowRequest
+            self.scroll_down_one_row()
+
+        if self._source is not None:
+            # Paging a table from a data source changes which rows it holds, and so which can be chosen.
+            prepped = self._build_choices()
+
+        return prepped
+
+    def _requested_start(self, request: Exception) -> int:
+        """
+        Internal function to work out the first row to show for a paging request: the row :meth:`goto_home`,
+        :meth:`page_up` and the rest move to.
+
+        :param request: the request raised
+
+        :return: the row to pass to :meth:`show_rows`
+        """
+        if isinstance(request, FirstPageRequest):
+            return 0
+        elif isinstance(request, LastPageRequest):
+            return self.get_num_rows() - self._page_size
+        elif isinstance(request, PageUpRequest):
+            return self.table.start - self._page_size
+        elif isinstance(request, PageDownRequest):
+            return self.table.start + self._page_size
+        elif isinstance(request, UpOneRowRequest):
+            return self.table.start - 1
+        else:   # DownOneRowRequest
+            return self.table.start + 1
 
     def get_table_choice(self, *,
                          prompt: str | None = None,
@@ -922,8 +1790,7 @@ class Table(object):
         one prompt this call makes, not to how the table was built. The first five default to **None**
         meaning "use what the table was given"; passing one overrides it for this prompt only.
         """
-        table_choices, table_cleaners, table_convertor, table_validators = self._prep_get_input()
-        self.show_rows(0)
+        table_choices, table_cleaners, table_convertor, table_validators = self._show_first_page(self._prep_get_input())
         row = self._get_choice(table_choices, table_cleaners, table_convertor, table_validators,
                                prompt=prompt, required=required, default=default,
                                default_str=default_str, hidden=hidden, retries=retries,
@@ -936,6 +1803,42 @@ class Table(object):
         else:
             return self.do_action(row)
 
+    async def get_table_choice_async(self, *,
+                                     input_source: AsyncInputSource | None = None,
+                                     prompt: str | None = None,
+                                     required: bool | None = None,
+                                     default: Any = None,
+                                     default_str: str | None = None,
+                                     hidden: bool = False,
+                                     retries: int | None = None,
+                                     commands: CommandsArg = None,
+                                     error_callback: ErrorCallback = print_error,
+                                     convertor_error_fmt: str = DEFAULT_CONVERTOR_ERROR,
+                                     validator_error_fmt: str = DEFAULT_VALIDATOR_ERROR) -> Any:
+        """
+        Coroutine version of :meth:`get_table_choice`, for choosing from a table inside an asyncio program without
+        blocking its event loop.
+
+        :param input_source: the async function to read each line with. See :meth:`GetInput.get_input_async`. The
+            table is shown with its ``write`` coroutine, if it has one (as :class:`StreamInputSource` does), and
+            printed otherwise.
+
+        The other parameters, and what is returned, are the same as for :meth:`get_table_choice`. The row's action
+        may be a coroutine function, which is awaited, and a table used as an action is run with :meth:`run_async`.
+        """
+        prepped = self._show_first_page(self._prep_get_input())
+        options = self._choice_options(prompt, required, default, default_str, hidden, retries, commands,
+                                       error_callback, convertor_error_fmt, validator_error_fmt)
+        row = await self._get_choice_async(prepped, options, input_source)
+
+        if row is None:
+            return None
+        elif isinstance(row.action, Table):
+            return await row.action.run_async(input_source)
+
+        result = self.do_action(row)
+        return await result if inspect.isawaitable(result) else result
+
 
     def refresh_items(self, rows: TableItem | Iterable[TableItem] | None = None,
                       add_exit: bool | str = False,
@@ -953,7 +1856,23 @@ class Table(object):
         :param item_filter: an optional function used to filter rows. See :class:`Table` for details regarding item filters.
 
         :return: None
+
+        For a table from a data source, ``rows`` is ignored: the rows in the source are counted again and the page
+        shown is fetched again.
         """
+        # Fixing: `filtered_items` was only assigned by the two branches below, so a
+        # truthy non-callable item_filter (a string, a list) fell through to the loop
+        # below with the name unbound and raised UnboundLocalError. Say what is
+        # actually wrong instead.
+        if not (item_filter is None or item_filter is True or callable(item_filter)):
+            raise RuntimeError(
+                'Table.refresh_items: item_filter must be None, True, or a callable '
+                'returning a (hidden, enabled) tuple -- got {!r}'.format(item_filter))
+
+        if self._source is not None:
+            self._refresh_source(add_exit, item_filter)
+            return
+
         formatter = string.Formatter()
 
         if rows is None:
@@ -965,6 +1884,7 @@ class Table(object):
 
         self.table.clear_rows()
         self._rows = []
+        self._tag_index = None
 
         table_idx = 1
 
@@ -972,15 +1892,6 @@ class Table(object):
         for item in use_rows:
             table_items.append(item)
 
-        # Fixing: `filtered_items` was only assigned by these two branches, so a
-        # truthy non-callable item_filter (a string, a list) fell through to the loop
-        # below with the name unbound and raised UnboundLocalError. Say what is
-        # actually wrong instead.
-        if not (item_filter is None or item_filter is True or callable(item_filter)):
-            raise RuntimeError(
-                'Table.refresh_items: item_filter must be None, True, or a callable '
-                'returning a (hidden, enabled) tuple -- got {!r}'.format(item_filter))
-
         if item_filter is None or item_filter is True:
             filtered_items = table_items
         else:
@@ -988,12 +1899,7 @@ class Table(object):
             # rejected the rest -- so this is an `else`, not a second `callable()` test.
             filtered_items = []
             for item in table_items:
-                # could set hidden and enabled directly, but it's easy to forget to return the tuple so warn the user...
-                filter_result = item_filter(item, self.action_dict)
-                try:
-                    item.hidden, item.enabled = filter_result[0], filter_result[1]
-                except TypeError:
-                    raise RuntimeError('get_table: item_filter needs to return a tuple (hidden, enabled)')
+                self._apply_item_filter(item, item_filter)
                 if item.hidden is False:
                     filtered_items.append(item)
 
@@ -1003,36 +1909,52 @@ class Table(object):
             else:
                 tag = item.tag
 
-            item_values = []
-            for v in item.values:
-                if isstring(v):
-                    try:
-                        formatted_val = formatter.vformat(str(v), (), self.action_dict)
-                    except (ValueError, KeyError):
-                        # A curly brace in the value breaks the format string, so double the
-                        # braces up and format the literal text instead. An unmatched brace
-                        # raises ValueError; Fixing: a cell like '{literal}' parses as a
-                        # perfectly good field reference and raises KeyError instead, which
-                        # nothing caught -- so any table holding data with a {word} in it,
-                        # such as a template or a log line, crashed on display.
-                        v2 = str(v).replace('}', '}}').replace('{', '{{')
-                        formatted_val = formatter.vformat(str(v2), (), self.action_dict)
-
-                    item_values.append(formatted_val)
-                else:
-                    item_values.append(v)
-
-            row_entry = TableItem(item_values, tag, item.action, item_data=item.item_data, hidden=item.hidden, enabled=item.enabled)
-
-            self._rows.append(row_entry)
+            self._rows.append(self._derive_row(item, tag, formatter))
             table_idx += 1
 
+        self._add_exit_row(add_exit)
+
+        if self._width_counts is not None:
+            self._width_counts = [Counter() for _ in self.table.field_names]
+            self._count_widths(self._rows, 1)
+
+        self._fill_table()
+
+        # What these rows were derived from, for refresh=TABLE_REFRESH_AUTO
+        self._refreshed_version = self._version
+        self._action_dict_snapshot = dict(self.action_dict)
+        self._refreshed_items = table_items
+        self._refreshed_filter = item_filter
+        self._row_sources = filtered_items
+        self._source_index = None
+        self._dirty_rows = []
+        self._prepped = None
+
+        if self.table.start > self.get_num_rows():
+            # filtering can cause the table to not show any rows. If so, show last page of filtered table
+            start_row = max(self.get_num_rows() - self._page_size, 0)
+            self.show_rows(start_row)
+
+        if self.rows_per_page:
+            self.table.end = self.table.start + self.rows_per_page
+        else:
+            self.table.end = self.get_num_rows()
+
+
+    def _add_exit_row(self, add_exit: bool | str) -> None:
+        """
+        Internal function to add the exit (or return) row to the end of the rows, if the table has one.
+
+        :param add_exit: the ``add_exit`` passed to :meth:`refresh_items`
+
+        :return: None
+        """
         if add_exit not in (False, 'none') and self.add_exit not in (False, 'none'):
             num_values = 1
             if len(self._rows):
                 num_values = len(self._rows[0].values)
             row_values = ['' for i in range(num_values)]
-           
+
             # __init__ rejects any add_exit outside {True, False, TABLE_ADD_EXIT,
             # TABLE_ADD_RETURN}, and the test above has already excluded False and
             # 'none', so only TABLE_ADD_RETURN needs naming -- everything still
@@ -1043,25 +1965,142 @@ class Table(object):
                 row_tag, row_action = 'exit', TABLE_ITEM_EXIT
 
             row_entry = TableItem(row_values, row_tag, row_action)
-
-            self.table.add_row([row_entry.tag] + row_entry.values + [row_entry.action])
+            # Dropped a self.table.add_row(...) of this row here: the rows are cleared and all
+            # added again in _fill_table, so it never reached the screen.
             self._rows.append(row_entry)
 
-        # refresh table
-        self.table.clear_rows()
-        for r in self._rows:
+    def _refresh_source(self, add_exit: bool | str, item_filter: ItemFilter | bool | None) -> None:
+        """
+        Internal function to refresh a table from a data source: count its rows, and fetch the page shown again.
+
+        :param add_exit: the ``add_exit`` passed to :meth:`refresh_items`
+        :param item_filter: the item filter
+
+        :return: None
+        """
+        assert self._source is not None
+        self._source_count = self._source.count()
+        self._source_add_exit = add_exit
+        self._refreshed_filter = item_filter
+
+        self._refreshed_version = self._version
+        self._action_dict_snapshot = dict(self.action_dict)
+
+        self._page_start = None     # make show_rows fetch the page, even if it is the same one
+        self.show_rows(self.table.start)
+
+    def _load_page(self) -> None:
+        """
+        Internal function to fetch the rows from ``table.start`` to ``table.end`` from a table's data source and
+        derive its rows from them, as :meth:`refresh_items` does for the table items of other tables.
+
+        :return: None
+        """
+        assert self._source is not None
+        formatter = string.Formatter()
+        item_filter = self._refreshed_filter
+        start = self.table.start
+        items = self._source.fetch(start, self._page_size)
+        self._rows = []
+        self._tag_index = None
+        row_sources = []
+
+        for i, item in enumerate(items):
+            if callable(item_filter):
+                self._apply_item_filter(item, item_filter)
+                if item.hidden is not False:
+                    continue
+
+            self._rows.append(self._derive_row(item, start + i + 1 if item.tag is None else item.tag, formatter))
+            row_sources.append(item)
+
+        self._add_exit_row(self._source_add_exit)
+        self._fill_table()
+
+        # What mark_dirty works from -- see _refresh_dirty_rows.
+        self._page_start = start
+        self._refreshed_items = items
+        self._row_sources = row_sources
+        self._source_index = None
+        self._dirty_rows = []
+        self._prepped = None
+
+    def _apply_item_filter(self, item: TableItem, item_filter: ItemFilter) -> None:
+        """
+        Internal function to set a table item's ``hidden`` and ``enabled`` from an item filter.
+
+        :param item: the table item
+        :param item_filter: the item filter
+
+        :return: None
+        """
+        # could set hidden and enabled directly, but it's easy to forget to return the tuple so warn the user...
+        filter_result = item_filter(item, self.action_dict)
+        try:
+            item.hidden, item.enabled = filter_result[0], filter_result[1]
+        except TypeError:
+            raise RuntimeError('get_table: item_filter needs to return a tuple (hidden, enabled)')
+
+    def _derive_row(self, item: TableItem, tag: Any, formatter: string.Formatter) -> TableItem:
+        """
+        Internal function to make the table's row for a table item: the item with its tag filled in and, unless the
+        table is windowed, its values formatted.
+
+        :param item: the table item
+        :param tag: the tag for the row
+        :param formatter: the formatter to use
+
+        :return: the row
+        """
+        if self._formats_on_draw:
+            # Shares the item's list rather than copying it, which for a big table was most of a refresh: only the
+            # rows on the page are ever read, and they are formatted into new lists as they are (see _lay_out_page
+            # and _formatted_row), so the table never hands out this list or changes it.
+            item_values = item.values
+        else:
+            # The row has its own list of values, so changing one does not change the other. It used to get a
+            # second copy of that list from TableItem, for every row on every refresh.
+            item_values = self._format_values(item.values, formatter)
+
+        return _table_item(item_values, tag, item.action, item.item_data, item.hidden, item.enabled)
+
+    def _count_widths(self, rows: Iterable[TableItem], change: int) -> None:
+        """
+        Internal function to add rows to (or take them out of) the column widths kept for ``TABLE_WIDTHS_TABLE``.
+
+        :param rows: the rows
+        :param change: **1** to add the rows, or **-1** to take them out
+
+        :return: None
+        """
+        if self._width_counts is None or self._formats_on_draw:
+            return
+
+        for r in rows:
             if r.hidden is not True:
-                self.table.add_row([r.tag] + r.values + [r.action])
+                for counts, value in zip(self._width_counts, [r.tag] + r.values + [r.action]):
+                    counts[_text_width(value)] += change
 
-        if self.table.start > self.get_num_rows():
-            # filtering can cause the table to not show any rows. If so, show last page of filtered table
-            start_row = max(self.get_num_rows() - self._page_size, 0)
-            self.show_rows(start_row)
+    def _fill_table(self) -> None:
+        """
+        Internal function to give the prettytable the rows to show (or, for a windowed table, to list them.)
 
-        if self.rows_per_page:
-            self.table.end = self.table.start + self.rows_per_page
+        :return: None
+        """
+        self.table.clear_rows()
+        self._page_cache.clear()    # laid out from the rows these replace
+
+        if self._formats_on_draw:
+            self._visible_rows = [r for r in self._rows if r.hidden is not True]
         else:
-            self.table.end = self.get_num_rows()
+            for r in self._rows:
+                if r.hidden is not True:
+                    self.table.add_row([r.tag] + r.values + [r.action])
+
+            if self._width_counts is not None:
+                # prettytable still fits each page to its own rows, but no narrower than the widest in the table.
+                self.table.min_width = {name: max((width for width, n in counts.items() if n > 0), default=0)
+                                        for name, counts in zip(self.table.field_names, self._width_counts)}
 
 
     def __call__(self, choice: Any = None, action_dict: dict[str, Any] | None = None) -> bool:
@@ -1088,15 +2127,15 @@ class Table(object):
 
         :return: **True** if exited without an error, or **False** if a :class:`GetInputInterrupt` exce[tion was raised
         """
-        table_choices, table_cleaners, table_convertor, table_validators = self._prep_get_input()
-        self.show_rows(0)
+        prepped = self._show_first_page(self._prep_get_input())
 
         while True:
             try:
                 # No overrides: _get_choice already falls back to the table's own prompt.
-                choice = self._get_choice(table_choices, table_cleaners, table_convertor, table_validators)
+                choice = self._get_choice(*prepped)
             except (GetInputInterrupt) as gii:
-                print('\n{}\n'.format(gii))
+                if not in_batch_mode():     # as for the table itself -- see set_batch_mode
+                    print('\n{}\n'.format(gii))
                 continue
 
             if choice is None:
@@ -1110,33 +2149,103 @@ class Table(object):
                 # and it is what makes `choice` a row from this point down.
                 break
 
-            action = choice.action
-            default_action = _as_row_action(self.default_action)
-            row_action = _as_row_action(action)
+            picked = self._pick_action(choice)
 
-            if action in (TABLE_ITEM_EXIT, TABLE_ITEM_RETURN):
+            if picked is None:
                 break
-            elif action == TABLE_ITEM_DEFAULT:
-                if default_action is not None:
-                    try:
-                        default_action(choice, self.action_dict)
-                    except (GetInputInterrupt) as gii:
+
+            row_action, is_default = picked
+
+            if row_action is not None:
+                try:
+                    row_action(choice, self.action_dict)
+                except (GetInputInterrupt) as gii:
+                    if not in_batch_mode():
                         print('\n{}\n'.format(gii))
+                    if is_default:
                         return False
-                else:
-                    print('Table:run: default_action not set for {}'.format(choice), file=sys.stderr)
-            elif row_action is not None:
+                    continue
+
+            if self.refresh:
+                prepped = self._prep_get_input()
+                self.show_rows(self.table.start)
+
+        return True
+
+    async def run_async(self, input_source: AsyncInputSource | None = None) -> bool:
+        """
+        Coroutine version of :meth:`run`, for running a menu inside an asyncio program without blocking its event
+        loop.
+
+        :param input_source: the async function to read each line with. See :meth:`GetInput.get_input_async`. The
+            table, and the message of any :class:`GetInputInterrupt`, are shown as for :meth:`get_table_choice_async`.
+
+        :return: **True** if exited without an error, or **False** if a :class:`GetInputInterrupt` exception was raised
+
+        Row actions may be coroutine functions, which are awaited, and a table used as an action (a sub-menu) is
+        run with ``run_async`` too, reading from the same ``input_source``.
+        """
+        prepped = self._show_first_page(self._prep_get_input())
+        options = self._choice_options(None, None, None, None, False, None, None, print_error,
+                                       DEFAULT_CONVERTOR_ERROR, DEFAULT_VALIDATOR_ERROR)
+
+        while True:
+            try:
+                choice = await self._get_choice_async(prepped, options, input_source)
+            except (GetInputInterrupt) as gii:
+                await _show_async('\n{}\n'.format(gii), input_source)
+                continue
+
+            if choice is None:
+                break
+
+            picked = self._pick_action(choice)
+
+            if picked is None:
+                break
+
+            row_action, is_default = picked
+
+            if row_action is not None:
                 try:
-                    row_action(choice, self.action_dict)
+                    if isinstance(row_action, Table):
+                        await row_action.run_async(input_source)
+                    else:
+                        result = row_action(choice, self.action_dict)
+                        if inspect.isawaitable(result):
+                            await result
                 except (GetInputInterrupt) as gii:
-                    print('\n{}\n'.format(gii))
+                    await _show_async('\n{}\n'.format(gii), input_source)
+                    if is_default:
+                        return False
                     continue
-            else:
-                print('Table.run - no action specified for {}'.format(choice), file=sys.stderr)
 
             if self.refresh:
-                table_choices, table_cleaners, table_convertor, table_validators = self._prep_get_input()
+                prepped = self._prep_get_input()
                 self.show_rows(self.table.start)
 
         return True
 
+    def _pick_action(self, choice: TableItem) -> tuple[RowAction | None, bool] | None:
+        """
+        Internal function to pick what :meth:`run` does with the row chosen.
+
+        :param choice: the row chosen
+
+        :return: **None** to leave the menu, or the action to call -- **None** if there is none, which has been
+            reported -- and whether it is the table's default action
+        """
+        action = choice.action
+
+        if action in (TABLE_ITEM_EXIT, TABLE_ITEM_RETURN):
+            return None
+        elif action == TABLE_ITEM_DEFAULT:
+            default_action = _as_row_action(self.default_action)
+            if default_action is None:
+                print('Table:run: default_action not set for {}'.format(choice), file=sys.stderr)
+            return default_action, True
+        else:
+            row_action = _as_row_action(action)
+            if row_action is None:
+                print('Table.run - no action specified for {}'.format(choice), file=sys.stderr)
+            return row_action, False
@@ -22,7 +22,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Any, Literal, overload
 
-from ._typing import CleanerArg, CommandsArg, ErrorCallback, GetInputValidatorArg
+from ._typing import AsyncInputSource, CleanerArg, CommandsArg, ErrorCallback, GetInputValidatorArg
 from .error_callbacks import print_error, DEFAULT_CONVERTOR_ERROR, DEFAULT_VALIDATOR_ERROR
 from .validators import Validator, RangeValidator, LengthValidator
 from .convertors import Convertor, IntConvertor, FloatConvertor, BooleanConvertor, DateConvertor
@@ -149,6 +149,27 @@ def process_value(value: Any, cleaners: CleanerArg = None, convertor: Convertor
     return gi.process_value(value)
 
 
+# Each get_* function below has a _build_* function making the GetInput it asks with, from its own
+# parameters and the GetInput options passed through. The get_* function asks with get_input, and its
+# coroutine version (at the end of this file) with get_input_async, so what each makes of its
+# parameters is written once.
+def _build_string(cleaners: CleanerArg, validators: GetInputValidatorArg, min_len: int | None,
+                  max_len: int | None, **options: Any) -> GetInput:
+    """
+    Make the :class:`GetInput` :func:`get_string` asks with.
+    """
+    use_validators: list[Any] = []
+    if min_len is not None or max_len is not None:
+        use_validators.append(LengthValidator(min_len=min_len, max_len=max_len))
+
+    if isinstance(validators, Validator):
+        use_validators.append(validators)
+    elif validators is not None:
+        use_validators.extend(put_in_a_list(validators))
+
+    return GetInput(cleaners, None, use_validators, **options)
+
+
 # A blank response only returns None when required is False, so the default call cannot. The pair
 # below says that to a type checker; see the note above get_input's `if not self.required` return.
 @overload
@@ -210,20 +231,20 @@ def get_string(cleaners: CleanerArg = (StripCleaner()), validators: GetInputVali
     Convenience function to get a string value. Every parameter from ``prompt`` onwards is a
     keyword-only :class:`GetInput` option; most calls use one or two.
     """
-    use_validators: list[Any] = []
-    if min_len is not None or max_len is not None:
-        use_validators.append(LengthValidator(min_len=min_len, max_len=max_len))
+    gi = _build_string(cleaners, validators, min_len, max_len, prompt=prompt, required=required, default=default,
+                       default_str=default_str, hidden=hidden, retries=retries, commands=commands,
+                       error_callback=error_callback, convertor_error_fmt=convertor_error_fmt,
+                       validator_error_fmt=validator_error_fmt)
+    return gi.get_input()
 
-    if isinstance(validators, Validator):
-        use_validators.append(validators)
-    elif validators is not None:
-        use_validators.extend(put_in_a_list(validators))
 
-    result = GetInput(cleaners, None, use_validators, prompt=prompt, required=required, default=default,
-                      default_str=default_str, hidden=hidden, retries=retries, commands=commands,
-                      error_callback=error_callback, convertor_error_fmt=convertor_error_fmt,
-                      validator_error_fmt=validator_error_fmt).get_input()
-    return result
+def _build_int(cleaners: CleanerArg, validators: GetInputValidatorArg, minimum: int | None, maximum: int | None,
+               base: int, **options: Any) -> GetInput:
+    """
+    Make the :class:`GetInput` :func:`get_int` asks with.
+    """
+    val_list = _add_range_validator(validators, minimum, maximum)
+    return GetInput(cleaners, IntConvertor(base=base), val_list, **options)
 
 
 @overload
@@ -284,13 +305,20 @@ def get_int(cleaners: CleanerArg = None, validators: GetInputValidatorArg = None
     of the `base` parameter. Every parameter from ``prompt`` onwards is a keyword-only
     :class:`GetInput` option; most calls use one or two.
     """
+    gi = _build_int(cleaners, validators, minimum, maximum, base, prompt=prompt, required=required, default=default,
+                    default_str=default_str, hidden=hidden, retries=retries, commands=commands,
+                    error_callback=error_callback, convertor_error_fmt=convertor_error_fmt,
+                    validator_error_fmt=validator_error_fmt)
+    return gi.get_input()
+
+
+def _build_float(cleaners: CleanerArg, validators: GetInputValidatorArg, minimum: float | None,
+                 maximum: float | None, **options: Any) -> GetInput:
+    """
+    Make the :class:`GetInput` :func:`get_float` asks with.
+    """
     val_list = _add_range_validator(validators, minimum, maximum)
-    result = GetInput(cleaners, IntConvertor(base=base), val_list, prompt=prompt, required=required,
-                      default=default, default_str=default_str, hidden=hidden, retries=retries,
-                      commands=commands, error_callback=error_callback,
-                      convertor_error_fmt=convertor_error_fmt,
-                      validator_error_fmt=validator_error_fmt).get_input()
-    return result
+    return GetInput(cleaners, FloatConvertor(), val_list, **options)
 
 
 @overload
@@ -348,13 +376,18 @@ def get_float(cleaners: CleanerArg = None, validators: GetInputValidatorArg = No
     Convenience function to get a float value. Every parameter from ``prompt`` onwards is a
     keyword-only :class:`GetInput` option; most calls use one or two.
     """
-    val_list = _add_range_validator(validators, minimum, maximum)
-    result = GetInput(cleaners, FloatConvertor(), val_list, prompt=prompt, required=required,
-                      default=default, default_str=default_str, hidden=hidden, retries=retries,
-                      commands=commands, error_callback=error_callback,
-                      convertor_error_fmt=convertor_error_fmt,
-                      validator_error_fmt=validator_error_fmt).get_input()
-    return result
+    gi = _build_float(cleaners, validators, minimum, maximum, prompt=prompt, required=required, default=default,
+                      default_str=default_str, hidden=hidden, retries=retries, commands=commands,
+                      error_callback=error_callback, convertor_error_fmt=convertor_error_fmt,
+                      validator_error_fmt=validator_error_fmt)
+    return gi.get_input()
+
+
+def _build_boolean(cleaners: CleanerArg, validators: GetInputValidatorArg, **options: Any) -> GetInput:
+    """
+    Make the :class:`GetInput` :func:`get_boolean` asks with.
+    """
+    return GetInput(cleaners, BooleanConvertor(), validators, **options)
 
 
 @overload
@@ -408,12 +441,20 @@ def get_boolean(cleaners: CleanerArg = (StripCleaner()), validators: GetInputVal
     for `True` and `False`. Every parameter from ``prompt`` onwards is a keyword-only :class:`GetInput`
     option; most calls use one or two.
     """
-    result = GetInput(cleaners, BooleanConvertor(), validators, prompt=prompt, required=required,
-                      default=default, default_str=default_str, hidden=hidden, retries=retries,
-                      commands=commands, error_callback=error_callback,
-                      convertor_error_fmt=convertor_error_fmt,
-                      validator_error_fmt=validator_error_fmt).get_input()
-    return result
+    gi = _build_boolean(cleaners, validators, prompt=prompt, required=required, default=default,
+                        default_str=default_str, hidden=hidden, retries=retries, commands=commands,
+                        error_callback=error_callback, convertor_error_fmt=convertor_error_fmt,
+                        validator_error_fmt=validator_error_fmt)
+    return gi.get_input()
+
+
+def _build_date(cleaners: CleanerArg, validators: GetInputValidatorArg, minimum: datetime | None,
+                maximum: datetime | None, **options: Any) -> GetInput:
+    """
+    Make the :class:`GetInput` :func:`get_date` asks with.
+    """
+    val_list = _add_range_validator(validators, minimum, maximum)
+    return GetInput(cleaners, DateConvertor(), val_list, **options)
 
 
 @overload
@@ -472,13 +513,18 @@ def get_date(cleaners: CleanerArg = (StripCleaner()), validators: GetInputValida
     can be used to get both times and dates. Every parameter from ``prompt`` onwards is a keyword-only
     :class:`GetInput` option; most calls use one or two.
     """
-    val_list = _add_range_validator(validators, minimum, maximum)
-    result = GetInput(cleaners, DateConvertor(), val_list, prompt=prompt, required=required,
-                      default=default, default_str=default_str, hidden=hidden, retries=retries,
-                      commands=commands, error_callback=error_callback,
-                      convertor_error_fmt=convertor_error_fmt,
-                      validator_error_fmt=validator_error_fmt).get_input()
-    return result
+    gi = _build_date(cleaners, validators, minimum, maximum, prompt=prompt, required=required, default=default,
+                     default_str=default_str, hidden=hidden, retries=retries, commands=commands,
+                     error_callback=error_callback, convertor_error_fmt=convertor_error_fmt,
+                     validator_error_fmt=validator_error_fmt)
+    return gi.get_input()
+
+
+def _build_yes_no(cleaners: CleanerArg, validators: GetInputValidatorArg, **options: Any) -> GetInput:
+    """
+    Make the :class:`GetInput` :func:`get_yes_no` asks with.
+    """
+    return GetInput(cleaners, YesNoConvertor(), validators, **options)
 
 
 @overload
@@ -532,12 +578,34 @@ def get_yes_no(cleaners: CleanerArg = (StripCleaner()), validators: GetInputVali
     for `yes` and `no`. Every parameter from ``prompt`` onwards is a keyword-only :class:`GetInput`
     option; most calls use one or two.
     """
-    result = GetInput(cleaners, YesNoConvertor(), validators, prompt=prompt, required=required,
-                      default=default, default_str=default_str, hidden=hidden, retries=retries,
-                      commands=commands, error_callback=error_callback,
-                      convertor_error_fmt=convertor_error_fmt,
-                      validator_error_fmt=validator_error_fmt).get_input()
-    return result
+    gi = _build_yes_no(cleaners, validators, prompt=prompt, required=required, default=default,
+                       default_str=default_str, hidden=hidden, retries=retries, commands=commands,
+                       error_callback=error_callback, convertor_error_fmt=convertor_error_fmt,
+                       validator_error_fmt=validator_error_fmt)
+    return gi.get_input()
+
+
+def _build_money(symbol: str, separator: str, cleaners: CleanerArg, validators: GetInputValidatorArg,
+                 precision: int | None, rounding: str, **options: Any) -> GetInput:
+    """
+    Make the :class:`GetInput` :func:`get_money` asks with.
+    """
+    if symbol == "$":
+        pattern = r"^\$"
+    else:
+        pattern = "^" + symbol
+
+    symbol_cleaner = RegexCleaner(pattern, '', 1)
+    thousands_cleaner = RemoveCleaner(separator)
+    # Fixing: this was `list(cleaners)`, so get_money was the one get_* function that
+    # could not take a single cleaner -- get_money(cleaners=StripCleaner()) raised
+    # "'StripCleaner' object is not iterable" while every sibling accepted it, since
+    # they hand cleaners straight to compose, which copes with either. put_in_a_list
+    # is the helper the package already has for exactly this.
+    new_cleaners = put_in_a_list(cleaners) + [symbol_cleaner, thousands_cleaner]
+
+    convertor = DecimalConvertor(precision=precision, rounding=rounding)
+    return GetInput(new_cleaners, convertor, validators, **options)
 
 
 @overload
@@ -606,27 +674,35 @@ def get_money(symbol: str = "$", separator: str = ",", cleaners: CleanerArg = (S
     well -- so the documented way to ask for whole cents logged two spurious "unknown option"
     warnings on every call.
     """
-    if symbol == "$":
-        pattern = r"^\$"
-    else:
-        pattern = "^" + symbol
+    gi = _build_money(symbol, separator, cleaners, validators, precision, rounding, prompt=prompt,
+                      required=required, default=default, default_str=default_str, hidden=hidden, retries=retries,
+                      commands=commands, error_callback=error_callback, convertor_error_fmt=convertor_error_fmt,
+                      validator_error_fmt=validator_error_fmt)
+    return gi.get_input()
 
-    symbol_cleaner = RegexCleaner(pattern, '', 1)
-    thousands_cleaner = RemoveCleaner(separator)
-    # Fixing: this was `list(cleaners)`, so get_money was the one get_* function that
-    # could not take a single cleaner -- get_money(cleaners=StripCleaner()) raised
-    # "'StripCleaner' object is not iterable" while every sibling accepted it, since
-    # they hand cleaners straight to compose, which copes with either. put_in_a_list
-    # is the helper the package already has for exactly this.
-    new_cleaners = put_in_a_list(cleaners) + [symbol_cleaner, thousands_cleaner]
 
-    convertor = DecimalConvertor(precision=precision, rounding=rounding)
-    result = GetInput(new_cleaners, convertor, validators, prompt=prompt, required=required,
-                      default=default, default_str=default_str, hidden=hidden, retries=retries,
-                      commands=commands, error_callback=error_callback,
-                      convertor_error_fmt=convertor_error_fmt,
-                      validator_error_fmt=validator_error_fmt).get_input()
-    return result
+def _build_list(elem_get_input: GetInput | None, cleaners: CleanerArg, validators: GetInputValidatorArg,
+                value_error_str: str, delimiter: str, prompt: str | None, default: Any, **options: Any) -> GetInput:
+    """
+    Make the :class:`GetInput` :func:`get_list` asks with.
+    """
+    # The default prompt names the delimiter, so it cannot be a constant in the signature the way
+    # the other get_* functions' prompts are.
+    use_prompt = 'Enter a list of values (separated by "{}")'.format(delimiter) if prompt is None else prompt
+
+    if default is None or isstring(default):
+        default_val = default
+    # Fixing: was `collections.Iterable`, removed from the collections
+    # namespace in Python 3.10, so a non-string iterable default raised
+    # AttributeError on every supported version. input_utils.py already
+    # uses collections.abc for exactly this reason.
+    elif isinstance(default, collections.abc.Iterable):
+        default_val = (delimiter + ' ').join(default)
+    else:
+        default_val = str(default)
+
+    convertor = ListConvertor(value_error_str=value_error_str, delimiter=delimiter, elem_get_input=elem_get_input)
+    return GetInput(cleaners, convertor, validators, prompt=use_prompt, default=default_val, **options)
 
 
 @overload
@@ -699,26 +775,392 @@ def get_list(elem_get_input: GetInput | None = None, cleaners: CleanerArg = None
         result = get_list(prompt=prompt_str, elem_get_input=elem_gi, validators=list_validator, delimiter=":")
 
     """
-    # The default prompt names the delimiter, so it cannot be a constant in the signature the way
-    # the other get_* functions' prompts are.
-    use_prompt = 'Enter a list of values (separated by "{}")'.format(delimiter) if prompt is None else prompt
+    gi = _build_list(elem_get_input, cleaners, validators, value_error_str, delimiter, prompt, default,
+                     required=required, default_str=default_str, hidden=hidden, retries=retries, commands=commands,
+                     error_callback=error_callback, convertor_error_fmt=convertor_error_fmt,
+                     validator_error_fmt=validator_error_fmt)
+    return gi.get_input()
 
-    if default is None or isstring(default):
-        default_val = default
-    # Fixing: was `collections.Iterable`, removed from the collections
-    # namespace in Python 3.10, so a non-string iterable default raised
-    # AttributeError on every supported version. input_utils.py already
-    # uses collections.abc for exactly this reason.
-    elif isinstance(default, collections.abc.Iterable):
-        default_val = (delimiter + ' ').join(default)
-    else:
-        default_val = str(default)
 
-    convertor = ListConvertor(value_error_str=value_error_str, delimiter=delimiter, elem_get_input=elem_get_input)
-    gi = GetInput(cleaners, convertor, validators, prompt=use_prompt, required=required,
-                  default=default_val, default_str=default_str, hidden=hidden, retries=retries,
-                  commands=commands, error_callback=error_callback,
-                  convertor_error_fmt=convertor_error_fmt, validator_error_fmt=validator_error_fmt)
+##################################
+### Coroutine versions (async) ###
+##################################
+
+async def get_input_async(cleaners: CleanerArg = None, convertor: Convertor | None = None,
+                          validators: GetInputValidatorArg = None, *,
+                          prompt: str = '',
+                          required: bool = True,
+                          default: Any = None,
+                          default_str: str | None = None,
+                          hidden: bool = False,
+                          retries: int | None = None,
+                          commands: CommandsArg = None,
+                          error_callback: ErrorCallback = print_error,
+                          convertor_error_fmt: str = DEFAULT_CONVERTOR_ERROR,
+                          validator_error_fmt: str = DEFAULT_VALIDATOR_ERROR,
+                          input_source: AsyncInputSource | None = None) -> Any:
+    """
+    Coroutine version of :func:`get_input`, for getting a value inside an asyncio program without blocking its event
+    loop. Takes the same parameters as :func:`get_input`, and:
+
+    :param input_source: the async function to read each line with. See :meth:`GetInput.get_input_async`.
+
+    :return: the cleaned, converted, validated input, as for :func:`get_input`
+    """
+    gi = GetInput(cleaners, convertor, validators, prompt=prompt, required=required, default=default,
+                  default_str=default_str, hidden=hidden, retries=retries, commands=commands,
+                  error_callback=error_callback, convertor_error_fmt=convertor_error_fmt,
+                  validator_error_fmt=validator_error_fmt)
+    return await gi.get_input_async(input_source)
+
+
+@overload
+async def get_string_async(cleaners: CleanerArg = ..., validators: GetInputValidatorArg = ...,
+                           min_len: int | None = ..., max_len: int | None = ..., *,
+                           prompt: str = ..., required: Literal[True] = ..., default: Any = ...,
+                           default_str: str | None = ..., hidden: bool = ..., retries: int | None = ...,
+                           commands: CommandsArg = ..., error_callback: ErrorCallback = ...,
+                           convertor_error_fmt: str = ..., validator_error_fmt: str = ...,
+                           input_source: AsyncInputSource | None = ...) -> str: ...
+@overload
+async def get_string_async(cleaners: CleanerArg = ..., validators: GetInputValidatorArg = ...,
+                           min_len: int | None = ..., max_len: int | None = ..., *,
+                           prompt: str = ..., required: Literal[False], default: Any = ...,
+                           default_str: str | None = ..., hidden: bool = ..., retries: int | None = ...,
+                           commands: CommandsArg = ..., error_callback: ErrorCallback = ...,
+                           convertor_error_fmt: str = ..., validator_error_fmt: str = ...,
+                           input_source: AsyncInputSource | None = ...) -> str | None: ...
+async def get_string_async(cleaners: CleanerArg = (StripCleaner()), validators: GetInputValidatorArg = None,
+                           min_len: int | None = None, max_len: int | None = None, *,
+                           prompt: str = 'Enter some text',
+                           required: bool = True,
+                           default: Any = None,
+                           default_str: str | None = None,
+                           hidden: bool = False,
+                           retries: int | None = None,
+                           commands: CommandsArg = None,
+                           error_callback: ErrorCallback = print_error,
+                           convertor_error_fmt: str = DEFAULT_CONVERTOR_ERROR,
+                           validator_error_fmt: str = DEFAULT_VALIDATOR_ERROR,
+                           input_source: AsyncInputSource | None = None) -> str | None:
+    """
+    Coroutine version of :func:`get_string`, for getting a value inside an asyncio program without blocking its event
+    loop. Takes the same parameters as :func:`get_string`, and:
+
+    :param input_source: the async function to read each line with. See :meth:`GetInput.get_input_async`.
+
+    :return: the cleaned, converted, validated input, as for :func:`get_string`
+    """
+    gi = _build_string(cleaners, validators, min_len, max_len, prompt=prompt, required=required, default=default,
+                       default_str=default_str, hidden=hidden, retries=retries, commands=commands,
+                       error_callback=error_callback, convertor_error_fmt=convertor_error_fmt,
+                       validator_error_fmt=validator_error_fmt)
+    return await gi.get_input_async(input_source)
+
+
+@overload
+async def get_int_async(cleaners: CleanerArg = ..., validators: GetInputValidatorArg = ...,
+                        minimum: int | None = ..., maximum: int | None = ..., base: int = ..., *,
+                        prompt: str = ..., required: Literal[True] = ..., default: Any = ...,
+                        default_str: str | None = ..., hidden: bool = ..., retries: int | None = ...,
+                        commands: CommandsArg = ..., error_callback: ErrorCallback = ...,
+                        convertor_error_fmt: str = ..., validator_error_fmt: str = ...,
+                        input_source: AsyncInputSource | None = ...) -> int: ...
+@overload
+async def get_int_async(cleaners: CleanerArg = ..., validators: GetInputValidatorArg = ...,
+                        minimum: int | None = ..., maximum: int | None = ..., base: int = ..., *,
+                        prompt: str = ..., required: Literal[False], default: Any = ...,
+                        default_str: str | None = ..., hidden: bool = ..., retries: int | None = ...,
+                        commands: CommandsArg = ..., error_callback: ErrorCallback = ...,
+                        convertor_error_fmt: str = ..., validator_error_fmt: str = ...,
+                        input_source: AsyncInputSource | None = ...) -> int | None: ...
+async def get_int_async(cleaners: CleanerArg = None, validators: GetInputValidatorArg = None,
+                        minimum: int | None = None, maximum: int | None = None, base: int = 10, *,
+                        prompt: str = 'Enter a whole (integer) number',
+                        required: bool = True,
+                        default: Any = None,
+                        default_str: str | None = None,
+                        hidden: bool = False,
+                        retries: int | None = None,
+                        commands: CommandsArg = None,
+                        error_callback: ErrorCallback = print_error,
+                        convertor_error_fmt: str = DEFAULT_CONVERTOR_ERROR,
+                        validator_error_fmt: str = DEFAULT_VALIDATOR_ERROR,
+                        input_source: AsyncInputSource | None = None) -> int | None:
+    """
+    Coroutine version of :func:`get_int`, for getting a value inside an asyncio program without blocking its event
+    loop. Takes the same parameters as :func:`get_int`, and:
+
+    :param input_source: the async function to read each line with. See :meth:`GetInput.get_input_async`.
+
+    :return: the cleaned, converted, validated input, as for :func:`get_int`
+    """
+    gi = _build_int(cleaners, validators, minimum, maximum, base, prompt=prompt, required=required, default=default,
+                    default_str=default_str, hidden=hidden, retries=retries, commands=commands,
+                    error_callback=error_callback, convertor_error_fmt=convertor_error_fmt,
+                    validator_error_fmt=validator_error_fmt)
+    return await gi.get_input_async(input_source)
+
 
-    result = gi.get_input()
-    return result
+@overload
+async def get_float_async(cleaners: CleanerArg = ..., validators: GetInputValidatorArg = ...,
+                          minimum: float | None = ..., maximum: float | None = ..., *,
+                          prompt: str = ..., required: Literal[True] = ..., default: Any = ...,
+                          default_str: str | None = ..., hidden: bool = ..., retries: int | None = ...,
+                          commands: CommandsArg = ..., error_callback: ErrorCallback = ...,
+                          convertor_error_fmt: str = ..., validator_error_fmt: str = ...,
+                          input_source: AsyncInputSource | None = ...) -> float: ...
+@overload
+async def get_float_async(cleaners: CleanerArg = ..., validators: GetInputValidatorArg = ...,
+                          minimum: float | None = ..., maximum: float | None = ..., *,
+                          prompt: str = ..., required: Literal[False], default: Any = ...,
+                          default_str: str | None = ..., hidden: bool = ..., retries: int | None = ...,
+                          commands: CommandsArg = ..., error_callback: ErrorCallback = ...,
+                          convertor_error_fmt: str = ..., validator_error_fmt: str = ...,
+                          input_source: AsyncInputSource | None = ...) -> float | None: ...
+async def get_float_async(cleaners: CleanerArg = None, validators: GetInputValidatorArg = None,
+                          minimum: float | None = None, maximum: float | None = None, *,
+                          prompt: str = 'Enter an real (floating point) number',
+                          required: bool = True,
+                          default: Any = None,
+                          default_str: str | None = None,
+                          hidden: bool = False,
+                          retries: int | None = None,
+                          commands: CommandsArg = None,
+                          error_callback: ErrorCallback = print_error,
+                          convertor_error_fmt: str = DEFAULT_CONVERTOR_ERROR,
+                          validator_error_fmt: str = DEFAULT_VALIDATOR_ERROR,
+                          input_source: AsyncInputSource | None = None) -> float | None:
+    """
+    Coroutine version of :func:`get_float`, for getting a value inside an asyncio program without blocking its event
+    loop. Takes the same parameters as :func:`get_float`, and:
+
+    :param input_source: the async function to read each line with. See :meth:`GetInput.get_input_async`.
+
+    :return: the cleaned, converted, validated input, as for :func:`get_float`
+    """
+    gi = _build_float(cleaners, validators, minimum, maximum, prompt=prompt, required=required, default=default,
+                      default_str=default_str, hidden=hidden, retries=retries, commands=commands,
+                      error_callback=error_callback, convertor_error_fmt=convertor_error_fmt,
+                      validator_error_fmt=validator_error_fmt)
+    return await gi.get_input_async(input_source)
+
+
+@overload
+async def get_boolean_async(cleaners: CleanerArg = ..., validators: GetInputValidatorArg = ..., *,
+                            prompt: str = ..., required: Literal[True] = ..., default: Any = ...,
+                            default_str: str | None = ..., hidden: bool = ..., retries: int | None = ...,
+                            commands: CommandsArg = ..., error_callback: ErrorCallback = ...,
+                            convertor_error_fmt: str = ..., validator_error_fmt: str = ...,
+                            input_source: AsyncInputSource | None = ...) -> bool: ...
+@overload
+async def get_boolean_async(cleaners: CleanerArg = ..., validators: GetInputValidatorArg = ..., *,
+                            prompt: str = ..., required: Literal[False], default: Any = ...,
+                            default_str: str | None = ..., hidden: bool = ..., retries: int | None = ...,
+                            commands: CommandsArg = ..., error_callback: ErrorCallback = ...,
+                            convertor_error_fmt: str = ..., validator_error_fmt: str = ...,
+                            input_source: AsyncInputSource | None = ...) -> bool | None: ...
+async def get_boolean_async(cleaners: CleanerArg = (StripCleaner()), validators: GetInputValidatorArg = None, *,
+                            prompt: str = 'Enter true or false',
+                            required: bool = True,
+                            default: Any = None,
+                            default_str: str | None = None,
+                            hidden: bool = False,
+                            retries: int | None = None,
+                            commands: CommandsArg = None,
+                            error_callback: ErrorCallback = print_error,
+                            convertor_error_fmt: str = DEFAULT_CONVERTOR_ERROR,
+                            validator_error_fmt: str = DEFAULT_VALIDATOR_ERROR,
+                            input_source: AsyncInputSource | None = None) -> bool | None:
+    """
+    Coroutine version of :func:`get_boolean`, for getting a value inside an asyncio program without blocking its event
+    loop. Takes the same parameters as :func:`get_boolean`, and:
+
+    :param input_source: the async function to read each line with. See :meth:`GetInput.get_input_async`.
+
+    :return: the cleaned, converted, validated input, as for :func:`get_boolean`
+    """
+    gi = _build_boolean(cleaners, validators, prompt=prompt, required=required, default=default,
+                        default_str=default_str, hidden=hidden, retries=retries, commands=commands,
+                        error_callback=error_callback, convertor_error_fmt=convertor_error_fmt,
+                        validator_error_fmt=validator_error_fmt)
+    return await gi.get_input_async(input_source)
+
+
+@overload
+async def get_date_async(cleaners: CleanerArg = ..., validators: GetInputValidatorArg = ...,
+                         minimum: datetime | None = ..., maximum: datetime | None = ..., *,
+                         prompt: str = ..., required: Literal[True] = ..., default: Any = ...,
+                         default_str: str | None = ..., hidden: bool = ..., retries: int | None = ...,
+                         commands: CommandsArg = ..., error_callback: ErrorCallback = ...,
+                         convertor_error_fmt: str = ..., validator_error_fmt: str = ...,
+                         input_source: AsyncInputSource | None = ...) -> datetime: ...
+@overload
+async def get_date_async(cleaners: CleanerArg = ..., validators: GetInputValidatorArg = ...,
+                         minimum: datetime | None = ..., maximum: datetime | None = ..., *,
+                         prompt: str = ..., required: Literal[False], default: Any = ...,
+                         default_str: str | None = ..., hidden: bool = ..., retries: int | None = ...,
+                         commands: CommandsArg = ..., error_callback: ErrorCallback = ...,
+                         convertor_error_fmt: str = ..., validator_error_fmt: str = ...,
+                         input_source: AsyncInputSource | None = ...) -> datetime | None: ...
+async def get_date_async(cleaners: CleanerArg = (StripCleaner()), validators: GetInputValidatorArg = None,
+                         minimum: datetime | None = None, maximum: datetime | None = None, *,
+                         prompt: str = 'Enter a date',
+                         required: bool = True,
+                         default: Any = None,
+                         default_str: str | None = None,
+                         hidden: bool = False,
+                         retries: int | None = None,
+                         commands: CommandsArg = None,
+                         error_callback: ErrorCallback = print_error,
+                         convertor_error_fmt: str = DEFAULT_CONVERTOR_ERROR,
+                         validator_error_fmt: str = DEFAULT_VALIDATOR_ERROR,
+                         input_source: AsyncInputSource | None = None) -> datetime | None:
+    """
+    Coroutine version of :func:`get_date`, for getting a value inside an asyncio program without blocking its event
+    loop. Takes the same parameters as :func:`get_date`, and:
+
+    :param input_source: the async function to read each line with. See :meth:`GetInput.get_input_async`.
+
+    :return: the cleaned, converted, validated input, as for :func:`get_date`
+    """
+    gi = _build_date(cleaners, validators, minimum, maximum, prompt=prompt, required=required, default=default,
+                     default_str=default_str, hidden=hidden, retries=retries, commands=commands,
+                     error_callback=error_callback, convertor_error_fmt=convertor_error_fmt,
+                     validator_error_fmt=validator_error_fmt)
+    return await gi.get_input_async(input_source)
+
+
+@overload
+async def get_yes_no_async(cleaners: CleanerArg = ..., validators: GetInputValidatorArg = ..., *,
+                           prompt: str = ..., required: Literal[True] = ..., default: Any = ...,
+                           default_str: str | None = ..., hidden: bool = ..., retries: int | None = ...,
+                           commands: CommandsArg = ..., error_callback: ErrorCallback = ...,
+                           convertor_error_fmt: str = ..., validator_error_fmt: str = ...,
+                           input_source: AsyncInputSource | None = ...) -> str: ...
+@overload
+async def get_yes_no_async(cleaners: CleanerArg = ..., validators: GetInputValidatorArg = ..., *,
+                           prompt: str = ..., required: Literal[False], default: Any = ...,
+                           default_str: str | None = ..., hidden: bool = ..., retries: int | None = ...,
+                           commands: CommandsArg = ..., error_callback: ErrorCallback = ...,
+                           convertor_error_fmt: str = ..., validator_error_fmt: str = ...,
+                           input_source: AsyncInputSource | None = ...) -> str | None: ...
+async def get_yes_no_async(cleaners: CleanerArg = (StripCleaner()), validators: GetInputValidatorArg = None, *,
+                           prompt: str = 'Enter yes or no',
+                           required: bool = True,
+                           default: Any = None,
+                           default_str: str | None = None,
+                           hidden: bool = False,
+                           retries: int | None = None,
+                           commands: CommandsArg = None,
+                           error_callback: ErrorCallback = print_error,
+                           convertor_error_fmt: str = DEFAULT_CONVERTOR_ERROR,
+                           validator_error_fmt: str = DEFAULT_VALIDATOR_ERROR,
+                           input_source: AsyncInputSource | None = None) -> str | None:
+    """
+    Coroutine version of :func:`get_yes_no`, for getting a value inside an asyncio program without blocking its event
+    loop. Takes the same parameters as :func:`get_yes_no`, and:
+
+    :param input_source: the async function to read each line with. See :meth:`GetInput.get_input_async`.
+
+    :return: the cleaned, converted, validated input, as for :func:`get_yes_no`
+    """
+    gi = _build_yes_no(cleaners, validators, prompt=prompt, required=required, default=default,
+                       default_str=default_str, hidden=hidden, retries=retries, commands=commands,
+                       error_callback=error_callback, convertor_error_fmt=convertor_error_fmt,
+                       validator_error_fmt=validator_error_fmt)
+    return await gi.get_input_async(input_source)
+
+
+@overload
+async def get_money_async(symbol: str = ..., separator: str = ..., cleaners: CleanerArg = ...,
+                          validators: GetInputValidatorArg = ..., precision: int | None = ...,
+                          rounding: str = ..., *,
+                          prompt: str = ..., required: Literal[True] = ..., default: Any = ...,
+                          default_str: str | None = ..., hidden: bool = ..., retries: int | None = ...,
+                          commands: CommandsArg = ..., error_callback: ErrorCallback = ...,
+                          convertor_error_fmt: str = ..., validator_error_fmt: str = ...,
+                          input_source: AsyncInputSource | None = ...) -> Decimal: ...
+@overload
+async def get_money_async(symbol: str = ..., separator: str = ..., cleaners: CleanerArg = ...,
+                          validators: GetInputValidatorArg = ..., precision: int | None = ...,
+                          rounding: str = ..., *,
+                          prompt: str = ..., required: Literal[False], default: Any = ...,
+                          default_str: str | None = ..., hidden: bool = ..., retries: int | None = ...,
+                          commands: CommandsArg = ..., error_callback: ErrorCallback = ...,
+                          convertor_error_fmt: str = ..., validator_error_fmt: str = ...,
+                          input_source: AsyncInputSource | None = ...) -> Decimal | None: ...
+async def get_money_async(symbol: str = "$", separator: str = ",", cleaners: CleanerArg = (StripCleaner(),),
+                          validators: GetInputValidatorArg = None, precision: int | None = None,
+                          rounding: str = "ROUND_HALF_UP", *,
+                          prompt: str = 'Enter an amount of money',
+                          required: bool = True,
+                          default: Any = None,
+                          default_str: str | None = None,
+                          hidden: bool = False,
+                          retries: int | None = None,
+                          commands: CommandsArg = None,
+                          error_callback: ErrorCallback = print_error,
+                          convertor_error_fmt: str = DEFAULT_CONVERTOR_ERROR,
+                          validator_error_fmt: str = DEFAULT_VALIDATOR_ERROR,
+                          input_source: AsyncInputSource | None = None) -> Decimal | None:
+    """
+    Coroutine version of :func:`get_money`, for getting a value inside an asyncio program without blocking its event
+    loop. Takes the same parameters as :func:`get_money`, and:
+
+    :param input_source: the async function to read each line with. See :meth:`GetInput.get_input_async`.
+
+    :return: the cleaned, converted, validated input, as for :func:`get_money`
+    """
+    gi = _build_money(symbol, separator, cleaners, validators, precision, rounding, prompt=prompt,
+                      required=required, default=default, default_str=default_str, hidden=hidden, retries=retries,
+                      commands=commands, error_callback=error_callback, convertor_error_fmt=convertor_error_fmt,
+                      validator_error_fmt=validator_error_fmt)
+    return await gi.get_input_async(input_source)
+
+
+@overload
+async def get_list_async(elem_get_input: GetInput | None = ..., cleaners: CleanerArg = ...,
+                         validators: GetInputValidatorArg = ..., value_error_str: str = ...,
+                         delimiter: str = ..., *,
+                         prompt: str | None = ..., required: Literal[True] = ..., default: Any = ...,
+                         default_str: str | None = ..., hidden: bool = ..., retries: int | None = ...,
+                         commands: CommandsArg = ..., error_callback: ErrorCallback = ...,
+                         convertor_error_fmt: str = ..., validator_error_fmt: str = ...,
+                         input_source: AsyncInputSource | None = ...) -> list[Any]: ...
+@overload
+async def get_list_async(elem_get_input: GetInput | None = ..., cleaners: CleanerArg = ...,
+                         validators: GetInputValidatorArg = ..., value_error_str: str = ...,
+                         delimiter: str = ..., *,
+                         prompt: str | None = ..., required: Literal[False], default: Any = ...,
+                         default_str: str | None = ..., hidden: bool = ..., retries: int | None = ...,
+                         commands: CommandsArg = ..., error_callback: ErrorCallback = ...,
+                         convertor_error_fmt: str = ..., validator_error_fmt: str = ...,
+                         input_source: AsyncInputSource | None = ...) -> list[Any] | None: ...
+async def get_list_async(elem_get_input: GetInput | None = None, cleaners: CleanerArg = None,
+                         validators: GetInputValidatorArg = None, value_error_str: str = 'list of values',
+                         delimiter: str = ',', *,
+                         prompt: str | None = None,
+                         required: bool = True,
+                         default: Any = None,
+                         default_str: str | None = None,
+                         hidden: bool = False,
+                         retries: int | None = None,
+                         commands: CommandsArg = None,
+                         error_callback: ErrorCallback = print_error,
+                         convertor_error_fmt: str = DEFAULT_CONVERTOR_ERROR,
+                         validator_error_fmt: str = DEFAULT_VALIDATOR_ERROR,
+                         input_source: AsyncInputSource | None = None) -> list[Any] | None:
+    """
+    Coroutine version of :func:`get_list`, for getting a value inside an asyncio program without blocking its event
+    loop. Takes the same parameters as :func:`get_list`, and:
+
+    :param input_source: the async function to read each line with. See :meth:`GetInput.get_input_async`.
+
+    :return: the cleaned, converted, validated input, as for :func:`get_list`
+    """
+    gi = _build_list(elem_get_input, cleaners, validators, value_error_str, delimiter, prompt, default,
+                     required=required, default_str=default_str, hidden=hidden, retries=retries, commands=commands,
+                     error_callback=error_callback, convertor_error_fmt=convertor_error_fmt,
+                     validator_error_fmt=validator_error_fmt)
+    return await gi.get_input_async(input_source)
@@ -10,10 +10,12 @@ Copyright: Len Wanger, 2017-2026
 
 from __future__ import annotations
 
-import prettytable
-
 from collections.abc import Iterable, Iterator, Sequence
-from typing import Any, Callable, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
+
+if TYPE_CHECKING:
+    # Imported where it is used instead: see make_pretty_table.
+    import prettytable
 
 #: Element type of the sequence handed to :func:`renumerate`, so that the yielded items
 #: keep whatever type went in rather than degrading to ``Any``.
@@ -64,6 +66,10 @@ def make_pretty_table(rows: Iterable[Sequence[Any]], second_col_name: str = 'nam
     :param sort_by_second_col: sort by the second column if True, otherwise leave in order from rows.
     :return: a prettytable for the table.
     """
+    # Imported here rather than at the top of the module, which every cleaner imports: a program
+    # that never builds a table should not pay for loading prettytable.
+    import prettytable
+
     x = prettytable.PrettyTable(['id', second_col_name])
 
     for row in rows:
@@ -100,6 +106,10 @@ def put_in_a_list(values: Any) -> list[Any]:
 
     if values is None:
         result = []
+    elif type(values) in (list, tuple):
+        # The common case, answered without the Iterable check below: isinstance against an
+        # abstract base class is slow, and Table copies every row's values through here.
+        result = list(values)
     elif isstring(values):
         result = [values]
     elif isinstance(values, Iterable):  # list or other iterable
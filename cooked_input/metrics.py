@@ -0,0 +1,242 @@
+"""
+Timings and counts for the clean, convert and validate pipeline.
+
+Nothing is measured until a :class:`PipelineMetrics` is turned on with :func:`set_metrics`. From then on every
+:class:`GetInput` -- and so every ``get_*`` function and :class:`Table` -- records into it: the time each cleaner,
+convertor and validator takes, how many values fail conversion or validation, how many retries each prompt took
+and how long was spent waiting for the user to answer. With no metrics on, the pipeline is the one built without
+any of this, so leaving it off costs nothing.
+
+Metrics may be recorded from several threads at once, as when one :class:`GetInput` is shared by a thread pool:
+each histogram and each :class:`PipelineMetrics` holds a lock that its updates are made under.
+
+Author: Len Wanger
+Copyright: Len Wanger, 2017-2026
+"""
+
+from __future__ import annotations
+
+import bisect
+import itertools
+import threading
+from collections import Counter
+from typing import Any
+
+# Histogram buckets are powers of two nanoseconds: bucket i counts times under 2**i ns. 48 buckets reach past 3 days.
+_NUM_BUCKETS = 48
+
+
+class LatencyHistogram(object):
+    """
+    A histogram of times, in buckets doubling in width (under 1ns, under 2ns, under 4ns and so on.)
+
+    Recording a time is an increment of a list entry, so a histogram costs the same however many times it holds.
+    The ``count``, ``total``, ``min`` and ``max`` are exact; percentiles are only as exact as the buckets -- the
+    upper bound of the bucket holding the percentile, so at most twice the real value.
+    """
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Forget every time recorded.
+
+        :return: None
+        """
+        with self._lock:
+            self.count = 0
+            self.total = 0.0
+            self.min: float | None = None
+            self.max: float | None = None
+            self._buckets = [0] * _NUM_BUCKETS
+
+    def record(self, seconds: float) -> None:
+        """
+        :param seconds: the time to record, in seconds
+
+        :return: None
+        """
+        bucket = min(int(seconds * 1e9).bit_length(), _NUM_BUCKETS - 1)
+
+        # Every += here is a read and a write, which another thread can come between.
+        with self._lock:
+            self.count += 1
+            self.total += seconds
+
+            if self.min is None or seconds < self.min:
+                self.min = seconds
+            if self.max is None or seconds > self.max:
+                self.max = seconds
+
+            self._buckets[bucket] += 1
+
+    @property
+    def mean(self) -> float | None:
+        """
+        the mean of the times recorded, or **None** if there are none
+        """
+        return self.total / self.count if self.count else None
+
+    def percentile(self, fraction: float) -> float | None:
+        """
+        :param fraction: the fraction of the times recorded to be under the value returned, such as **0.99** for
+            the 99th percentile
+
+        :return: the time, in seconds, that ``fraction`` of the times recorded are under (to within the bucket
+            width, and no more than ``max``), or **None** if there are none
+        """
+        if not 0.0 <= fraction <= 1.0:
+            raise ValueError('LatencyHistogram.percentile: fraction must be from 0 to 1 -- got {!r}'.format(fraction))
+
+        with self._lock:
+            count, maximum, cumulative = self.count, self.max, list(itertools.accumulate(self._buckets))
+
+        if not count or maximum is None:
+            return None
+
+        # The first bucket by which fraction of the times have been counted. As fraction is at most 1 it is always
+        # found, and as the count before it falls short, it holds times itself -- but for fraction 0, which wants
+        # the first bucket holding any, hence wanting at least 1.
+        i = bisect.bisect_left(cumulative, max(fraction * count, 1))
+        return min((1 << i) / 1e9, maximum)
+
+    def buckets(self) -> list[tuple[float, int]]:
+        """
+        :return: a list of ``(upper_bound, count)`` tuples for the buckets holding any times, in order: ``count``
+            times were recorded under ``upper_bound`` seconds, and over the bound of the bucket before.
+        """
+        with self._lock:
+            buckets = list(self._buckets)
+
+        return [((1 << i) / 1e9, bucket_count) for i, bucket_count in enumerate(buckets) if bucket_count]
+
+    def __repr__(self) -> str:
+        return 'LatencyHistogram(count={}, mean={!r}, max={!r})'.format(self.count, self.mean, self.max)
+
+
+class PipelineMetrics(object):
+    """
+    Timings and counts for the clean, convert and validate pipeline, recorded while turned on with
+    :func:`set_metrics`::
+
+        metrics = ci.PipelineMetrics()
+        ci.set_metrics(metrics)
+        ...
+        print(metrics.report())
+
+    The attributes hold what has been recorded:
+
+        ``stages``: a dictionary of :class:`LatencyHistogram`, keyed by ``(kind, name)`` -- where kind is
+        **'cleaner'**, **'convertor'** or **'validator'** and name is the class (or function) name of the stage.
+        Stages of the same kind and name share a histogram, so ``('validator', 'RangeValidator')`` holds the times
+        for every **RangeValidator** used.
+
+        ``values``: the number of values run through the pipeline
+
+        ``conversion_failures``: the number of values the convertor rejected
+
+        ``validation_failures``: the number of values a validator rejected
+
+        ``retries``: a **Counter** of prompts by the number of retries they took: ``retries[0]`` prompts were
+        answered first time, ``retries[2]`` took two rejected answers first, and so on. Prompts that end by
+        running out of retries, or by a command cancelling them, are counted too.
+
+        ``wait``: a :class:`LatencyHistogram` of the time spent waiting for each answer to be typed
+
+    The counts are changed under a lock (as are the histograms, under their own), so threads can record into the
+    same metrics at once.
+    """
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.stages: dict[tuple[str, str], LatencyHistogram] = {}
+        self.wait = LatencyHistogram()
+        self.values = 0
+        self.conversion_failures = 0
+        self.validation_failures = 0
+        self.retries: Counter[int] = Counter()
+
+    def stage(self, kind: str, name: str) -> LatencyHistogram:
+        """
+        :param kind: **'cleaner'**, **'convertor'** or **'validator'**
+        :param name: the name of the stage
+
+        :return: the histogram for the stage, added if it is not there yet
+        """
+        try:
+            return self.stages[(kind, name)]
+        except KeyError:
+            pass
+
+        # Looked for again under the lock: another thread may have added it since, and two pipelines sharing a
+        # stage must share its histogram.
+        with self._lock:
+            return self.stages.setdefault((kind, name), LatencyHistogram())
+
+    def reset(self) -> None:
+        """
+        Forget everything recorded. The histograms are emptied rather than thrown away, as the pipelines built while
+        these metrics were on still hold them.
+
+        :return: None
+        """
+        with self._lock:
+            for histogram in self.stages.values():
+                histogram.reset()
+
+            self.values = 0
+            self.conversion_failures = 0
+            self.validation_failures = 0
+            self.retries.clear()
+
+        self.wait.reset()
+
+    @property
+    def prompts(self) -> int:
+        """
+        the number of prompts recorded
+        """
+        with self._lock:
+            return sum(self.retries.values())
+
+    def report(self) -> str:
+        """
+        :return: a summary of what has been recorded, as text for printing
+        """
+        lines = ['{:<34} {:>9} {:>10} {:>10} {:>10}'.format('stage', 'count', 'mean us', 'p99 us', 'max us')]
+        with self._lock:    # a stage added by another thread part way through would upset the sort
+            timed = sorted(self.stages.items()) + [(('wait', 'user'), self.wait)]
+            retries = sorted(self.retries.items())
+
+        for (kind, name), histogram in timed:
+            if histogram.count:
+                lines.append('{:<34} {:>9,} {:>10.2f} {:>10.2f} {:>10.2f}'.format(
+                    '{} {}'.format(kind, name)[:34], histogram.count, _micros(histogram.mean),
+                    _micros(histogram.percentile(0.99)), _micros(histogram.max)))
+
+        lines.append('')
+        lines.append('values: {:,}  conversion failures: {:,}  validation failures: {:,}'.format(
+            self.values, self.conversion_failures, self.validation_failures))
+        lines.append('prompts: {:,}  retries per prompt: {}'.format(
+            sum(count for _, count in retries), ', '.join('{}: {:,}'.format(k, v) for k, v in retries) or '-'))
+        return '\n'.join(lines)
+
+    def __repr__(self) -> str:
+        return 'PipelineMetrics(values={}, conversion_failures={}, validation_failures={}, prompts={})'.format(
+            self.values, self.conversion_failures, self.validation_failures, self.prompts)
+
+
+def _micros(seconds: float | None) -> float:
+    # report() only shows histograms holding at least one time, so seconds is never really None.
+    return (seconds or 0.0) * 1e6
+
+
+def stage_name(stage: Any) -> str:
+    """
+    :param stage: a cleaner, convertor or validator
+
+    :return: the name to record the stage's times under: its ``__name__`` for a function, otherwise the name of
+        its class
+    """
+    name = getattr(stage, '__name__', None)
+    return name if isinstance(name, str) else type(stage).__name__
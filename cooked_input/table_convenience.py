@@ -1,7 +1,7 @@
 """
 Convenience functions for building tables and menus.
 
-These wrap the :class:`Table` machinery in ``get_table.py``: ``create_rows`` and
+These wrap the :class:`Table` machinery in ``get_table.py``: ``create_rows``, ``iter_rows`` and
 ``create_table`` build a table from a list of objects or dicts, ``show_table`` prints one, and
 ``get_table_input`` and ``get_menu`` put one on screen and return the choice. Most users need
 nothing else.
@@ -18,13 +18,15 @@ Copyright: Len Wanger, 2017-2026
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping, Sequence
+import operator
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from typing import Any
 
 from ._typing import CommandsArg, ErrorCallback, ItemFilter, RowAction
 from .error_callbacks import print_error, DEFAULT_CONVERTOR_ERROR, DEFAULT_VALIDATOR_ERROR
 from .get_table import Table, TableItem, TableStyle, return_tag_action
-from .get_table import RULE_NONE, TABLE_ADD_NONE, TABLE_RETURN_TABLE_ITEM
+from .get_table import RULE_NONE, TABLE_ADD_NONE, TABLE_ITEM_DEFAULT, TABLE_RETURN_TABLE_ITEM, _table_item
+from .input_utils import put_in_a_list
 # GetInputCommand is not used in the code below, only in the ``CommandsArg`` annotation -- but
 # that alias leaves the class name quoted (see ``_typing``), and a quoted forward reference is
 # resolved in the module that *uses* the alias. get_table.py carries this same import for the
@@ -33,9 +35,106 @@ from .get_table import RULE_NONE, TABLE_ADD_NONE, TABLE_RETURN_TABLE_ITEM
 from .get_input import GetInputCommand  # noqa: F401
 
 
+def _values_getter(item: Any, fields: Sequence[str]) -> Callable[[Any], Sequence[Any]]:
+    """
+    Make the function :func:`iter_rows` uses to get the field values from each item, choosing how to get them from
+    the first item. See :func:`create_rows` for how.
+
+    :param item: the first item
+    :param fields: the names of the fields
+
+    :return: a function returning an item's field values, in the order of ``fields``
+    """
+    num_fields = len(fields)
+
+    if hasattr(item, fields[0]):
+        getter = operator.attrgetter(*fields)
+    elif isinstance(item, dict):
+        item_getter = operator.itemgetter(*fields)
+
+        def getter(item: Any) -> Any:
+            try:
+                return item_getter(item)
+            except KeyError:
+                return tuple(item.get(name) for name in fields)     # a missing field is None, as with get
+    elif hasattr(item, '__getitem__'):
+        def get_first_values(item: Any) -> Sequence[Any]:
+            if len(item) < num_fields:
+                raise RuntimeError(
+                    'create_rows cannot fetch field values - getattr, get, and __getitem__ all failed.')
+            return item[:num_fields]
+
+        return get_first_values
+    else:
+        raise RuntimeError('create_rows cannot access data - item needs one of getattr, get, or __getitem__ defined.')
+
+    if num_fields == 1:
+        # attrgetter and itemgetter return the value itself, rather than a tuple, for one field
+        return lambda item: (getter(item),)
+
+    return getter
+
+
+def iter_rows(items: Iterable[Any] | Mapping[Any, Any], fields: Sequence[str],
+              gen_tags: bool | None = None, item_data: dict[str, Any] | None = None,
+              add_item_to_item_data: bool = False, share_item_data: bool = False) -> Iterator[TableItem]:
+    """
+    Make a TableItem for each item in an iterable of objects, one at a time.
+
+    :param items: iterable containing items for the table.
+    :param fields: list of field/attribute names to use as column values for each item.
+    :param gen_tags: if **True** will generate sequentially numbered tags for table items, if False (default) uses
+            first column value of each item for the row's tag.
+    :param item_data: An optional dictionary to be copied and  attached to the :class:`TableItem` for the row.
+    :param add_item_to_item_data: if **True** ``item_data['item']`` is set to `item`.
+    :param share_item_data: if **True** every row gets the same copy of ``item_data``.
+
+    :return: a generator of table items (:class:`TableItem`)
+
+    The same as :func:`create_rows`, which has the details, but a generator: the items are read, and the table items
+    made, as they are asked for. ``items`` is only read once, so a query or a generator is fine.
+    """
+    if share_item_data and add_item_to_item_data:
+        raise ValueError('iter_rows: share_item_data cannot be used with add_item_to_item_data, as every row has '
+                         'its own item in item_data')
+
+    if isinstance(items, dict):
+        use_items = items.values()
+    else:
+        use_items = items
+
+    shared_item_data = None if item_data is None else dict(item_data)
+    get_values = None
+
+    for item in use_items:
+        # How to get the values is worked out from the first item, once, rather than tested again
+        # for every one. Some iterables can only be read once (generators and some database
+        # queries), so it is done in the loop rather than by peeking ahead.
+        if get_values is None:
+            get_values = _values_getter(item, fields)
+
+        row_data = get_values(item)
+
+        if add_item_to_item_data:
+            use_item_data = {} if item_data is None else dict(item_data)
+            use_item_data['item'] = item
+        elif share_item_data or item_data is None:
+            use_item_data = shared_item_data
+        else:
+            use_item_data = dict(item_data)
+
+        # _table_item rather than TableItem(...): the same row, without the keyword arguments and
+        # default handling of a constructor call -- which on a big table is much of the time taken.
+        if gen_tags is True:
+            yield _table_item(put_in_a_list(row_data), None, TABLE_ITEM_DEFAULT, use_item_data, False, True)
+        else:
+            yield _table_item(put_in_a_list(row_data[1:]), row_data[0], TABLE_ITEM_DEFAULT, use_item_data,
+                              False, True)
+
+
 def create_rows(items: Iterable[Any] | Mapping[Any, Any], fields: Sequence[str],
                 gen_tags: bool | None = None, item_data: dict[str, Any] | None = None,
-                add_item_to_item_data: bool = False) -> list[TableItem]:
+                add_item_to_item_data: bool = False, share_item_data: bool = False) -> list[TableItem]:
     """
     Create a list of TableItems from an iterable (items) of objects
 
@@ -45,6 +144,8 @@ def create_rows(items: Iterable[Any] | Mapping[Any, Any], fields: Sequence[str],
             first column value of each item for the row's tag.
     :param item_data: An optional dictionary to be copied and  attached to the :class:`TableItem` for the row.
     :param add_item_to_item_data: if **True** ``item_data['item']`` is set to `item`.
+    :param share_item_data: if **True** every row gets the same copy of ``item_data`` rather than a copy of its own.
+        See below.
 
     :return: List[TableItem] of  table items (:class:`TableItem`)
 
@@ -90,68 +191,17 @@ def create_rows(items: Iterable[Any] | Mapping[Any, Any], fields: Sequence[str],
         rows = create_rows(people, ['last', 'first', 'shoe_size'])
         Table(rows, ['First', 'Shoe Size'], tag_str='Last').show_table()
 
-    ``create_rows`` is called by :func:`create_table` to create the table rows.
-    """
-    tis = []
-    GET_ATTR, GET, GET_ITEM = range(3)
-    fetch_method = None
-
-    """
-    This is a goofy way of doing things, and it would be a lot cleaner to check the types (Iterable, Mapping, etc.) But
-    you can't do that in legacy Python (e.g. v2.7) as there is no Typing module. This will be cleaned this up when legacy 
-    Python support is dropped.
-    """
-    if isinstance(items, dict):
-        use_items = items.values()
-    else:
-        use_items = items
-
-    for item in use_items:
-        """
-        Note: fetch_method is set in the first iteration of the loop as some items are not re-entrant (generators and
-        queries from some databases.) If can only use __get_item__ (indexing into a list/array) it assumes the fields
-        are in order of the list.
-        """
-        if item_data is None:
-            use_item_data = None
-        else:
-            use_item_data = dict(item_data)
+    Every row gets its own copy of ``item_data``, so an action can change one row's without changing the rest.
+    A table of many rows whose actions only read ``item_data`` can pass ``share_item_data=True`` to make one copy for
+    all of them -- and must then not change it, as that changes it for every row. It cannot be used with
+    ``add_item_to_item_data``, which gives every row a different ``item_data['item']``.
 
-        if fetch_method is None:    # determine method to fetch items.
-            if hasattr(item, fields[0]):
-                fetch_method = GET_ATTR
-            elif isinstance(item, dict):
-                fetch_method = GET
-            elif hasattr(item, '__getitem__'):
-                fetch_method = GET_ITEM
-            else:
-                raise RuntimeError('create_rows cannot access data - item needs one of getattr, get, or __getitem__ defined.')
-
-        if fetch_method == GET_ATTR:
-            row_data = [ getattr(item, name) for name in fields ]
-        elif fetch_method == GET:
-            row_data = [ item.get(name) for name in fields ]
-        elif fetch_method == GET_ITEM and len(item) >= len(fields):
-            row_data = item[:len(fields)]
-        else:
-            raise RuntimeError(
-                'create_rows cannot fetch field values - getattr, get, and __getitem__ all failed.')
+    ``create_rows`` makes the list from :func:`iter_rows`, which makes the table items one at a time, as they are
+    asked for.
 
-        if gen_tags is True:
-            tag = None
-            use_row_data = row_data
-        else:
-            tag = row_data[0]
-            use_row_data = row_data[1:]
-
-        if add_item_to_item_data is True:
-            if use_item_data is None:
-                use_item_data = {}
-            use_item_data['item'] = item
-
-        tis.append(TableItem(col_values=use_row_data, tag=tag, item_data=use_item_data))
-
-    return tis
+    ``create_rows`` is called by :func:`create_table` to create the table rows.
+    """
+    return list(iter_rows(items, fields, gen_tags, item_data, add_item_to_item_data, share_item_data))
 
 
 def create_table(items: Iterable[Any] | Mapping[Any, Any], fields: Sequence[str],
@@ -168,10 +218,12 @@ def create_table(items: Iterable[Any] | Mapping[Any, Any], fields: Sequence[str]
                  action_dict: dict[str, Any] | None = None,
                  case_sensitive: bool = False,
                  commands: CommandsArg = None,
-                 refresh: bool = True,
+                 refresh: bool | str = True,
                  item_filter: ItemFilter | bool | None = None,
                  header: str | None = None,
-                 footer: str | None = None) -> Table:
+                 footer: str | None = None,
+                 windowed: bool = False,
+                 share_item_data: bool = False) -> Table:
     """
     Convenience function to create ``cooked_input`` a table.
 
@@ -199,14 +251,17 @@ def create_table(items: Iterable[Any] | Mapping[Any, Any], fields: Sequence[str]
     :param item_filter: see :class:`Table`.
     :param header: see :class:`Table`.
     :param footer: see :class:`Table`.
+    :param windowed: see :class:`Table`.
+    :param share_item_data: see :func:`create_rows`.
 
     :return: an instance of a ``cooked_input`` :class:`Table`
 
     ``create_table`` is a convenience function used to create a ``cooked_input`` table (:class:`Table`) from
     a list of data or a query.
 
-    ``create_table`` calls :func:`create_rows` to create the table rows. See :func:`create_rows` for an explanation
-    of the: ``items``, ``fields``, ``gen_tags``, ``item_data``, and ``add_item_to_item_data`` parameters.
+    ``create_table`` calls :func:`iter_rows` to create the table rows. See :func:`create_rows` for an explanation
+    of the: ``items``, ``fields``, ``gen_tags``, ``item_data``, ``add_item_to_item_data`` and ``share_item_data``
+    parameters.
 
     See :class:`Table` for an explanation of the: ``title``, ``prompt``, ``default_choice``, ``default_str``,
         ``default_action``, ``style`` and keyword-only parameters.
@@ -256,7 +311,9 @@ def create_table(items: Iterable[Any] | Mapping[Any, Any], fields: Sequence[str]
         if use_tag_str is None:
             use_tag_str = column_names[0]
 
-    tis = create_rows(items, fields, gen_tags, item_data, add_item_to_item_data)
+    # A generator, not create_rows' list: the Table makes a list of the rows itself, and building
+    # one here first was a second pass over every row and a second list of them.
+    tis = iter_rows(items, fields, gen_tags, item_data, add_item_to_item_data, share_item_data)
     # Dropped `show_cols=` and `show_border=` arguments here, taken from a `use_style` built
     # just above. Neither is a Table option -- they are TableStyle fields -- so back when this
     # call ended in **options they were accepted and silently discarded. The style has always
@@ -266,7 +323,8 @@ def create_table(items: Iterable[Any] | Mapping[Any, Any], fields: Sequence[str]
                 default_str=default_str, default_action=default_action, prompt=prompt, title=title,
                 style=style, required=required, tag_str=use_tag_str, add_exit=add_exit,
                 action_dict=action_dict, case_sensitive=case_sensitive, commands=commands,
-                refresh=refresh, item_filter=item_filter, header=header, footer=footer)
+                refresh=refresh, item_filter=item_filter, header=header, footer=footer,
+                windowed=windowed)
     return tbl
 
 
@@ -339,7 +397,7 @@ def get_menu(choices: Iterable[Any], title: str | None = None, prompt: str | Non
              action_dict: dict[str, Any] | None = None,
              case_sensitive: bool = False,
              commands: CommandsArg = None,
-             refresh: bool = True,
+             refresh: bool | str = True,
              item_filter: ItemFilter | bool | None = None,
              header: str | None = None,
              footer: str | None = None) -> Any:
@@ -0,0 +1,415 @@
+"""Tests for the coroutine versions of GetInput.get_input, the get_* functions and Table.
+
+A coroutine version has to behave exactly as its blocking original does -- the same cleaning,
+conversion, validation, retries and commands -- and differ only in how it waits for each line.
+So most tests here run the two on the same script and compare. The input sources are a scripted
+async function, the default thread_input (fed by the ``fake_input`` fixture, which patches
+``input`` for every thread), and StreamInputSource over an asyncio.StreamReader.
+
+Len Wanger, 2026
+"""
+
+import asyncio
+import datetime
+import inspect
+import io
+import threading
+from decimal import Decimal
+
+import pytest
+
+import cooked_input as ci
+from cooked_input import (
+    COMMAND_ACTION_CANCEL,
+    COMMAND_ACTION_NOP,
+    COMMAND_ACTION_USE_VALUE,
+    CommandResponse,
+    GetInput,
+    GetInputCommand,
+    GetInputInterrupt,
+    IntConvertor,
+    MaxRetriesError,
+    RangeValidator,
+    StreamInputSource,
+    Table,
+    TableItem,
+    TableStyle,
+)
+
+
+class ScriptedSource:
+    """An async input source handing out scripted lines, and recording the prompts it was given."""
+    def __init__(self, *lines):
+        self.lines = list(lines)
+        self.prompts = []
+        self.hidden = []
+
+    async def __call__(self, prompt, hidden):
+        await asyncio.sleep(0)  # let the event loop run, as a real source would
+        self.prompts.append(prompt)
+        self.hidden.append(hidden)
+        if not self.lines:
+            raise EOFError("ScriptedSource script exhausted")
+        return self.lines.pop(0)
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+class TestGetInputAsync:
+    def test_gets_a_value(self, capsys):
+        source = ScriptedSource("42")
+        gi = GetInput(convertor=IntConvertor(), prompt="How many")
+        assert run(gi.get_input_async(source)) == 42
+        assert source.prompts == ["How many: "]
+
+    def test_retries_a_rejected_value(self, capsys):
+        source = ScriptedSource("foo", "9", "4")
+        gi = GetInput(convertor=IntConvertor(), validators=RangeValidator(1, 5))
+        assert run(gi.get_input_async(source)) == 4
+        assert source.lines == []
+        assert "foo" in capsys.readouterr().err
+
+    def test_max_retries(self, capsys):
+        gi = GetInput(convertor=IntConvertor(), retries=2)
+        with pytest.raises(MaxRetriesError):
+            run(gi.get_input_async(ScriptedSource("a", "b")))
+
+    def test_no_retries_asks_for_nothing(self, capsys):
+        source = ScriptedSource()
+        with pytest.raises(MaxRetriesError):
+            run(GetInput(retries=0).get_input_async(source))
+        assert source.prompts == []
+
+    def test_default_and_blank(self, capsys):
+        assert run(GetInput(convertor=IntConvertor(), default=7).get_input_async(ScriptedSource(""))) == 7
+        assert run(GetInput(required=False).get_input_async(ScriptedSource(""))) is None
+
+    def test_hidden_is_passed_to_the_source(self, capsys):
+        source = ScriptedSource("secret")
+        assert run(GetInput(hidden=True).get_input_async(source)) == "secret"
+        assert source.hidden == [True]
+
+    @pytest.mark.parametrize("action, value, lines, expected", [
+        (COMMAND_ACTION_USE_VALUE, "5", ["/five"], 5),
+        (COMMAND_ACTION_NOP, None, ["/nop", "3"], 3),
+    ])
+    def test_commands(self, action, value, lines, expected, capsys):
+        commands = {"/five": GetInputCommand(lambda *args: CommandResponse(action, value)),
+                    "/nop": GetInputCommand(lambda *args: CommandResponse(action, value))}
+        gi = GetInput(convertor=IntConvertor(), commands=commands)
+        assert run(gi.get_input_async(ScriptedSource(*lines))) == expected
+
+    def test_a_cancel_command(self, capsys):
+        commands = {"/cancel": GetInputCommand(lambda *args: CommandResponse(COMMAND_ACTION_CANCEL, None))}
+        with pytest.raises(GetInputInterrupt):
+            run(GetInput(commands=commands).get_input_async(ScriptedSource("/cancel")))
+
+    def test_the_event_loop_keeps_running(self, fake_input, monkeypatch, capsys):
+        # The default source waits on a worker thread: here the input() it calls blocks until a task on
+        # the event loop lets it go, which it could never do if the loop were blocked.
+        typed = threading.Event()
+        feeder = fake_input("12")
+
+        def slow_input(prompt=""):
+            assert typed.wait(5)
+            return feeder.visible(prompt)
+
+        monkeypatch.setattr("builtins.input", slow_input)
+
+        async def main():
+            getting = asyncio.create_task(ci.get_int_async(prompt="Count"))
+            await asyncio.sleep(0.01)
+            typed.set()
+            return await getting
+
+        assert run(main()) == 12
+        assert feeder.prompts == ["Count: "]
+
+
+class TestThreadInput:
+    def test_visible_and_hidden(self, fake_input, capsys):
+        feeder = fake_input("plain", "secret")
+        assert run(ci.get_string_async(prompt="Name")) == "plain"
+        assert run(ci.get_string_async(prompt="Password", hidden=True)) == "secret"
+        assert feeder.hidden_prompts == ["Password: "]
+        assert feeder.remaining == 0
+
+
+class TestConvenienceFunctions:
+    @pytest.mark.parametrize("name, kwargs, line, expected", [
+        ("get_input", {"convertor": IntConvertor()}, "3", 3),
+        ("get_string", {"max_len": 5}, " abc ", "abc"),
+        ("get_int", {"minimum": 1}, "8", 8),
+        ("get_float", {}, "1.5", 1.5),
+        ("get_boolean", {}, "yes", True),
+        ("get_date", {}, "2026-01-02", datetime.datetime(2026, 1, 2)),
+        ("get_yes_no", {}, "n", "no"),
+        ("get_money", {}, "$1,234.50", Decimal("1234.50")),
+        ("get_list", {"elem_get_input": GetInput(convertor=IntConvertor())}, "1, 2", [1, 2]),
+    ])
+    def test_same_as_the_blocking_version(self, name, kwargs, line, expected, fake_input, capsys):
+        fake_input(line)
+        assert getattr(ci, name)(**kwargs) == expected
+
+        source = ScriptedSource(line)
+        assert run(getattr(ci, name + "_async")(input_source=source, **kwargs)) == expected
+        assert source.lines == []
+
+    def test_names_and_docs(self):
+        assert getattr(ci.get_int_async, "__name__") == "get_int_async"
+        assert ":func:`get_int`" in str(ci.get_int_async.__doc__)
+
+    @pytest.mark.parametrize("name", ["get_input", "get_string", "get_int", "get_float", "get_boolean", "get_date",
+                                      "get_yes_no", "get_money", "get_list"])
+    def test_same_signature_as_the_blocking_version(self, name):
+        blocking = inspect.signature(getattr(ci, name))
+        coroutine = inspect.signature(getattr(ci, name + "_async"))
+
+        # Compared as text: a default cleaner is a different (but like) instance in each.
+        assert [str(p) for p in coroutine.parameters.values()][:-1] == [str(p) for p in blocking.parameters.values()]
+        assert coroutine.parameters["input_source"].kind == inspect.Parameter.KEYWORD_ONLY
+        assert coroutine.return_annotation == blocking.return_annotation
+
+    def test_the_blocking_version_still_asks_afterwards(self, fake_input, capsys):
+        run(ci.get_int_async(input_source=ScriptedSource("1")))
+        fake_input("2")
+        assert ci.get_int() == 2
+
+    def test_a_bad_option_is_still_rejected(self):
+        with pytest.raises(TypeError):
+            run(ci.get_int_async(no_such_option=1))  # ty: ignore[no-matching-overload]
+
+
+class FakeWriter:
+    def __init__(self):
+        self.written = b""
+        self.drained = 0
+
+    def write(self, data):
+        self.written += data
+
+    async def drain(self):
+        self.drained += 1
+
+
+class TestStreamInputSource:
+    def _reader(self, data, eof=True):
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)
+        if eof:
+            reader.feed_eof()
+        return reader
+
+    def test_reads_lines(self, capsys):
+        async def main():
+            source = StreamInputSource(self._reader(b"abc\r\n7\n"))
+            return await ci.get_int_async(prompt="N", input_source=source)
+
+        assert run(main()) == 7     # 'abc' is rejected, then 7 read
+        assert "N: N: " in capsys.readouterr().out
+
+    def test_writes_prompts_to_the_writer(self, capsys):
+        writer = FakeWriter()
+
+        async def main():
+            source = StreamInputSource(self._reader("é\n".encode("latin-1")), writer,  # ty: ignore[invalid-argument-type]
+                                       encoding="latin-1")
+            assert "StreamInputSource(reader=" in repr(source)
+            return await ci.get_string_async(prompt="Letter", input_source=source)
+
+        assert run(main()) == "é"
+        assert writer.written == b"\nLetter: " and writer.drained == 2    # the blank line before the prompt too
+
+    def test_nothing_goes_to_stdout_with_a_writer(self, capsys):
+        writer = FakeWriter()
+
+        async def main():
+            source = StreamInputSource(self._reader(b"42\n"), writer)  # ty: ignore[invalid-argument-type]
+            return await ci.get_int_async(prompt="Age", input_source=source)
+
+        assert run(main()) == 42
+        assert writer.written == b"\nAge: "
+        assert capsys.readouterr().out == ""
+
+    def test_end_of_stream(self, capsys):
+        async def main():
+            return await ci.get_string_async(input_source=StreamInputSource(self._reader(b"")))
+
+        with pytest.raises(EOFError):
+            run(main())
+
+    def test_write_without_a_writer_prints(self, capsys):
+        async def main():
+            await StreamInputSource(self._reader(b"")).write("some text")
+
+        run(main())
+        assert capsys.readouterr().out == "some text\n"
+
+
+def make_table(rows=None, **kwargs):
+    rows = [TableItem(["row {}".format(i)], tag=str(i)) for i in range(10)] if rows is None else rows
+    return Table(rows, col_names=["Value"], style=TableStyle(rows_per_page=3), **kwargs)
+
+
+class TestTableAsync:
+    def test_get_table_choice(self, capsys):
+        table = make_table()
+        assert run(table.get_table_choice_async(input_source=ScriptedSource("4"))) == "4"
+
+    def test_paging_commands(self, capsys):
+        def refresh_action(cmd_str, cmd_vars, cmd_dict):
+            raise ci.RefreshScreenInterrupt
+
+        commands = {"/next": GetInputCommand(ci.next_page_cmd_action), "/refresh": GetInputCommand(refresh_action)}
+        table = make_table(commands=commands)
+        source = ScriptedSource("/next", "/refresh", "/next", "5")
+        assert run(table.get_table_choice_async(input_source=source)) == "5"
+        assert "row 4" in capsys.readouterr().out
+
+    def test_a_data_source_table_starts_back_on_the_first_page(self, capsys):
+        class Source(ci.TableDataSource):
+            def count(self):
+                return 10
+
+            def fetch(self, offset, limit):
+                return [TableItem(["row {}".format(i)]) for i in range(offset, min(offset + limit, 10))]
+
+        commands = {"/next": GetInputCommand(ci.next_page_cmd_action)}
+        table = Table(Source(), col_names=["Value"], style=TableStyle(rows_per_page=3), commands=commands,
+                      default_action="first_value")
+        assert run(table.get_table_choice_async(input_source=ScriptedSource("/next", "5"))) == "row 4"
+        assert run(table.get_table_choice_async(input_source=ScriptedSource("2"))) == "row 1"
+
+    def test_no_table_in_batch_mode(self, capsys):
+        ci.set_batch_mode(True, io.StringIO(""))
+        try:
+            assert run(make_table().get_table_choice_async(input_source=ScriptedSource("4"))) == "4"
+        finally:
+            ci.set_batch_mode(False)
+
+        assert "row 0" not in capsys.readouterr().out
+
+    def test_the_table_goes_to_a_stream_source(self, capsys):
+        commands = {"/first": GetInputCommand(ci.first_page_cmd_action),
+                    "/last": GetInputCommand(ci.last_page_cmd_action),
+                    "/next": GetInputCommand(ci.next_page_cmd_action),
+                    "/prev": GetInputCommand(ci.prev_page_cmd_action),
+                    "/up": GetInputCommand(ci.scroll_up_one_row_cmd_action),
+                    "/down": GetInputCommand(ci.scroll_down_one_row_cmd_action)}
+        table = make_table(commands=commands, header="Pick a row", footer="(or a command)")
+        writer = FakeWriter()
+        starts = []
+
+        async def main():
+            reader = asyncio.StreamReader()
+            reader.feed_data(b"/last\n/up\n/prev\n/down\n/next\n/first\n2\n")
+            source = StreamInputSource(reader, writer)  # ty: ignore[invalid-argument-type]
+            original = source.write
+
+            async def write(text):
+                if text:    # not GetInput's blank line before each prompt
+                    starts.append(table.table.start)
+                await original(text)
+
+            source.write = write  # ty: ignore[invalid-assignment]
+            return await table.get_table_choice_async(input_source=source)
+
+        assert run(main()) == "2"
+        assert starts == [0, 7, 6, 3, 4, 7, 0]
+        assert b"Pick a row\n" in writer.written and b"row 9" in writer.written
+        assert capsys.readouterr().out == ""
+
+    def test_run_async_reports_interrupts_to_a_stream_source(self, capsys):
+        def interrupt(row, action_dict):
+            raise GetInputInterrupt("stopped")
+
+        table = make_table([TableItem(["a"], tag="1", action=interrupt)], required=False)
+        writer = FakeWriter()
+
+        async def main():
+            reader = asyncio.StreamReader()
+            reader.feed_data(b"1\n\n")
+            return await table.run_async(StreamInputSource(reader, writer))  # ty: ignore[invalid-argument-type]
+
+        assert run(main()) is True
+        assert b"\nstopped\n\n" in writer.written
+        assert capsys.readouterr().out == ""
+
+    def test_options_as_for_get_table_choice(self, capsys):
+        table = make_table()
+        assert run(table.get_table_choice_async(input_source=ScriptedSource(""), required=False)) is None
+        source = ScriptedSource("x")
+        with pytest.raises(MaxRetriesError):
+            run(table.get_table_choice_async(input_source=source, retries=1, prompt="Pick"))
+        assert source.prompts == ["Pick: "]
+
+    def test_a_coroutine_action_is_awaited(self, capsys):
+        async def action(row, action_dict):
+            await asyncio.sleep(0)
+            return row.values[0].upper()
+
+        table = make_table([TableItem(["a"], tag="1", action=action)])
+        assert run(table.get_table_choice_async(input_source=ScriptedSource("1"))) == "A"
+
+    def test_a_table_action_runs_async(self, capsys):
+        calls = []
+        sub_menu = make_table([TableItem(["b"], tag="b", action=lambda row, ad: calls.append("b"))], required=False)
+        table = make_table([TableItem(["sub"], tag="s", action=sub_menu)])
+        assert run(table.get_table_choice_async(input_source=ScriptedSource("s", "b", ""))) is True
+        assert calls == ["b"]
+
+
+class TestRunAsync:
+    def test_runs_until_blank(self, capsys):
+        calls = []
+
+        async def async_action(row, action_dict):
+            calls.append(("async", row.tag))
+
+        rows = [TableItem(["alpha"], tag="1", action=lambda row, ad: calls.append(("sync", row.tag))),
+                TableItem(["beta"], tag="2", action=async_action)]
+        source = ScriptedSource("1", "2", "")
+        assert run(make_table(rows, required=False).run_async(source)) is True
+        assert calls == [("sync", "1"), ("async", "2")]
+        assert source.lines == []
+
+    def test_the_exit_row(self, capsys):
+        source = ScriptedSource("exit")
+        assert run(make_table(add_exit=True).run_async(source)) is True
+
+    def test_without_refreshing(self, recording_action, capsys):
+        calls, action = recording_action
+        table = make_table([TableItem(["a"], tag="1", action=action)], refresh=False, required=False)
+        assert run(table.run_async(ScriptedSource("1", "1", ""))) is True
+        assert [tag for tag, _ in calls] == ["1", "1"]
+
+    def test_sub_menus(self, capsys):
+        calls = []
+        sub_menu = make_table([TableItem(["b"], tag="b", action=lambda row, ad: calls.append("b"))], add_exit=True)
+        table = make_table([TableItem(["sub"], tag="s", action=sub_menu)], required=False)
+        source = ScriptedSource("s", "b", "exit", "")
+        assert run(table.run_async(source)) is True
+        assert calls == ["b"]
+        assert source.lines == []
+
+    def test_interrupts(self, capsys):
+        def interrupt(row, action_dict):
+            raise GetInputInterrupt("stopped")
+
+        commands = {"/cancel": GetInputCommand(lambda *args: CommandResponse(COMMAND_ACTION_CANCEL, None))}
+        rows = [TableItem(["row"], tag="r", action=interrupt), TableItem(["default"], tag="d")]
+        table = make_table(rows, commands=commands, default_action=interrupt)
+
+        # an interrupted prompt, and an interrupted row action, carry on; an interrupted default action ends it
+        source = ScriptedSource("/cancel", "r", "d")
+        assert run(table.run_async(source)) is False
+        assert source.lines == []
+
+    def test_missing_actions_are_reported(self, capsys):
+        rows = [TableItem(["no action"], tag="n", action="no such action"), TableItem(["default"], tag="d")]
+        table = make_table(rows, default_action="no such default", required=False)
+        run(table.run_async(ScriptedSource("n", "d", "")))
+        err = capsys.readouterr().err
+        assert "no action specified" in err and "default_action not set" in err
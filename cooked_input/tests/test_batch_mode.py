@@ -0,0 +1,228 @@
+"""Tests for batch mode: reading the answers from a piped stream, without prompts, and failing fast at its end.
+
+The streams are io.StringIO objects, given to set_batch_mode in place of sys.stdin. Every test that
+turns batch mode on also installs an empty ``fake_input`` script, so a read that wrongly went to
+``input`` fails the test rather than blocking it.
+
+Len Wanger, 2026
+"""
+
+import asyncio
+import io
+import os
+import threading
+
+import pytest
+
+import cooked_input as ci
+from cooked_input import (
+    BATCH_MODE_AUTO,
+    COMMAND_ACTION_CANCEL,
+    CommandResponse,
+    GetInput,
+    GetInputCommand,
+    GetInputInterrupt,
+    InputExhaustedError,
+    IntConvertor,
+    RangeValidator,
+    Table,
+    TableItem,
+    TableStyle,
+    in_batch_mode,
+    set_batch_mode,
+)
+from cooked_input.get_input import _BatchReader
+
+
+class FakeTerminal(io.StringIO):
+    """A stream claiming to be a terminal."""
+    def isatty(self):
+        return True
+
+
+@pytest.fixture(autouse=True)
+def batch_mode_off():
+    """Leave batch mode off for the next test, however this one ends."""
+    yield
+    set_batch_mode(False)
+
+
+@pytest.fixture
+def batch(fake_input):
+    """Turn batch mode on, reading the text given. Returns the (empty) feeder standing in for ``input``."""
+    def start(text):
+        set_batch_mode(True, io.StringIO(text))
+        return fake_input()
+
+    return start
+
+
+class TestBatchReader:
+    def test_lines(self):
+        reader = _BatchReader(io.StringIO("one\n\nthree3\nlast"))
+        lines = [reader.readline() for _ in range(5)]
+        assert lines == ["one", "", "three3", "last", None]
+
+    def test_trailing_newline_adds_no_line(self):
+        reader = _BatchReader(io.StringIO("a\nb\n"))
+        assert [reader.readline() for _ in range(3)] == ["a", "b", None]
+
+    def test_stays_at_end(self):
+        class Reopening(io.StringIO):
+            """Has more to read after its end, as a terminal does after Ctrl-D."""
+            replies = ["", "more\n"]
+
+            def readline(self, size=-1):
+                return self.replies.pop(0)
+
+        reader = _BatchReader(Reopening())
+        assert reader.readline() is None
+        assert reader.readline() is None
+
+    def test_a_line_is_returned_without_waiting_for_more(self):
+        # A program sending one answer and waiting for the next prompt: the pipe stays open with one line in it.
+        # Reading a chunk would wait for the rest of the chunk, or the end of the input, forever.
+        read_fd, write_fd = os.pipe()
+        got = []
+
+        with open(read_fd, encoding="utf-8") as stream, open(write_fd, "w", encoding="utf-8") as writer:
+            writer.write("42\n")
+            writer.flush()
+
+            thread = threading.Thread(target=lambda: got.append(_BatchReader(stream).readline()), daemon=True)
+            thread.start()
+            thread.join(5)
+            assert got == ["42"]
+
+class TestSetBatchMode:
+    def test_off_by_default(self):
+        assert in_batch_mode() is False
+
+    def test_on_and_off(self):
+        assert set_batch_mode(True, io.StringIO("")) is True
+        assert in_batch_mode() is True
+        assert set_batch_mode(False) is False
+        assert in_batch_mode() is False
+
+    def test_auto_on_for_a_pipe(self):
+        assert set_batch_mode(BATCH_MODE_AUTO, io.StringIO("")) is True
+        assert in_batch_mode() is True
+
+    def test_auto_off_for_a_terminal(self):
+        assert set_batch_mode(stream=FakeTerminal("")) is False
+        assert in_batch_mode() is False
+
+    def test_defaults_to_stdin(self, monkeypatch, fake_input):
+        fake_input()
+        monkeypatch.setattr("sys.stdin", io.StringIO("7\n"))
+        assert set_batch_mode() is True
+        assert ci.get_int(prompt="n") == 7
+
+    def test_bad_mode(self):
+        with pytest.raises(ValueError, match="set_batch_mode"):
+            set_batch_mode("sometimes")
+        assert in_batch_mode() is False
+
+
+class TestBatchInput:
+    def test_reads_the_stream_without_prompting(self, batch, capsys):
+        feeder = batch("Len\n42\n")
+        assert ci.get_string(prompt="Name") == "Len"
+        assert ci.get_int(prompt="Age") == 42
+        assert capsys.readouterr().out == ""
+        assert feeder.prompts == []
+
+    def test_hidden_values_come_from_the_stream(self, batch):
+        feeder = batch("secret\n")
+        assert ci.get_string(prompt="Password", hidden=True) == "secret"
+        assert feeder.hidden_prompts == []
+
+    def test_blank_line_takes_the_default(self, batch):
+        batch("\n")
+        assert ci.get_int(prompt="n", default="5") == 5
+
+    def test_rejected_values_are_reported_and_retried(self, batch, capsys):
+        batch("abc\n500\n50\n")
+        assert ci.get_int(prompt="n", minimum=1, maximum=100) == 50
+        captured = capsys.readouterr()
+        assert captured.out == ""
+        assert "abc" in captured.err and "500" in captured.err
+
+    def test_exhausted_input_fails_fast(self, batch):
+        batch("1\n")
+        assert ci.get_int(prompt="first") == 1
+
+        with pytest.raises(InputExhaustedError, match="'second'") as excinfo:
+            ci.get_int(prompt="second")
+
+        assert isinstance(excinfo.value, EOFError)
+
+    def test_exhausted_while_retrying(self, batch):
+        batch("x\ny\n")
+        with pytest.raises(InputExhaustedError):
+            ci.get_int(prompt="n", retries=5)
+
+    def test_table_is_not_shown(self, batch, capsys):
+        batch("2\n")
+        items = [TableItem("red"), TableItem("green"), TableItem("blue")]
+        table = Table(items, prompt="Colour", add_exit=False)
+        assert table.get_table_choice() == 2
+        assert capsys.readouterr().out == ""
+
+    def test_pages_are_not_shown(self, batch, capsys):
+        batch("/first\n/last\n/prev\n/up\n/down\n/next\n8\n")
+        actions = {"/first": ci.first_page_cmd_action, "/last": ci.last_page_cmd_action,
+                   "/prev": ci.prev_page_cmd_action, "/next": ci.next_page_cmd_action,
+                   "/up": ci.scroll_up_one_row_cmd_action, "/down": ci.scroll_down_one_row_cmd_action}
+        items = [TableItem("row {}".format(i), tag=str(i)) for i in range(10)]
+        table = Table(items, prompt="Row", style=TableStyle(rows_per_page=3), add_exit=False,
+                      commands={cmd: GetInputCommand(action) for cmd, action in actions.items()})
+
+        assert table.get_table_choice() == "8"
+        assert table.table.start == 7
+        assert capsys.readouterr().out == ""
+
+    def test_interrupts_are_not_shown(self, batch, capsys):
+        batch("/cancel\n1\n\n")
+        calls = []
+
+        def interrupting(row, action_dict):
+            calls.append(row.tag)
+            raise GetInputInterrupt("cancelled that one")
+
+        cancel = GetInputCommand(lambda *args: CommandResponse(COMMAND_ACTION_CANCEL, None))
+        table = Table([TableItem("alpha", tag="1", action=interrupting)], prompt="Choice", required=False,
+                      commands={"/cancel": cancel})
+
+        assert table.run() is True
+        assert calls == ["1"]
+        assert capsys.readouterr().out == ""
+
+    def test_off_again_uses_input(self, batch):
+        feeder = batch("")
+        set_batch_mode(False)
+        feeder.send("3")
+        assert ci.get_int(prompt="n") == 3
+        assert feeder.prompts == ["n: "]
+
+
+class TestInputExhaustedError:
+    def test_end_of_input_from_input(self, fake_input):
+        fake_input()
+        gi = GetInput(convertor=IntConvertor(), validators=RangeValidator(1, 9), prompt="Digit")
+
+        with pytest.raises(InputExhaustedError, match="'Digit'") as excinfo:
+            gi.get_input()
+
+        assert isinstance(excinfo.value.__cause__, EOFError)
+
+    def test_end_of_input_from_an_async_source(self):
+        async def empty_source(prompt, hidden):
+            raise EOFError
+
+        with pytest.raises(InputExhaustedError, match="'Digit'"):
+            asyncio.run(ci.get_int_async(prompt="Digit", input_source=empty_source))
+
+    def test_is_exported(self):
+        assert ci.InputExhaustedError is InputExhaustedError
+        assert issubclass(InputExhaustedError, EOFError)
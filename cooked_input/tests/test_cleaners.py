@@ -223,3 +223,53 @@ class TestCleaners(object):
         result = get_input(cleaners=cc)
         assert (result == 'foobar')
         assert repr(cc) == "ChoiceCleaner(choices={'foo': 'foo', 'foobar': 'foobar'})"
+
+
+def linear_choice_clean(choices, case_sensitive, value):
+    """ChoiceCleaner as it was before the sorted-key index: a startswith scan of every choice."""
+    if case_sensitive:
+        str_choices = {str(choice): choice for choice in choices}
+        str_value = str(value)
+    else:
+        str_choices = {str(choice).lower(): choice for choice in choices}
+        str_value = str(value).lower()
+
+    matches = [v for k, v in str_choices.items() if k.startswith(str_value)]
+
+    if len(matches) == 1:
+        return matches[0]
+    elif value in str_choices:
+        return str_choices[value]
+    else:
+        return value
+
+
+class TestChoiceCleanerIndex(object):
+    """The bisect lookup gives the same answers the linear scan did."""
+    choices = ['blue', 'brown', 'green', 'greenish', 'Grey', 'red', 'red2', 'r', 10, 100, 2.5, 'Ärger', '']
+    values = ['', 'b', 'bl', 'br', 'brown', 'brownish', 'g', 'gr', 'G', 'Gr', 'green', 'greeni', 'r', 're', 'red',
+              'red2', '1', '10', '100', '1000', '2', 10, 100, 2.5, 'x', 'Ä', 'ä', 'z' * 50]
+
+    @pytest.mark.parametrize('case_sensitive', [True, False])
+    @pytest.mark.parametrize('value', values)
+    def test_agrees_with_a_linear_scan(self, case_sensitive, value):
+        cc = ChoiceCleaner(self.choices, case_sensitive=case_sensitive)
+        assert cc(value) == linear_choice_clean(self.choices, case_sensitive, value)
+
+    def test_no_choices(self):
+        assert ChoiceCleaner([])('x') == 'x'
+
+    def test_one_choice_matches_everything_that_prefixes_it(self):
+        cc = ChoiceCleaner(['only'])
+        assert cc('') == 'only'
+        assert cc('on') == 'only'
+        assert cc('x') == 'x'
+
+    def test_many_choices(self):
+        tags = [str(i) for i in range(50_000)]
+        cc = ChoiceCleaner(tags)
+        assert cc('49999') == '49999'
+        assert cc('4999') == '4999'     # ambiguous as a prefix, but a choice itself
+        assert cc('x') == 'x'
+        for value in ('1', '12', '123', '1234', '12345', '49998', '50000'):
+            assert cc(value) == linear_choice_clean(tags, True, value)
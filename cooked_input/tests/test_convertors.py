@@ -7,12 +7,15 @@ Len Wanger, 2017
 """
 
 import decimal
+from datetime import datetime, timedelta, timezone
 
+import dateparser
 import pytest
+from dateparser.date import DateData, DateDataParser
 
 from cooked_input import get_input, get_boolean, get_list, get_date, get_yes_no, get_money
 from cooked_input import Convertor, IntConvertor, BooleanConvertor, ListConvertor, DateConvertor, YesNoConvertor, DecimalConvertor
-from cooked_input import StripCleaner
+from cooked_input import StripCleaner, ConvertorError, silent_error
 
 
 class TestConvertors(object):
@@ -188,3 +191,142 @@ class TestConvertors(object):
         fake_input(input_str)
         result = get_money(symbol="$", separator=",")
         assert (result == good_result)
+
+
+@pytest.fixture
+def no_dateparser(monkeypatch):
+    """Fail the test if DateConvertor gets as far as dateparser."""
+    monkeypatch.setattr(DateDataParser, 'get_date_data', lambda self, value: pytest.fail('dateparser called'))
+
+
+class TestDateConvertor(object):
+    """The ISO and strptime fast paths, the cache in front of dateparser, and the dateparser options."""
+
+    @pytest.mark.parametrize('value', [
+        '2026-01-02', '2026-01-02T10:11', '2026-01-02 10:11:12', '2026-01-02T10:11:12.123',
+        '2026-01-02T10:11:12.123456', '2026-01-02T10:11:12Z', '2026-01-02t10:11:12z', '2026-01-02T10:11:12-05:00',
+        '2026-13-01',   # ISO-shaped, but only dateparser makes sense of it (January 13)
+    ])
+    def test_iso_agrees_with_dateparser(self, value):
+        assert DateConvertor()(value, silent_error, '') == dateparser.parse(value)
+
+    def test_iso_offsets(self):
+        dc = DateConvertor()
+        assert dc('2026-01-02T10:11:12Z', silent_error, '').tzinfo == timezone.utc
+        assert dc('2026-01-02T10:11:12+02:00', silent_error, '').utcoffset() == timedelta(hours=2)
+        # dateparser returns None for a negative half-hour offset, the fast path does not
+        assert dc('2026-01-02T10:11:12-05:30', silent_error, '').utcoffset() == -timedelta(hours=5, minutes=30)
+
+    def test_iso_does_not_call_dateparser(self, no_dateparser):
+        assert DateConvertor()('2026-01-02', silent_error, '') == datetime(2026, 1, 2)
+
+    def test_iso_off_uses_dateparser(self, monkeypatch):
+        monkeypatch.setattr(DateDataParser, 'get_date_data', lambda self, value: DateData(date_obj=datetime(1999, 1, 1)))
+        assert DateConvertor(iso=False)('2026-01-02', silent_error, '') == datetime(1999, 1, 1)
+
+    def test_formats_tried_in_order(self, no_dateparser):
+        dc = DateConvertor(formats=['%d.%m.%Y', '%Y%m%d'])
+        assert dc('02.01.2026', silent_error, '') == datetime(2026, 1, 2)
+        assert dc('20260102', silent_error, '') == datetime(2026, 1, 2)
+
+    def test_formats_fall_back_to_dateparser(self):
+        dc = DateConvertor(formats=['%d.%m.%Y'])
+        assert dc('September 4, 2017', silent_error, '') == datetime(2017, 9, 4)
+
+    def test_bad_date_still_errors(self):
+        errors = []
+        dc = DateConvertor(formats=['%d.%m.%Y'], cache_size=4)
+
+        for _ in range(2):
+            with pytest.raises(ConvertorError):
+                dc('not a date', lambda fmt, value, error_content: errors.append(value), '')
+
+        assert errors == ['not a date', 'not a date']
+        assert not dc._cache
+
+    def test_cache_hits_skip_parsing(self, monkeypatch):
+        dc = DateConvertor(cache_size=4)
+        first = dc('September 4, 2017', silent_error, '')
+        assert dc('September 4, 2017', silent_error, '') is first     # checked for being relative
+        monkeypatch.setattr(DateDataParser, 'get_date_data', lambda self, value: pytest.fail('dateparser called'))
+        assert dc('September 4, 2017', silent_error, '') is first
+
+    def test_a_value_seen_once_is_parsed_once(self, monkeypatch):
+        calls = []
+        get_date_data = DateDataParser.get_date_data
+
+        def counted(parser, value):
+            calls.append(value)
+            return get_date_data(parser, value)
+
+        monkeypatch.setattr(DateDataParser, 'get_date_data', counted)
+        dc = DateConvertor(cache_size=4)
+        dc('September 4, 2017', silent_error, '')
+        assert calls == ['September 4, 2017']
+        dc('September 4, 2017', silent_error, '')
+        assert len(calls) == 2      # the check for a relative date, made on the second sight
+
+    def test_cache_is_lru(self):
+        dc = DateConvertor(cache_size=2)
+        for value in ('2026-01-01', '2026-01-02', '2026-01-01', '2026-01-03'):
+            dc(value, silent_error, '')
+        assert list(dc._cache) == ['2026-01-01', '2026-01-03']
+
+    @pytest.mark.parametrize('value', ['today', 'tomorrow', 'in 2 days', 'May 5'])
+    def test_relative_dates_not_cached(self, value, monkeypatch):
+        dc = DateConvertor(cache_size=4)
+        dc(value, silent_error, '')
+        dc(value, silent_error, '')
+        assert dc._cache[value] == (None, True)     # known to be relative
+
+        later = DateData(date_obj=datetime(2099, 1, 1))
+        monkeypatch.setattr(DateDataParser, 'get_date_data', lambda self, value: later)
+        assert dc(value, silent_error, '') == datetime(2099, 1, 1)     # so parsed again
+
+    def test_no_cache_by_default(self):
+        dc = DateConvertor()
+        dc('2026-01-02', silent_error, '')
+        assert not dc._cache
+
+    def test_bad_cache_size(self):
+        with pytest.raises(ValueError, match='cache_size'):
+            DateConvertor(cache_size=-1)
+
+    def test_languages(self):
+        assert DateConvertor(languages=['en'])('September 4, 2017', silent_error, '') == datetime(2017, 9, 4)
+        assert DateConvertor(languages=['de'])('4. September 2017', silent_error, '') == datetime(2017, 9, 4)
+
+        with pytest.raises(ConvertorError):
+            DateConvertor(languages=['en'])('4. Juli 2017', silent_error, '')
+
+    def test_locales(self):
+        assert DateConvertor(locales=['en-GB'])('04/09/2017', silent_error, '') == datetime(2017, 9, 4)
+
+    def test_date_order(self):
+        assert DateConvertor(date_order='DMY')('04/09/2017', silent_error, '') == datetime(2017, 9, 4)
+        assert DateConvertor(date_order='MDY')('04/09/2017', silent_error, '') == datetime(2017, 4, 9)
+
+    def test_settings(self):
+        dc = DateConvertor(settings={'PREFER_DAY_OF_MONTH': 'first'})
+        assert dc('September 2017', silent_error, '') == datetime(2017, 9, 1)
+
+    def test_configured_dateparser_reads_iso_too(self):
+        # dateparser reads an ISO date in DMY order when told to, so the fast path steps aside
+        assert DateConvertor(date_order='DMY')('2026-01-02', silent_error, '') == dateparser.parse(
+            '2026-01-02', settings={'DATE_ORDER': 'DMY'})
+        assert DateConvertor(date_order='DMY', iso=True)('2026-01-02', silent_error, '') == datetime(2026, 1, 2)
+        assert DateConvertor(languages=['en']).iso
+
+    def test_parser_built_once(self):
+        dc = DateConvertor(languages=['en'])
+        assert not hasattr(dc._parsers, 'parser')
+        dc('September 4, 2017', silent_error, '')
+        parser = dc._parsers.parser
+        dc('September 5, 2017', silent_error, '')
+        assert dc._parsers.parser is parser
+        assert not hasattr(dc._parsers, 'relative_base_parser')     # only needed with a cache
+
+    def test_callers_relative_base_is_cached(self):
+        dc = DateConvertor(cache_size=4, settings={'RELATIVE_BASE': datetime(2020, 6, 1)})
+        assert dc('tomorrow', silent_error, '').date() == datetime(2020, 6, 2).date()
+        assert 'tomorrow' in dc._cache
@@ -0,0 +1,196 @@
+"""Tests for FormSchema: validating whole records with a GetInput per field, and constraints between fields.
+
+Errors are collected with a recording callback, so the messages -- field name in front -- can be
+checked exactly, rather than read back from stderr.
+
+Len Wanger, 2026
+"""
+
+import csv
+import io
+import json
+
+import pytest
+
+import cooked_input as ci
+from cooked_input import (
+    DEFAULT_CONSTRAINT_ERROR,
+    FormResponse,
+    FormSchema,
+    GetInput,
+    IntConvertor,
+    LengthValidator,
+    PipelineMetrics,
+    RangeValidator,
+    SimpleValidator,
+    StripCleaner,
+    set_metrics,
+)
+
+
+class Recorder:
+    """An error callback keeping the formatted messages."""
+    def __init__(self):
+        self.messages = []
+
+    def __call__(self, fmt_str, value, error_content):
+        self.messages.append(fmt_str.format(value=value, error_content=error_content))
+
+
+@pytest.fixture
+def errors():
+    return Recorder()
+
+
+def make_schema(**kwargs):
+    return FormSchema({
+            "name": GetInput(StripCleaner(), validators=LengthValidator(1, 10)),
+            "age": GetInput(convertor=IntConvertor(), validators=RangeValidator(0, 150)),
+            "min": GetInput(convertor=IntConvertor(), required=False),
+            "max": GetInput(convertor=IntConvertor(), default=100),
+        },
+        constraints=SimpleValidator(lambda rec: rec["min"] is None or rec["min"] <= rec["max"],
+                                    name="range, min above max"),
+        **kwargs)
+
+
+class TestValidate:
+    def test_valid_record(self, errors):
+        response = make_schema().validate({"name": " Len ", "age": "42", "min": "1", "max": "9"}, errors)
+
+        assert response == FormResponse(True, {"name": "Len", "age": 42, "min": 1, "max": 9}, ())
+        assert errors.messages == []
+
+    def test_each_field_gets_its_own_result(self, errors):
+        response = make_schema(error_callback=errors).validate({"name": "Len", "age": "x", "min": "5", "max": "nope"})
+
+        assert not response.valid
+        assert response.failed == ("age", "max")
+        assert response.values == {"name": "Len", "age": None, "min": 5, "max": None}
+        assert errors.messages == ['age: "x" cannot be converted to an integer number',
+                                   'max: "nope" cannot be converted to an integer number']
+
+    @pytest.mark.parametrize("blank", [None, ""])
+    def test_blank_fields(self, errors, blank):
+        response = make_schema().validate({"name": blank, "age": "7", "min": blank, "max": blank}, errors)
+
+        assert response.failed == ("name",)
+        assert response.values["min"] is None      # not required
+        assert response.values["max"] == 100        # the default
+        assert errors.messages == ['name: "" cannot be blank']
+
+    def test_missing_fields_are_blank_and_extra_ones_ignored(self, errors):
+        response = make_schema().validate({"name": "Len", "age": "7", "shoe size": "12"}, errors)
+        assert response.valid
+        assert set(response.values) == {"name", "age", "min", "max"}
+
+    def test_zero_is_not_blank(self, errors):
+        schema = FormSchema({"n": GetInput(convertor=IntConvertor(), validators=RangeValidator(0, 5))})
+        assert schema.validate({"n": 0}, errors) == (True, {"n": 0}, ())
+        assert schema.validate({"n": False}, errors) == (False, {"n": None}, ("n",))   # "False" is no integer
+
+    def test_failed_constraint(self, errors):
+        response = make_schema().validate({"name": "Len", "age": "7", "min": "200"}, errors)
+
+        assert not response.valid
+        assert response.failed == ()
+        assert errors.messages == ["record is not a valid range, min above max"]
+
+    def test_constraints_run_only_on_valid_fields(self, errors):
+        def never(record, error_callback, fmt_str):
+            raise AssertionError("constraint run with invalid fields")
+
+        schema = FormSchema({"n": GetInput(convertor=IntConvertor())}, [never])
+        assert not schema.validate({"n": "x"}, errors).valid
+
+    def test_a_constraint_tripping_over_a_blank_field_is_skipped(self, errors):
+        schema = FormSchema({"start": GetInput(convertor=IntConvertor()),
+                             "end": GetInput(convertor=IntConvertor(), required=False)},
+                            SimpleValidator(lambda rec: rec["start"] <= rec["end"], name="start on or before the end"))
+
+        assert schema.validate({"start": "5", "end": ""}, errors) == FormResponse(True, {"start": 5, "end": None}, ())
+        assert not schema.validate({"start": "5", "end": "3"}, errors).valid
+        assert errors.messages == ["record is not a valid start on or before the end"]
+
+    def test_other_type_errors_from_a_constraint_are_raised(self, errors):
+        schema = FormSchema({"n": GetInput(convertor=IntConvertor())},
+                            SimpleValidator(lambda rec: rec["n"] < "a", name="broken"))
+
+        with pytest.raises(TypeError):
+            schema.validate({"n": "1"}, errors)
+
+    def test_the_first_failed_constraint_stops_the_run(self, errors):
+        fail = SimpleValidator(lambda rec: False, name="first")
+        other = SimpleValidator(lambda rec: False, name="second")
+        schema = FormSchema({"n": GetInput()}, [fail, other], constraint_error_fmt="{value} {error_content}")
+
+        assert not schema.validate({"n": "a"}, errors).valid
+        assert errors.messages == ["{'n': 'a'} is not a valid first"]
+
+    def test_braces_in_field_names(self, errors):
+        schema = FormSchema({"{odd}": GetInput(convertor=IntConvertor())})
+        schema.validate({"{odd}": "x"}, errors)
+        assert errors.messages == ['{odd}: "x" cannot be converted to an integer number']
+
+    def test_default_error_callback_prints(self, capsys):
+        make_schema().validate({"name": "Len", "age": "x"})
+        assert 'age: "x"' in capsys.readouterr().err
+
+
+class TestValidateRecords:
+    def test_streams_csv(self, errors):
+        text = "name,age,min,max\nLen,42,,\nBob,x,1,2\n,3,5,4\n"
+        responses = list(make_schema().validate_records(csv.DictReader(io.StringIO(text)), error_callback=errors))
+
+        assert [response.valid for response in responses] == [True, False, False]
+        assert responses[0].values == {"name": "Len", "age": 42, "min": None, "max": 100}
+        assert len(errors.messages) == 2
+
+    def test_streams_jsonl(self, errors):
+        lines = io.StringIO('{"name": "Len", "age": 42}\n{"name": "Ann", "age": 200}\n')
+        responses = make_schema().validate_records(map(json.loads, lines), error_callback=errors)
+
+        assert [(response.valid, response.values["age"]) for response in responses] == [(True, 42), (False, None)]
+        assert errors.messages == ['age: "200" too high (max_val=150)']
+
+    def test_is_lazy(self, errors):
+        def records():
+            yield {"name": "a", "age": "1"}
+            raise AssertionError("read too far")
+
+        assert next(make_schema().validate_records(records(), error_callback=errors)).valid
+
+    def test_chunks(self, errors):
+        records = [{"name": "a", "age": str(i)} for i in range(5)]
+        chunks = list(make_schema().validate_records(records, chunk_size=2, error_callback=errors))
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        assert [response.values["age"] for chunk in chunks for response in chunk] == [0, 1, 2, 3, 4]
+
+    def test_bad_chunk_size(self):
+        with pytest.raises(ValueError, match="FormSchema.validate_records"):
+            next(make_schema().validate_records([], chunk_size=0))
+
+    def test_metrics_are_recorded(self, errors):
+        metrics = PipelineMetrics()
+        previous = set_metrics(metrics)
+        try:
+            list(make_schema().validate_records([{"name": "a", "age": "1"}] * 3, error_callback=errors))
+        finally:
+            set_metrics(previous)
+
+        assert metrics.stages[("validator", "RangeValidator")].count == 3
+
+
+class TestFormSchema:
+    def test_fields_must_be_get_inputs(self):
+        with pytest.raises(TypeError, match="field 'age' must be a GetInput"):
+            FormSchema({"age": IntConvertor()})  # ty: ignore[invalid-argument-type]
+
+    def test_constraints_must_be_callable(self):
+        with pytest.raises(TypeError, match="constraint must be a validator"):
+            FormSchema({"n": GetInput()}, [5])  # ty: ignore[invalid-argument-type]
+
+    def test_repr_and_exports(self):
+        assert repr(make_schema()) == "FormSchema(name, age, min, max)"
+        assert ci.DEFAULT_CONSTRAINT_ERROR == DEFAULT_CONSTRAINT_ERROR == "record {error_content}"
+        assert FormResponse._fields == ("valid", "values", "failed")
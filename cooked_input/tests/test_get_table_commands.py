@@ -125,6 +125,68 @@ class TestCommandActionsInGetInput:
         assert received == [("/echo", "hello world")]
 
 
+def echo_command(name):
+    """A command using the value ``name:cmd_str:cmd_vars``, to show which command was called and with what."""
+    return GetInputCommand(lambda cmd_str, cmd_vars, cmd_dict:
+                           CommandResponse(ci.COMMAND_ACTION_USE_VALUE, f"{name}:{cmd_str}:{cmd_vars}"))
+
+
+class TestCommandDispatch:
+    """Which command a response calls: the longest command string it starts with, whatever the dict order."""
+
+    @pytest.mark.parametrize("order", [["/h", "/help"], ["/help", "/h"]], ids=["short first", "long first"])
+    @pytest.mark.parametrize("response, expected", [
+        ("/help", "help:/help:"),
+        ("/help me", "help:/help:me"),
+        ("/h", "h:/h:"),
+        ("/he", "h:/h:e"),
+        ("/hx 3", "h:/h:x 3"),
+        ("  /help  topic ", "help:/help:topic"),
+    ])
+    def test_longest_command_wins(self, fake_input, order, response, expected):
+        commands = {cmd: echo_command(cmd.strip("/")) for cmd in order}
+        feeder = fake_input(response)
+        assert get_input(commands=commands) == expected
+        assert feeder.remaining == 0
+
+    def test_a_response_matching_no_command_is_a_value(self, fake_input):
+        fake_input("help", "/x")
+        commands = {"/help": echo_command("help")}
+        assert get_input(commands=commands) == "help"
+        assert get_input(commands=commands) == "/x"
+
+    def test_many_commands(self, fake_input):
+        commands = {f"/cmd{i}": echo_command(str(i)) for i in range(1000)}
+        fake_input("/cmd7", "/cmd77 x", "/cmd777")
+        assert [get_input(commands=commands) for _ in range(3)] == ["7:/cmd7:", "77:/cmd77:x", "777:/cmd777:"]
+
+    def test_an_empty_command_string_matches_everything_else(self, fake_input):
+        commands = {"": echo_command("any"), "/q": echo_command("q")}
+        fake_input("hello", "/q now")
+        assert get_input(commands=commands) == "any::hello"
+        assert get_input(commands=commands) == "q:/q:now"
+
+    def test_assigning_commands_rebuilds_the_dispatch(self, fake_input):
+        gi = ci.GetInput(commands={"/a": echo_command("a")})
+        fake_input("/a", "/a")
+        assert gi.get_input() == "a:/a:"
+        gi.commands = {"/a": echo_command("new a")}
+        assert gi.get_input() == "new a:/a:"
+
+    def test_changing_commands_in_place_rebuilds_the_dispatch(self, fake_input):
+        commands = {"/a": echo_command("a")}
+        gi = ci.GetInput(commands=commands)
+        fake_input("/a", "/b", "/a", "/ab")
+        assert gi.get_input() == "a:/a:"
+        commands["/b"] = echo_command("b")
+        assert gi.get_input() == "b:/b:"
+        commands["/a"] = echo_command("new a")
+        assert gi.get_input() == "new a:/a:"
+        del commands["/b"]
+        commands["/ab"] = echo_command("ab")     # the same size, a different command
+        assert gi.get_input() == "ab:/ab:"
+
+
 ALL_NAV_COMMANDS = {
     "/n": GetInputCommand(ci.next_page_cmd_action),
     "/p": GetInputCommand(ci.prev_page_cmd_action),
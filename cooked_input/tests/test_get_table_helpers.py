@@ -1,6 +1,6 @@
 """Tests for the module-level table helpers.
 
-Covers create_rows and create_table, the four ``return_*_action`` row actions, the
+Covers create_rows, iter_rows and create_table, the four ``return_*_action`` row actions, the
 show_table / get_table_input wrappers, and get_menu.
 
 One thing that surprises people about ``create_rows``: the *first* field becomes the
@@ -21,6 +21,7 @@ from cooked_input import (
     TableStyle,
     create_rows,
     create_table,
+    iter_rows,
     get_menu,
     get_table_input,
     show_table,
@@ -85,6 +86,81 @@ class TestCreateRowsFetchStrategies:
         assert rows[0].item_data == {"origin": "test", "item": printer}
 
 
+class TestCreateRowsOneField:
+    @pytest.mark.parametrize("item", [
+        pytest.param(HasAttributes("Beast", "IO-PROD", "Model One G2"), id="getattr"),
+        pytest.param({"name": "Beast"}, id="dict"),
+        pytest.param(["Beast"], id="getitem"),
+    ])
+    def test_the_one_field_is_the_tag(self, item):
+        rows = create_rows([item], ["name"])
+        assert (rows[0].tag, rows[0].values) == ("Beast", [])
+
+        rows = create_rows([item], ["name"], gen_tags=True)
+        assert (rows[0].tag, rows[0].values) == (None, ["Beast"])
+
+
+class TestCreateRowsMissingDictKeys:
+    def test_a_missing_key_is_none(self):
+        items = [{"name": "Beast", "location": "IO-PROD"}, {"name": "Ford2"}]
+        rows = create_rows(items, ["name", "location"])
+        assert [row.values for row in rows] == [["IO-PROD"], [None]]
+
+
+class TestItemDataCopies:
+    def test_each_row_has_its_own_copy(self):
+        item_data = {"origin": "test"}
+        rows = create_rows([["a"], ["b"]], ["name"], item_data=item_data)
+        assert rows[0].item_data == item_data
+        assert rows[0].item_data is not item_data and rows[0].item_data is not rows[1].item_data
+
+    def test_share_item_data_makes_one_copy_for_every_row(self):
+        item_data = {"origin": "test"}
+        rows = create_rows([["a"], ["b"]], ["name"], item_data=item_data, share_item_data=True)
+        assert rows[0].item_data == item_data
+        assert rows[0].item_data is not item_data and rows[0].item_data is rows[1].item_data
+
+    def test_share_item_data_without_item_data(self):
+        rows = create_rows([["a"]], ["name"], share_item_data=True)
+        assert rows[0].item_data is None
+
+    def test_share_item_data_and_add_item_to_item_data_are_rejected(self):
+        with pytest.raises(ValueError, match="share_item_data cannot be used with add_item_to_item_data"):
+            create_rows([["a"]], ["name"], add_item_to_item_data=True, share_item_data=True)
+
+    def test_create_table_passes_share_item_data_on(self):
+        table = create_table([["a", 1], ["b", 2]], ["name", "n"], item_data={"k": 1}, share_item_data=True)
+        table.refresh_items()
+        assert table._table_items[0].item_data is table._table_items[1].item_data
+
+
+class TestIterRows:
+    def test_rows_are_made_as_they_are_asked_for(self):
+        read = []
+
+        def items():
+            for name in ("a", "b", "c"):
+                read.append(name)
+                yield [name, name.upper()]
+
+        rows = iter_rows(items(), ["name", "upper"])
+        assert read == []
+        first = next(rows)
+        assert (first.tag, first.values, read) == ("a", ["A"], ["a"])
+        assert [row.tag for row in rows] == ["b", "c"]
+
+    def test_the_same_rows_as_create_rows(self):
+        items = {1: Printer("Beast", "IO-PROD", "Model One G2"), 2: Printer("Seth", "IO-PROD", "Cell")}
+        made = [(row.tag, row.values) for row in iter_rows(items, FIELDS)]
+        assert made == [(row.tag, row.values) for row in create_rows(items, FIELDS)]
+
+    def test_a_table_from_iter_rows(self, fake_input, capsys):
+        table = Table(iter_rows(iter([["Beast", "IO-PROD"], ["Ford2", "Dearborn"]]), ["name", "location"]),
+                      col_names=["Location"], default_action="first_value")
+        fake_input("ford2")
+        assert table.get_table_choice() == "Dearborn"
+
+
 class TestCreateRowsErrors:
     def test_an_item_with_no_usable_accessor_raises(self):
         with pytest.raises(RuntimeError, match="needs one of getattr, get, or __getitem__"):
@@ -94,6 +170,10 @@ class TestCreateRowsErrors:
         with pytest.raises(RuntimeError, match="cannot fetch field values"):
             create_rows([["only-one-value"]], ["name", "location"])
 
+    def test_a_later_item_shorter_than_the_field_list_raises(self):
+        with pytest.raises(RuntimeError, match="cannot fetch field values"):
+            create_rows([["a", "b"], ["only-one-value"]], ["name", "location"])
+
 
 class TestRowActions:
     """The four built-in actions, each a single line."""
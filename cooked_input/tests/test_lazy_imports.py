@@ -0,0 +1,95 @@
+"""Tests for the deferred imports of dateparser and prettytable.
+
+``import cooked_input`` should not load either library; the table names and ``DateConvertor``
+pull them in the first time they are used. Whether a module is already in ``sys.modules``
+depends on what every earlier test imported, so the import checks run in a fresh interpreter.
+
+Len Wanger, 2026
+"""
+
+import subprocess
+import sys
+import types
+
+import pytest
+
+import cooked_input
+
+
+def _run(code):
+    """Run ``code`` in a fresh interpreter and return what it printed."""
+    return subprocess.check_output([sys.executable, '-c', code], text=True).split()
+
+
+class TestImportIsLazy:
+    def test_import_loads_neither_library(self):
+        code = ('import sys, cooked_input\n'
+                'print("dateparser" in sys.modules, "prettytable" in sys.modules)')
+        assert _run(code) == ['False', 'False']
+
+    def test_get_int_needs_neither_library(self):
+        code = ('import sys, cooked_input\n'
+                'print(cooked_input.process_value("7", convertor=cooked_input.IntConvertor()).value)\n'
+                'print("dateparser" in sys.modules, "prettytable" in sys.modules)')
+        assert _run(code) == ['7', 'False', 'False']
+
+    def test_import_does_not_load_asyncio(self):
+        code = ('import sys, cooked_input\n'
+                'print("asyncio" in sys.modules)\n'
+                'cooked_input.StreamInputSource\n'
+                'print("asyncio" in sys.modules)')
+        assert _run(code) == ['False', 'True']
+
+    def test_table_name_loads_prettytable(self):
+        code = ('import sys, cooked_input\n'
+                'cooked_input.Table\n'
+                'print("prettytable" in sys.modules)')
+        assert _run(code) == ['True']
+
+    def test_date_convertor_loads_dateparser_on_call(self):
+        code = ('import sys, cooked_input\n'
+                'dc = cooked_input.DateConvertor()\n'
+                'print("dateparser" in sys.modules)\n'
+                'dc("January 2, 2026", None, "")\n'
+                'print("dateparser" in sys.modules)')
+        assert _run(code) == ['False', 'True']
+
+
+class TestModuleGetattr:
+    def test_lazy_name_is_the_real_object(self):
+        from cooked_input.get_table import Table
+        from cooked_input.table_convenience import create_rows
+        assert cooked_input.Table is Table
+        assert cooked_input.create_rows is create_rows
+        assert cooked_input.RULE_FRAME is cooked_input.get_table.RULE_FRAME
+
+    def test_lazy_submodules(self):
+        # Once any test has imported the submodule it is a plain attribute of the package, so
+        # ask __getattr__ directly rather than relying on test order.
+        assert cooked_input.__getattr__('table_convenience').__name__ == 'cooked_input.table_convenience'
+
+    def test_unknown_name_raises_attribute_error(self):
+        with pytest.raises(AttributeError, match='no_such_thing'):
+            cooked_input.no_such_thing
+
+    def test_dir_lists_lazy_names(self):
+        names = dir(cooked_input)
+        for name in ('Table', 'get_menu', 'TABLE_RETURN_ROW', 'get_table', 'GetInput'):
+            assert name in names
+
+
+class TestStarImport:
+    def test_all_lists_every_public_name(self):
+        eager = {name for name, value in vars(cooked_input).items()
+                 if not name.startswith('_') and not isinstance(value, types.ModuleType)
+                 and name not in ('TYPE_CHECKING', 'Any')}
+        assert len(cooked_input.__all__) == len(set(cooked_input.__all__))
+        assert set(cooked_input.__all__) == eager | set(cooked_input._LAZY_ATTRS)
+
+    def test_star_import_provides_the_lazy_names(self):
+        namespace = {}
+        exec('from cooked_input import *', namespace)
+
+        for name in ('Table', 'TableItem', 'get_menu', 'RULE_FRAME', 'TABLE_RETURN_ROW', 'GetInput', 'get_int'):
+            assert name in namespace
+        assert namespace['Table'] is cooked_input.get_table.Table
@@ -0,0 +1,231 @@
+"""Tests for PipelineMetrics: the opt-in timings and counts for the clean, convert and validate pipeline.
+
+Timings are only checked for being recorded, not for their values -- what a cleaner takes depends on
+the machine. The counts are exact, so they are checked exactly.
+
+Len Wanger, 2026
+"""
+
+import asyncio
+
+import pytest
+
+import cooked_input as ci
+from cooked_input import (
+    COMMAND_ACTION_CANCEL,
+    CommandResponse,
+    GetInput,
+    GetInputCommand,
+    GetInputInterrupt,
+    InputExhaustedError,
+    IntConvertor,
+    LatencyHistogram,
+    MaxRetriesError,
+    PipelineMetrics,
+    RangeValidator,
+    StripCleaner,
+    get_metrics,
+    set_metrics,
+)
+
+
+@pytest.fixture
+def metrics():
+    """Record into a fresh PipelineMetrics for the test, and stop recording afterwards."""
+    metrics = PipelineMetrics()
+    previous = set_metrics(metrics)
+    yield metrics
+    set_metrics(previous)
+
+
+def make_gi(**kwargs):
+    return GetInput(StripCleaner(), IntConvertor(), [RangeValidator(1, 10), 5], **kwargs)
+
+
+class TestLatencyHistogram:
+    def test_empty(self):
+        histogram = LatencyHistogram()
+        assert histogram.count == 0
+        assert histogram.mean is None
+        assert histogram.percentile(0.5) is None
+        assert histogram.buckets() == []
+
+    def test_exact_summary(self):
+        histogram = LatencyHistogram()
+        for seconds in (0.001, 0.002, 0.003):
+            histogram.record(seconds)
+
+        assert histogram.count == 3
+        assert histogram.total == pytest.approx(0.006)
+        assert histogram.mean == pytest.approx(0.002)
+        assert (histogram.min, histogram.max) == (0.001, 0.003)
+        assert "count=3" in repr(histogram)
+
+    def test_percentiles_are_bucket_bounds(self):
+        histogram = LatencyHistogram()
+        for _ in range(99):
+            histogram.record(1e-6)
+        histogram.record(1.0)
+
+        # 1us falls in the bucket under 1024ns, 1s in the one under 2**30ns.
+        assert histogram.percentile(0.5) == pytest.approx(1024e-9)
+        assert histogram.percentile(0.99) == pytest.approx(1024e-9)
+        assert histogram.percentile(1.0) == 1.0     # capped at max
+        assert histogram.percentile(0.0) == pytest.approx(1024e-9)
+        assert histogram.buckets() == [(pytest.approx(1024e-9), 99), (pytest.approx((1 << 30) / 1e9), 1)]
+
+    def test_percentile_never_exceeds_max(self):
+        histogram = LatencyHistogram()
+        histogram.record(600e-9)
+        assert histogram.percentile(0.5) == 600e-9
+
+    def test_huge_times_go_in_the_last_bucket(self):
+        histogram = LatencyHistogram()
+        histogram.record(1e9)
+        assert histogram.buckets()[0][1] == 1
+
+    @pytest.mark.parametrize("fraction", [-0.1, 1.5])
+    def test_bad_fraction(self, fraction):
+        with pytest.raises(ValueError, match="LatencyHistogram.percentile"):
+            LatencyHistogram().percentile(fraction)
+
+    def test_reset(self):
+        histogram = LatencyHistogram()
+        histogram.record(0.5)
+        histogram.reset()
+        assert histogram.count == 0 and histogram.max is None and histogram.buckets() == []
+
+
+class TestSetMetrics:
+    def test_off_by_default(self):
+        assert get_metrics() is None
+
+    def test_set_returns_the_previous(self):
+        first, second = PipelineMetrics(), PipelineMetrics()
+        assert set_metrics(first) is None
+        assert set_metrics(second) is first
+        assert get_metrics() is second
+        assert set_metrics(None) is second
+
+    def test_nothing_recorded_when_off(self):
+        gi = make_gi()
+        pipeline = gi._pipeline()
+        assert gi.process_value("5").valid
+        # Same pipeline as before -- not rebuilt with timing in it.
+        assert gi._pipeline() is pipeline
+
+    def test_turning_metrics_on_and_off_rebuilds_the_pipeline(self, metrics):
+        gi = make_gi()
+        gi.process_value("5")
+        assert metrics.values == 1
+
+        set_metrics(None)
+        gi.process_value("5")
+        set_metrics(metrics)
+        gi.process_value("5")
+        assert metrics.values == 2
+
+
+class TestPipelineTimings:
+    def test_each_stage_is_timed(self, metrics):
+        gi = make_gi()
+        assert gi.process_value(" 5 ") == (True, 5)
+
+        assert set(metrics.stages) == {("cleaner", "StripCleaner"), ("convertor", "IntConvertor"),
+                                       ("validator", "RangeValidator"), ("validator", "equal_to")}
+        assert all(histogram.count == 1 for histogram in metrics.stages.values())
+        assert metrics.values == 1
+        assert metrics.conversion_failures == metrics.validation_failures == 0
+
+    def test_failures_are_counted(self, metrics, capsys):
+        gi = make_gi()
+        results = [gi.process_value(v).valid for v in ("x", "50", "6", "5")]
+        assert results == [False, False, False, True]
+
+        assert metrics.values == 4
+        assert metrics.conversion_failures == 1
+        assert metrics.validation_failures == 2
+        # The convertor ran for all four; each validator only for what reached it.
+        assert metrics.stages[("convertor", "IntConvertor")].count == 4
+        assert metrics.stages[("validator", "RangeValidator")].count == 3
+        assert metrics.stages[("validator", "equal_to")].count == 2
+
+    def test_no_convertor_and_function_stages(self, metrics):
+        def shout(value):
+            return value.upper()
+
+        gi = GetInput(cleaners=shout)  # ty: ignore[invalid-argument-type]
+        assert list(gi.process_values(["a", "b"])) == [(True, "A"), (True, "B")]
+        assert set(metrics.stages) == {("cleaner", "shout")}
+        assert metrics.stages[("cleaner", "shout")].count == 2
+
+    def test_same_kind_and_name_share_a_histogram(self, metrics):
+        GetInput(convertor=IntConvertor()).process_value("1")
+        GetInput(convertor=IntConvertor()).process_value("2")
+        assert metrics.stages[("convertor", "IntConvertor")].count == 2
+
+    def test_reset_keeps_the_histograms_pipelines_hold(self, metrics):
+        gi = make_gi()
+        gi.process_value("5")
+        histogram = metrics.stages[("convertor", "IntConvertor")]
+
+        metrics.reset()
+        assert metrics.values == 0 and histogram.count == 0
+        gi.process_value("5")
+        assert metrics.stages[("convertor", "IntConvertor")] is histogram
+        assert histogram.count == 1
+
+
+class TestPromptMetrics:
+    def test_retries_and_waits(self, metrics, fake_input, capsys):
+        fake_input("5", "x", "50", "7")
+        assert ci.get_int(prompt="a") == 5
+        assert ci.get_int(prompt="b", minimum=1, maximum=10) == 7
+
+        assert metrics.retries == {0: 1, 2: 1}
+        assert metrics.prompts == 2
+        assert metrics.wait.count == 4
+
+    def test_prompts_that_fail_are_counted(self, metrics, fake_input, capsys):
+        cancel = {"/q": GetInputCommand(lambda *args: CommandResponse(COMMAND_ACTION_CANCEL, None))}
+        fake_input("x", "y", "/q")
+
+        with pytest.raises(MaxRetriesError):
+            ci.get_int(prompt="n", retries=2)
+        with pytest.raises(GetInputInterrupt):
+            ci.get_int(prompt="n", commands=cancel)
+
+        assert metrics.retries == {2: 1, 0: 1}
+
+    def test_running_out_of_input_is_not_a_prompt(self, metrics, fake_input):
+        fake_input()
+        with pytest.raises(InputExhaustedError):
+            ci.get_int(prompt="n")
+        assert metrics.prompts == 0
+
+    def test_async_waits(self, metrics):
+        async def source(prompt, hidden):
+            return "3"
+
+        assert asyncio.run(ci.get_int_async(prompt="n", input_source=source)) == 3
+        assert metrics.wait.count == 1
+        assert metrics.retries == {0: 1}
+
+
+class TestReport:
+    def test_report(self, metrics, fake_input, capsys):
+        fake_input("x", "5")
+        make_gi(prompt="n").get_input()
+        report = metrics.report()
+
+        assert "convertor IntConvertor" in report
+        assert "wait user" in report
+        assert "values: 2  conversion failures: 1  validation failures: 0" in report
+        assert "prompts: 1  retries per prompt: 1: 1" in report
+        assert repr(metrics) == ("PipelineMetrics(values=2, conversion_failures=1, validation_failures=0, "
+                                 "prompts=1)")
+
+    def test_empty_report(self, metrics):
+        report = metrics.report()
+        assert "wait" not in report
+        assert "retries per prompt: -" in report
@@ -7,13 +7,22 @@ involved. It had no coverage at all.
 Len Wanger, 2026
 """
 
+import concurrent.futures
+import csv
 import decimal
+import importlib
+import os
+import pickle
 
 import pytest
 
+from cooked_input.convertors import _SNIFF_CACHE_MAX_LEN, _cached_sniff_dialect
+from cooked_input.input_utils import compose
+from cooked_input.validators import _in_all
 from cooked_input import (
     BooleanConvertor,
     ChoiceConvertor,
+    Cleaner,
     ChoiceValidator,
     ConvertorError,
     DecimalConvertor,
@@ -23,6 +32,10 @@ from cooked_input import (
     RangeValidator,
     StripCleaner,
     CapitalizationCleaner,
+    GetInput,
+    GetInputCommand,
+    SimpleValidator,
+    next_page_cmd_action,
     process_value,
     silent_error,
 )
@@ -84,6 +97,278 @@ class TestProcessValue:
         assert received == ["custom: {value}"]
 
 
+class TestProcessValues:
+    """The bulk form of process_value: same pipeline, setup hoisted out of the loop."""
+
+    def test_results_come_back_in_order_one_per_value(self):
+        gi = GetInput(cleaners=StripCleaner(), convertor=IntConvertor(),
+                      validators=RangeValidator(1, 10), error_callback=silent_error)
+        assert list(gi.process_values([" 1 ", "x", "11", "10"])) == [
+            (True, 1), (False, None), (False, None), (True, 10)]
+
+    def test_each_result_matches_process_value(self):
+        gi = GetInput(cleaners=[StripCleaner(), CapitalizationCleaner("lower")],
+                      validators=ChoiceValidator(["yes", "no"]), error_callback=silent_error)
+        values = ["  YES", "no ", "maybe", ""]
+        assert list(gi.process_values(values)) == [gi.process_value(v) for v in values]
+
+    def test_values_are_read_lazily(self):
+        consumed = []
+
+        def source():
+            for i in range(1000000):
+                consumed.append(i)
+                yield str(i)
+
+        results = GetInput(convertor=IntConvertor()).process_values(source())
+        assert next(results) == (True, 0)
+        assert consumed == [0]
+
+    def test_chunk_size_yields_lists(self):
+        gi = GetInput(convertor=IntConvertor())
+        chunks = list(gi.process_values((str(i) for i in range(5)), chunk_size=2))
+        assert [len(c) for c in chunks] == [2, 2, 1]
+        assert chunks[2] == [(True, 4)]
+
+    def test_a_chunk_size_below_one_is_rejected(self):
+        with pytest.raises(ValueError, match="chunk_size"):
+            next(GetInput().process_values(["a"], chunk_size=0))
+
+    def test_failures_reach_the_error_callback_per_value(self):
+        received = []
+        gi = GetInput(convertor=IntConvertor(),
+                      error_callback=lambda fmt, v, ec: received.append(v))
+        gi.process_value_list(["a", "1", "b"])
+        assert received == ["a", "b"]
+
+    def test_process_value_list_returns_a_list(self):
+        assert GetInput().process_value_list(iter(["a", "b"])) == [(True, "a"), (True, "b")]
+
+    def test_a_single_cleaner_and_no_cleaners_both_work(self):
+        assert GetInput(cleaners=StripCleaner()).process_value_list([" a "]) == [(True, "a")]
+        assert GetInput(cleaners=None).process_value_list([" a "]) == [(True, " a ")]
+
+    def test_cleaners_that_are_neither_callable_nor_iterable_are_rejected(self):
+        with pytest.raises(RuntimeError, match="cannot be called"):
+            GetInput(cleaners=42).process_value_list(["a"])  # ty: ignore[invalid-argument-type]
+
+
+# The module, which `import cooked_input.get_input` would not give: the package's get_input function hides it.
+get_input_module = importlib.import_module("cooked_input.get_input")
+
+
+def is_even(value):
+    # At module level, so a worker process can unpickle a SimpleValidator using it.
+    return value % 2 == 0
+
+
+class FileErrorCallback:
+    """An error callback appending each call, and the process making it, to a file: picklable, so it can be
+    sent to a worker process, unlike a list to append to."""
+    def __init__(self, path):
+        self.path = path
+
+    def __call__(self, fmt_str, value, error_content):
+        with open(self.path, "a") as f:
+            f.write("{} {}\n".format(os.getpid(), value))
+
+
+class TestProcessValuesParallel:
+    """process_values spread over worker processes: the same results, in order, with the error callback
+    called here rather than in the workers."""
+
+    @staticmethod
+    def make_gi(**kwargs):
+        return GetInput(StripCleaner(), IntConvertor(), [RangeValidator(0, 80), SimpleValidator(is_even, "even")],
+                        **kwargs)
+
+    def test_matches_process_values_in_order(self):
+        values = [" {} ".format(i) for i in range(100)] + ["x", "", "81"]
+        gi = self.make_gi(error_callback=silent_error)
+        expected = list(gi.process_values(values))
+        assert list(gi.process_values_parallel(values, workers=2, chunk_size=3)) == expected
+
+    def test_errors_are_reported_here_in_order(self):
+        received = []
+        # A lambda: the callback never leaves this process, so it need not be picklable.
+        gi = self.make_gi(error_callback=lambda fmt, value, content: received.append((fmt, value, content)))
+        list(gi.process_values_parallel(["2", "x", "3", "100", "4"], workers=2, chunk_size=1))
+
+        assert received == [
+            (gi.convertor_error_fmt, "x", "an integer number"),
+            (gi.validator_error_fmt, 3, "is not a valid even"),
+            (gi.validator_error_fmt, 100, "too high (max_val=80)"),
+        ]
+
+    def test_nothing_to_do(self):
+        assert list(GetInput().process_values_parallel([], workers=2)) == []
+
+    def test_values_are_read_a_few_chunks_ahead(self):
+        consumed = []
+
+        def source():
+            for i in range(1000000):
+                consumed.append(i)
+                yield str(i)
+
+        results = GetInput(convertor=IntConvertor()).process_values_parallel(source(), workers=1, chunk_size=10)
+        assert next(results) == (True, 0)
+        assert len(consumed) <= 30
+        results.close()
+
+    def test_defaults_to_the_cpu_count(self, monkeypatch):
+        monkeypatch.setattr("os.cpu_count", lambda: None)   # unknown, so one worker
+        assert list(GetInput(convertor=IntConvertor()).process_values_parallel(["1", "2"])) == [(True, 1), (True, 2)]
+
+    def test_nested_get_input_goes_to_the_workers(self):
+        gi = GetInput(convertor=ListConvertor(elem_get_input=GetInput(convertor=IntConvertor())),
+                      error_callback=silent_error)
+        gi.process_value("1,2")     # compiles the pipelines, which are not sent
+        assert list(gi.process_values_parallel(["1,2", "3", "a"], workers=2, chunk_size=1)) == [
+            (True, [1, 2]), (True, [3]), (False, None)]
+
+    def test_a_nested_get_input_reports_from_the_workers(self, tmp_path):
+        path = tmp_path / "errors.txt"
+        received = []
+        elem_gi = GetInput(convertor=IntConvertor(), error_callback=FileErrorCallback(str(path)))
+        gi = GetInput(convertor=ListConvertor(elem_get_input=elem_gi),
+                      error_callback=lambda fmt, value, content: received.append(value))
+
+        assert list(gi.process_values_parallel(["1,x", "2"], workers=1)) == [(False, None), (True, [2])]
+        pid, value = path.read_text().split()
+        assert value == "x" and int(pid) != os.getpid()     # the nested callback, called in the worker
+        assert received == []                                   # and not routed to this instance's
+
+    def test_closing_early_drops_the_queued_chunks(self, monkeypatch):
+        # A with block would shut the pool down waiting for every chunk sent; closing must cancel those not started.
+        calls = []
+        shutdown = concurrent.futures.ProcessPoolExecutor.shutdown
+
+        def spy(executor, *args, **kwargs):
+            calls.append(kwargs)
+            return shutdown(executor, *args, **kwargs)
+
+        monkeypatch.setattr(concurrent.futures.ProcessPoolExecutor, "shutdown", spy)
+        results = GetInput(convertor=IntConvertor()).process_values_parallel(map(str, range(100)), workers=2,
+                                                                             chunk_size=1)
+        assert next(results) == (True, 0)
+        results.close()
+        assert calls == [{"cancel_futures": True}]
+
+    @pytest.mark.parametrize("workers, chunk_size, message", [(0, 1, "workers"), (1, 0, "chunk_size")])
+    def test_bad_arguments_are_rejected(self, workers, chunk_size, message):
+        with pytest.raises(ValueError, match=message):
+            next(GetInput().process_values_parallel(["a"], workers=workers, chunk_size=chunk_size))
+
+    def test_the_worker_functions_in_process(self, monkeypatch):
+        # What the workers run, run here, where coverage can see it.
+        monkeypatch.setattr(get_input_module, "_worker_get_input", None)
+
+        with pytest.raises(RuntimeError, match="not started"):
+            get_input_module._process_parallel_chunk(["1"])
+
+        gi = self.make_gi()
+        get_input_module._start_parallel_worker((gi.cleaners, gi.convertor, gi.validators, "c: {value}", "v: {value}"))
+        assert get_input_module._process_parallel_chunk(["2", "x", "3"]) == [
+            (True, 2, []), (False, None, [("c: {value}", "x", "an integer number")]),
+            (False, None, [("v: {value}", 3, "is not a valid even")])]
+
+    def test_get_input_pickles_without_its_compiled_state(self):
+        gi = GetInput(convertor=IntConvertor(), commands={"/x": GetInputCommand(next_page_cmd_action)})
+        gi.process_value("1")
+        gi._commands()
+        copy = pickle.loads(pickle.dumps(gi))
+
+        assert copy._compiled_pipeline is None and copy._command_trie is None
+        assert gi._compiled_pipeline is not None    # the original keeps its own
+        assert copy.process_value("5") == (True, 5)
+
+
+class TestCompiledPipeline:
+    """process_value runs a pipeline compiled once per GetInput; it must agree with the
+    compose/_in_all path it replaced."""
+
+    @staticmethod
+    def reference(gi, value, error_callback):
+        # The per-call dispatch process_value used before the pipeline was compiled.
+        cleaned = compose(value, gi.cleaners) if gi.cleaners else value
+        try:
+            converted = gi.convertor(cleaned, error_callback, gi.convertor_error_fmt) if gi.convertor else cleaned
+        except ConvertorError:
+            return (False, None)
+        if _in_all(converted, gi.validators, error_callback, gi.validator_error_fmt):
+            return (True, converted)
+        return (False, None)
+
+    @pytest.mark.parametrize("kwargs", [
+        {},
+        {"cleaners": StripCleaner()},
+        {"cleaners": [StripCleaner(), CapitalizationCleaner("upper")]},
+        {"convertor": IntConvertor(), "validators": RangeValidator(1, 10)},
+        {"convertor": IntConvertor(), "validators": [RangeValidator(1, 10), 5]},
+        {"convertor": IntConvertor(), "validators": 7},
+        {"validators": "abc"},
+        {"cleaners": StripCleaner(), "validators": ChoiceValidator(["a", "b"])},
+    ])
+    @pytest.mark.parametrize("value", ["5", " 7 ", "abc", "", "a", "11", " B "])
+    def test_agrees_with_the_uncompiled_path(self, kwargs, value):
+        compiled_errors, reference_errors = [], []
+        gi = GetInput(error_callback=lambda *args: compiled_errors.append(args), **kwargs)
+        expected = self.reference(gi, value, lambda *args: reference_errors.append(args))
+        assert gi.process_value(value) == expected
+        assert compiled_errors == reference_errors
+
+    def test_the_pipeline_is_built_once(self):
+        gi = GetInput(convertor=IntConvertor())
+        gi.process_value("1")
+        first = gi._compiled_pipeline
+        gi.process_value("2")
+        assert gi._compiled_pipeline is first
+
+    @pytest.mark.parametrize("attr, new_value, expected", [
+        ("convertor", None, (True, "8")),
+        ("validators", RangeValidator(1, 5), (False, None)),
+        ("cleaners", lambda v: v + "0", (True, 80)),
+    ])
+    def test_reassigning_part_of_the_pipeline_rebuilds_it(self, attr, new_value, expected):
+        gi = GetInput(convertor=IntConvertor(), error_callback=silent_error)
+        assert gi.process_value("8") == (True, 8)
+        setattr(gi, attr, new_value)
+        assert gi.process_value("8") == expected
+
+    def test_changing_a_list_in_place_rebuilds_it(self):
+        cleaners: list = [StripCleaner()]
+        validators = [RangeValidator(1, 10)]
+        gi = GetInput(cleaners=cleaners, convertor=IntConvertor(), validators=validators, error_callback=silent_error)
+        assert gi.process_value(" 8 ") == (True, 8)
+
+        validators.append(RangeValidator(1, 5))
+        assert gi.process_value(" 8 ") == (False, None)
+        validators[1] = RangeValidator(1, 9)
+        assert gi.process_value(" 8 ") == (True, 8)
+        cleaners.insert(0, lambda v: v + "0")
+        assert gi.process_value(" 8") == (False, None)   # 80 now
+
+    def test_an_unchanged_list_keeps_the_pipeline(self):
+        gi = GetInput(convertor=IntConvertor(), validators=[RangeValidator(1, 10)])
+        gi.process_value("1")
+        first = gi._compiled_pipeline
+        gi.process_value("2")
+        assert gi._compiled_pipeline is first
+
+    def test_the_error_callback_can_change_after_the_pipeline_is_built(self):
+        received = []
+        gi = GetInput(convertor=IntConvertor(), error_callback=silent_error)
+        gi.process_value("x")
+        gi.error_callback = lambda fmt, v, ec: received.append(v)
+        gi.process_value("y")
+        assert received == ["y"]
+
+    def test_a_failure_is_a_process_value_response(self):
+        result = GetInput(validators=5, error_callback=silent_error).process_value(4)
+        assert (result.valid, result.value) == (False, None)
+
+
 class TestChoiceConvertor:
     """Used internally by Table to map a typed tag to a row index; no direct test before."""
 
@@ -121,6 +406,81 @@ class TestListConvertor:
     def test_leading_space_after_the_delimiter_is_dropped(self):
         assert convert(ListConvertor(), "a, b,  c") == ["a", "b", "c"]
 
+    def test_the_csv_dialect_registry_is_left_alone(self):
+        before = csv.list_dialects()
+        convert(ListConvertor(delimiter=":"), "a:b")
+        convert(ListConvertor(delimiter=None), "a;b")
+        assert csv.list_dialects() == before
+
+    def test_each_convertor_keeps_its_own_delimiter(self):
+        colons, pipes = ListConvertor(delimiter=":"), ListConvertor(delimiter="|")
+        assert convert(colons, "a:b|c") == ["a", "b|c"]
+        assert convert(pipes, "a:b|c") == ["a:b", "c"]
+        assert convert(colons, "a:b|c") == ["a", "b|c"]
+
+    def test_a_bad_delimiter_is_reported_by_the_constructor(self):
+        with pytest.raises(TypeError):
+            ListConvertor(delimiter="::")
+
+    def test_quoted_elements_keep_their_delimiters(self):
+        assert convert(ListConvertor(), '"a,b", c') == ["a,b", "c"]
+
+    def test_a_sniffed_quote_character_is_kept(self):
+        assert convert(ListConvertor(delimiter=None), "'a;b';c;d") == ["a;b", "c", "d"]
+
+    def test_a_sniffed_dialect_is_cached(self):
+        lc = ListConvertor(delimiter=None)
+        convert(lc, "x;y;z;w")
+        hits = _cached_sniff_dialect.cache_info().hits
+        assert convert(lc, "x;y;z;w") == ["x", "y", "z", "w"]
+        assert _cached_sniff_dialect.cache_info().hits == hits + 1
+
+    def test_a_long_value_is_sniffed_but_not_cached(self):
+        value = ";".join(["abc"] * (_SNIFF_CACHE_MAX_LEN // 4 + 1))
+        assert len(value) > _SNIFF_CACHE_MAX_LEN
+
+        misses = _cached_sniff_dialect.cache_info().misses
+        assert convert(ListConvertor(delimiter=None), value) == ["abc"] * (_SNIFF_CACHE_MAX_LEN // 4 + 1)
+        assert _cached_sniff_dialect.cache_info().misses == misses
+
+    def test_an_unsniffable_value_raises(self):
+        with pytest.raises(csv.Error):
+            convert(ListConvertor(delimiter=None), "")
+
+
+class TestListConvertorIterConvert:
+    def test_elements_are_converted_as_they_are_read(self):
+        seen = []
+
+        class Recorder(Cleaner):
+            def __call__(self, value):
+                seen.append(value)
+                return value
+
+        lc = ListConvertor(elem_get_input=GetInput(cleaners=Recorder(), convertor=IntConvertor()))
+        elements = lc.iter_convert("1,2,3")
+        assert seen == []
+        assert next(elements) == 1
+        assert seen == ["1"]
+        assert list(elements) == [2, 3]
+
+    def test_without_elem_get_input_the_strings_are_given(self):
+        assert list(ListConvertor().iter_convert("a, b")) == ["a", "b"]
+
+    def test_an_empty_value_gives_nothing(self):
+        assert list(ListConvertor(elem_get_input=GetInput(convertor=IntConvertor())).iter_convert("")) == []
+
+    def test_a_bad_element_raises_after_the_good_ones(self):
+        lc = ListConvertor(elem_get_input=GetInput(convertor=IntConvertor(), error_callback=silent_error))
+        elements = lc.iter_convert("1,x,3")
+        assert next(elements) == 1
+        with pytest.raises(ConvertorError, match="list of values"):
+            next(elements)
+
+    def test_agrees_with_calling_the_convertor(self):
+        lc = ListConvertor(delimiter=None, elem_get_input=GetInput(convertor=IntConvertor()))
+        assert list(lc.iter_convert("1;2;3")) == convert(lc, "1;2;3") == [1, 2, 3]
+
 
 class TestIntConvertorBases:
     @pytest.mark.parametrize("base, text, expected", [
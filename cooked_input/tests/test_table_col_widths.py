@@ -0,0 +1,122 @@
+"""Tests for TableStyle col_widths: widths fitted to the page, to the whole table, or fixed.
+
+Len Wanger, 2026
+"""
+
+import pytest
+
+from cooked_input import ColumnStore, TABLE_REFRESH_AUTO, TABLE_WIDTHS_PAGE, TABLE_WIDTHS_TABLE, Table, TableItem, TableStyle
+
+
+def make_rows():
+    # the first page is narrow, the second wide
+    return [TableItem(["short" if i < 5 else "a much longer value {}".format(i), "{unit}"]) for i in range(10)]
+
+
+def make_table(col_widths, rows=None, **kwargs):
+    kwargs.setdefault("refresh", False)
+    return Table(make_rows() if rows is None else rows, col_names=["Name", "Unit"], action_dict={"unit": "kg"},
+                 style=TableStyle(rows_per_page=5, col_widths=col_widths), **kwargs)
+
+
+def page_width(table, start):
+    table.show_rows(start)
+    return len(table._render(table.field_names).splitlines()[0])
+
+
+class TestTableStyle:
+    def test_the_default_is_page(self):
+        assert TableStyle().col_widths == TABLE_WIDTHS_PAGE
+
+    def test_fixed_widths_are_a_list(self):
+        assert TableStyle(col_widths=(5, None)).col_widths == [5, None]
+
+    @pytest.mark.parametrize("col_widths", ["wide", 5, [5, 0], [5, "5"]])
+    def test_bad_values(self, col_widths):
+        with pytest.raises(ValueError, match="col_widths"):
+            TableStyle(col_widths=col_widths)
+
+
+class TestPageWidths:
+    def test_columns_fit_each_page(self):
+        table = make_table(TABLE_WIDTHS_PAGE)
+        assert page_width(table, 0) < page_width(table, 5)
+
+
+class TestTableWidths:
+    def test_every_page_is_as_wide_as_the_widest(self):
+        table = make_table(TABLE_WIDTHS_TABLE)
+        assert page_width(table, 0) == page_width(table, 5)
+
+    def test_fits_the_widest_page(self):
+        table = make_table(TABLE_WIDTHS_TABLE)
+        assert page_width(table, 0) == page_width(make_table(TABLE_WIDTHS_PAGE), 5)
+
+    def test_hidden_rows_do_not_count(self):
+        rows = make_rows()
+        for row in rows[5:]:
+            row.hidden = True
+        table = make_table(TABLE_WIDTHS_TABLE, rows=rows)
+        assert page_width(table, 0) == page_width(make_table(TABLE_WIDTHS_PAGE), 0)
+
+    def test_refresh_items_measures_again(self):
+        rows = make_rows()
+        table = make_table(TABLE_WIDTHS_TABLE, rows=rows)
+        del rows[5:]
+        table.refresh_items(rows)
+        assert page_width(table, 0) == page_width(make_table(TABLE_WIDTHS_PAGE), 0)
+
+    def test_a_dirty_row_changes_the_widths(self):
+        # Only the row marked dirty is measured again: a row can make its column wider, and narrower again.
+        table = make_table(TABLE_WIDTHS_TABLE, refresh=TABLE_REFRESH_AUTO)
+        table._prep_get_input()
+        narrow = page_width(table, 0)
+
+        item = table._table_items[9]
+        item.values[0] = "x" * 60
+        table.mark_dirty(item)
+        table._prep_get_input()
+        assert page_width(table, 0) == narrow + 60 - len("a much longer value 9")
+
+        item.values[0] = "x"
+        table.mark_dirty(item)
+        table._prep_get_input()
+        assert page_width(table, 0) == narrow
+
+    def test_formatted_values_are_measured(self):
+        table = make_table(TABLE_WIDTHS_TABLE)
+        table.action_dict["unit"] = "kilograms"
+        table.refresh_items(add_exit=True)
+        assert "kilograms" in table._render(table.field_names)
+        assert "Unit      |" in table._render(table.field_names)
+
+    def test_not_for_windowed_tables(self):
+        with pytest.raises(ValueError, match="TABLE_WIDTHS_TABLE"):
+            make_table(TABLE_WIDTHS_TABLE, windowed=True)
+
+    def test_not_for_data_sources(self):
+        with pytest.raises(ValueError, match="TABLE_WIDTHS_TABLE"):
+            Table(ColumnStore([["a", "b"]]), col_names=["Name"], style=TableStyle(col_widths=TABLE_WIDTHS_TABLE))
+
+
+class TestFixedWidths:
+    @pytest.mark.parametrize("windowed", [False, True], ids=["plain", "windowed"])
+    def test_every_page_is_the_same_width(self, windowed):
+        # start at 4, so that the tags (which still fit the page) are all one digit
+        table = make_table([12, 4], windowed=windowed)
+        assert page_width(table, 0) == page_width(table, 4)
+
+    def test_long_values_are_wrapped(self):
+        table = make_table([12, None])
+        table.show_rows(5)
+        lines = table._render(table.field_names).splitlines()
+        assert "| a much       |" in lines[3]
+        assert len(lines) > 5 + 4
+
+    def test_none_fits_the_page(self):
+        narrow, wide = page_width(make_table([12, None]), 0), page_width(make_table([12, 20]), 0)
+        assert wide - narrow == 20 - len("Unit")
+
+    def test_a_width_for_each_column(self):
+        with pytest.raises(ValueError, match="a width for each of the 2 columns"):
+            make_table([12])
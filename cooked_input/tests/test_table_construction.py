@@ -324,3 +324,37 @@ class TestVerticalRules:
             table.show_table()
 
             assert "alpha" in capsys.readouterr().out
+
+
+class TestTableItemSlots:
+    def test_there_is_no_instance_dict(self):
+        item = TableItem(["alpha"], tag="a")
+        assert not hasattr(item, "__dict__")
+        with pytest.raises(AttributeError):
+            item.colour = "red"
+
+    def test_the_documented_attributes_can_still_be_set(self):
+        item = TableItem(["alpha"], tag="a")
+        item.values, item.tag, item.hidden, item.enabled = ["beta"], "b", True, False
+        item.action, item.item_data = "exit", {"id": 1}
+        assert repr(item) == ("TableItem(col_values=['beta'], tag=b, action=exit, item_data={'id': 1}, "
+                              "hidden=True, enabled=False)")
+
+    def test_a_row_does_not_share_values_with_its_table_item(self):
+        rows = [TableItem(["alpha"], tag="a")]
+        table = make_table(rows)
+        table.refresh_items()
+
+        table._rows[0].values.append("changed")
+        assert rows[0].values == ["alpha"]
+
+    def test_a_windowed_row_hands_out_its_own_values(self):
+        # A windowed table's rows share their table item's values rather than copying every row's on a refresh --
+        # but the rows it hands out, like the pages it draws, are formatted into lists of their own.
+        rows = [TableItem(["alpha"], tag="a")]
+        table = make_table(rows, windowed=True)
+        table.refresh_items()
+        assert table._rows[0].values is rows[0].values
+
+        table.get_row("a").values.append("changed")
+        assert rows[0].values == ["alpha"]
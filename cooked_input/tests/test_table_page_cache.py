@@ -0,0 +1,178 @@
+"""Tests for the cache of laid out pages Table keeps while paging.
+
+A page shown again has to look exactly like it would have if it had been laid out again, so
+most tests here page around, change something, and compare what is printed with a table that
+has never cached anything. Counting the prettytable's get_string calls shows how much laying
+out was done.
+
+Len Wanger, 2026
+"""
+
+import pytest
+
+from cooked_input import Table, TableItem, TableStyle
+from cooked_input.get_table import _PAGE_CACHE_SIZE
+
+
+def make_table(num_rows=30, windowed=False, **kwargs):
+    rows = [TableItem(["row {}".format(i), "{unit}"]) for i in range(num_rows)]
+    kwargs.setdefault("action_dict", {"unit": "kg"})
+    kwargs.setdefault("refresh", False)     # derive the rows now, not at the first prompt
+    return Table(rows, col_names=["Name", "Unit"], style=TableStyle(rows_per_page=5), windowed=windowed,
+                 **kwargs)
+
+
+def count_layouts(monkeypatch, table):
+    """Count the calls to the table's prettytable get_string."""
+    calls = []
+    get_string = table.table.get_string
+
+    def counting_get_string(**kwargs):
+        calls.append(kwargs)
+        return get_string(**kwargs)
+
+    monkeypatch.setattr(table.table, "get_string", counting_get_string)
+    return calls
+
+
+@pytest.fixture(params=[False, True], ids=["plain", "windowed"])
+def windowed(request):
+    return request.param
+
+
+class TestPaging:
+    def test_paging_back_shows_the_cached_page(self, capsys, monkeypatch, windowed):
+        table = make_table(windowed=windowed)
+        calls = count_layouts(monkeypatch, table)
+        table.goto_home()
+        table.page_down()
+        table.page_up()
+        table.page_down()
+        assert len(calls) == 2
+
+        out = capsys.readouterr().out
+        assert out.count("row 0 ") == 2 and out.count("row 5 ") == 2
+
+    def test_a_cached_page_looks_the_same(self, capsys, windowed):
+        table = make_table(windowed=windowed)
+        table.goto_home()
+        table.page_down()
+        capsys.readouterr()
+        table.page_up()
+        cached = capsys.readouterr().out
+
+        fresh = make_table(windowed=windowed)
+        fresh.goto_home()
+        assert cached == capsys.readouterr().out
+
+    def test_other_columns_are_laid_out_again(self, monkeypatch):
+        table = make_table()
+        calls = count_layouts(monkeypatch, table)
+        assert table._render() != table._render(["Name"])
+        assert table._render(["Name"]) == table._render(["Name"])
+        assert len(calls) == 2
+
+    def test_the_cache_is_bounded(self, monkeypatch):
+        table = make_table(num_rows=_PAGE_CACHE_SIZE + 5)
+        calls = count_layouts(monkeypatch, table)
+
+        for start in range(_PAGE_CACHE_SIZE + 1):
+            table.show_rows(start)
+            table._render()
+        assert len(table._page_cache) == _PAGE_CACHE_SIZE
+
+        table.show_rows(_PAGE_CACHE_SIZE)   # the most recent page is kept...
+        table._render()
+        assert len(calls) == _PAGE_CACHE_SIZE + 1
+
+        table.show_rows(0)  # ... and the oldest one dropped
+        table._render()
+        assert len(calls) == _PAGE_CACHE_SIZE + 2
+
+    def test_showing_a_page_keeps_it(self, monkeypatch):
+        table = make_table(num_rows=_PAGE_CACHE_SIZE + 5)
+        calls = count_layouts(monkeypatch, table)
+        table.show_rows(0)
+        table._render()
+
+        for start in range(1, _PAGE_CACHE_SIZE + 1):
+            table.show_rows(0)  # used again, so it is never the least recently used page
+            table._render()
+            table.show_rows(start)
+            table._render()
+
+        table.show_rows(0)
+        table._render()
+        assert len(calls) == _PAGE_CACHE_SIZE + 1
+
+
+class TestLayingOutAgain:
+    def test_refresh_items(self, capsys, windowed):
+        table = make_table(windowed=windowed)
+        table.goto_home()
+        table._table_items[0].values = ["changed", "{unit}"]
+        table.refresh_items()
+        table.goto_home()
+        assert "changed" in capsys.readouterr().out
+
+    def test_invalidate(self, monkeypatch):
+        table = make_table()
+        calls = count_layouts(monkeypatch, table)
+        table._render()
+        table.invalidate()
+        table._render()
+        assert len(calls) == 2
+
+    def test_a_style_change(self, capsys, windowed):
+        table = make_table(windowed=windowed)
+        table.goto_home()
+        table.table.border = False
+        capsys.readouterr()
+        table.goto_home()
+        assert "+" not in capsys.readouterr().out
+
+    @pytest.mark.parametrize("change", [
+        lambda table: table.align.update(Name="r"),
+        lambda table: setattr(table, "min_width", {"Name": 20}),
+        lambda table: setattr(table, "max_width", {"Name": 3}),
+        lambda table: setattr(table, "padding_width", 3),
+    ], ids=["align", "min_width", "max_width", "padding"])
+    def test_a_column_layout_change(self, capsys, windowed, change):
+        table = make_table(windowed=windowed)
+        table.goto_home()
+        change(table.table)
+        capsys.readouterr()
+        table.goto_home()
+        shown = capsys.readouterr().out
+
+        fresh = make_table(windowed=windowed)
+        change(fresh.table)
+        fresh.goto_home()
+        assert shown == capsys.readouterr().out
+
+    def test_a_windowed_action_dict_value_rebound(self, capsys):
+        # A windowed table formats its rows as it draws them, so rebinding a value must show.
+        table = make_table(windowed=True)
+        table.goto_home()
+        table.action_dict["unit"] = "lb"
+        capsys.readouterr()
+        table.goto_home()
+        out = capsys.readouterr().out
+        assert "lb" in out and "kg" not in out
+
+    def test_a_windowed_action_dict_key_added(self, monkeypatch):
+        table = make_table(windowed=True)
+        calls = count_layouts(monkeypatch, table)
+        table._render()
+        table.action_dict["other"] = 1
+        table._render()
+        assert len(calls) == 2
+
+    def test_a_plain_table_ignores_the_action_dict(self, monkeypatch):
+        # A plain table formatted its rows when they were derived, and shows those until refreshed.
+        table = make_table()
+        calls = count_layouts(monkeypatch, table)
+        table._render()
+        table.action_dict["unit"] = "lb"
+        assert "kg" in table._render()
+        assert len(calls) == 1
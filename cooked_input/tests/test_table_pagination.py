@@ -209,6 +209,56 @@ class TestRowLookup:
         with pytest.raises(ValueError, match="not in the table"):
             table.get_action("nope")
 
+    def test_the_first_row_with_a_duplicate_tag_is_found(self):
+        rows = [TableItem(["first"], tag="x"), TableItem(["second"], tag="x", action="exit")]
+        table = Table(rows, col_names=["Value"])
+        table.refresh_items()
+        assert table.get_row("x").values == ["first"]
+        assert table.get_action("x") == "default"
+
+    def test_tags_that_are_equal_but_not_the_same_type(self):
+        rows = [TableItem(["one"], tag=1), TableItem(["two"], tag=2.0)]
+        table = Table(rows, col_names=["Value"])
+        table.refresh_items()
+        assert table.get_row(1.0).values == ["one"]
+        assert table.get_row(2).values == ["two"]
+
+    def test_unhashable_tags(self):
+        class AnyTag:
+            """Unhashable, and equal to every tag."""
+            __hash__ = None
+
+            def __eq__(self, other):
+                return True
+
+        rows = [TableItem(["list"], tag=["a", "b"]), TableItem(["plain"], tag="p"), TableItem(["any"], tag=AnyTag())]
+        table = Table(rows, col_names=["Value"])
+        table.refresh_items()
+
+        assert table.get_row(["a", "b"]).values == ["list"]
+        assert table.get_row("p").values == ["plain"]
+        assert table.get_row("nope").values == ["any"]     # the first row equal to "nope"
+
+    def test_the_index_follows_a_refresh(self):
+        rows = [TableItem(["a row"], tag="old")]
+        table = Table(rows, col_names=["Value"])
+        table.refresh_items()
+        assert table.get_row("old").values == ["a row"]
+
+        rows[0].tag = "new"
+        table.refresh_items()
+        assert table.get_row("new").values == ["a row"]
+        with pytest.raises(ValueError, match="not in the table"):
+            table.get_row("old")
+
+    def test_get_rows_keeps_the_order_asked_for(self, table):
+        assert [row.tag for row in table.get_rows(["5", "0", "5"])] == ["5", "0", "5"]
+        assert table.get_rows([]) == []
+
+    def test_get_rows_raises_for_an_unknown_tag(self, table):
+        with pytest.raises(ValueError, match="get_rows: tag \\(nope\\) not in the table"):
+            table.get_rows(["1", "nope"])
+
 
 class TestDoAction:
     def test_a_callable_action_is_called_with_the_row_and_action_dict(self):
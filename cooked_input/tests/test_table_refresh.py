@@ -0,0 +1,266 @@
+"""Tests for refresh=TABLE_REFRESH_AUTO, which re-derives only the rows that changed.
+
+An auto-refreshing table has to end up showing, and accepting, exactly what a table with
+refresh=True would -- it only gets there with less work. So most tests here make a change,
+refresh both kinds of table and compare them, and count item-filter calls to see how much
+work was done.
+
+Len Wanger, 2026
+"""
+
+import pytest
+
+from cooked_input import TABLE_REFRESH_AUTO, Table, TableItem, TableStyle, get_menu
+
+
+class CountingFilter:
+    """An item filter that hides rows whose first value starts with 'x', and counts its calls."""
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, row, action_dict):
+        self.calls += 1
+        return str(row.values[0]).startswith("x"), not str(row.values[0]).startswith("off")
+
+
+def make_rows():
+    return [TableItem(["row {}".format(i), "{unit}"], tag=None if i != 5 else "five") for i in range(12)]
+
+
+def make_table(rows=None, refresh=TABLE_REFRESH_AUTO, item_filter=None, **kwargs):
+    kwargs.setdefault("action_dict", {"unit": "kg"})
+    kwargs.setdefault("style", TableStyle(rows_per_page=5))
+    return Table(make_rows() if rows is None else rows, col_names=["Name", "Unit"], refresh=refresh,
+                 item_filter=item_filter, **kwargs)
+
+
+def shown(table):
+    """Everything the table would show and accept: its rows and its choices."""
+    choices = table._prep_get_input()[0]
+    return [(r.tag, r.values, r.hidden, r.enabled) for r in table._rows], choices
+
+
+@pytest.fixture(params=[False, True], ids=["plain", "windowed"])
+def windowed(request):
+    return request.param
+
+
+class TestNothingChanged:
+    def test_a_second_prompt_does_no_work(self):
+        item_filter = CountingFilter()
+        table = make_table(item_filter=item_filter)
+        first = table._prep_get_input()
+        assert item_filter.calls == 12
+
+        assert table._prep_get_input() is first
+        assert item_filter.calls == 12
+
+    def test_refresh_true_still_does_it_all_every_time(self):
+        item_filter = CountingFilter()
+        table = make_table(refresh=True, item_filter=item_filter)
+        table._prep_get_input()
+        table._prep_get_input()
+        assert item_filter.calls == 24
+
+    def test_show_table_refreshes_once(self, capsys):
+        item_filter = CountingFilter()
+        table = make_table(item_filter=item_filter)
+        table.show_table()
+        table.show_table()
+        assert item_filter.calls == 12
+        assert capsys.readouterr().out.count("row 0") == 2
+
+
+class TestWholeTableRefreshes:
+    def test_an_action_dict_value_rebound(self, capsys, windowed):
+        item_filter = CountingFilter()
+        table = make_table(item_filter=item_filter, windowed=windowed)
+        table._prep_get_input()
+        table.action_dict["unit"] = "lb"
+        table.show_table()
+        assert item_filter.calls == 24
+        assert "lb" in capsys.readouterr().out
+
+    def test_an_action_dict_key_added(self):
+        item_filter = CountingFilter()
+        table = make_table(item_filter=item_filter)
+        table._prep_get_input()
+        table.action_dict["new"] = 1
+        table._prep_get_input()
+        assert item_filter.calls == 24
+
+    @pytest.mark.parametrize("name, value", [
+        ("action_dict", {"unit": "g"}),
+        ("item_filter", None),
+        ("add_exit", True),
+        ("windowed", True),
+    ])
+    def test_assigning_an_attribute(self, name, value):
+        table = make_table()
+        reference = make_table(refresh=True)
+        first = table._prep_get_input()
+        setattr(table, name, value)
+        setattr(reference, name, value)
+        assert table._prep_get_input() is not first
+        assert shown(table) == shown(reference)
+
+    def test_assigning_another_attribute_does_not(self):
+        table = make_table()
+        first = table._prep_get_input()
+        table.prompt = "Pick one"
+        assert table._prep_get_input() is first
+
+    def test_invalidate(self):
+        item_filter = CountingFilter()
+        table = make_table(item_filter=item_filter)
+        table._prep_get_input()
+        table.invalidate()
+        table._prep_get_input()
+        assert item_filter.calls == 24
+
+
+class TestMarkDirty:
+    def test_only_the_marked_row_is_redone(self, capsys, windowed):
+        item_filter = CountingFilter()
+        rows = make_rows()
+        table = make_table(rows, item_filter=item_filter, windowed=windowed)
+        first = table._prep_get_input()
+
+        rows[1].values[0] = "changed"
+        table.mark_dirty(rows[1])
+        table.show_table()
+
+        assert item_filter.calls == 13
+        assert "changed" in capsys.readouterr().out
+        assert table._prep_get_input() is first     # tags and enabled are as they were
+
+    def test_matches_a_full_refresh(self, windowed):
+        rows, reference_rows = make_rows(), make_rows()
+        table = make_table(rows, windowed=windowed)
+        reference = make_table(reference_rows, refresh=True, windowed=windowed)
+        table._prep_get_input()
+
+        for these in (rows, reference_rows):
+            these[2].values[0] = "new value"
+            these[3].tag = "three"
+            these[4].enabled = False
+            these[6].hidden = True
+            these[5].tag = None
+        table.mark_dirty(rows[2:7])
+
+        assert shown(table) == shown(reference)
+
+    def test_a_new_tag_can_be_looked_up(self):
+        rows = make_rows()
+        table = make_table(rows)
+        table._prep_get_input()
+        assert table.get_row(2).values[0] == "row 1"
+
+        rows[1].tag = "one"
+        table.mark_dirty(rows[1])
+        table._prep_get_input()
+        assert table.get_row("one").values[0] == "row 1"
+        with pytest.raises(ValueError):
+            table.get_row(2)
+
+    def test_a_newly_disabled_row_cannot_be_chosen(self):
+        rows = make_rows()
+        table = make_table(rows)
+        assert "2" in table._prep_get_input()[0]
+
+        rows[1].enabled = False
+        table.mark_dirty([rows[1]])
+        assert "2" not in table._prep_get_input()[0]
+
+    def test_hiding_a_row_changes_the_page(self, capsys, windowed):
+        rows = make_rows()
+        table = make_table(rows, windowed=windowed)
+        table.show_table()
+        capsys.readouterr()
+
+        rows[0].hidden = True
+        table.mark_dirty(rows[0])
+        table.show_table()
+        assert "row 0" not in capsys.readouterr().out
+
+    def test_a_row_the_filter_now_hides_redoes_the_table(self):
+        item_filter = CountingFilter()
+        rows = make_rows()
+        table = make_table(rows, item_filter=item_filter)
+        reference = make_table(make_rows(), refresh=True, item_filter=CountingFilter())
+        table._prep_get_input()
+
+        rows[2].values[0] = reference._table_items[2].values[0] = "x marks the spot"
+        table.mark_dirty(rows[2])
+        assert shown(table) == shown(reference)
+        assert item_filter.calls == 12 + 1 + 12
+
+    def test_a_row_the_filter_still_hides(self):
+        item_filter = CountingFilter()
+        rows = make_rows()
+        rows[2].values[0] = "x"
+        table = make_table(rows, item_filter=item_filter)
+        table._prep_get_input()
+
+        rows[2].values[0] = "xx"
+        table.mark_dirty(rows[2])
+        table._prep_get_input()
+        assert item_filter.calls == 12 + 1
+
+    def test_an_item_not_in_the_table_redoes_the_table(self):
+        item_filter = CountingFilter()
+        table = make_table(item_filter=item_filter)
+        table._prep_get_input()
+        table.mark_dirty(TableItem(["stranger"]))
+        table._prep_get_input()
+        assert item_filter.calls == 24
+
+    def test_an_item_in_the_table_twice_redoes_the_table(self):
+        item_filter = CountingFilter()
+        rows = make_rows()
+        rows.append(rows[0])
+        table = make_table(rows, item_filter=item_filter)
+        table._prep_get_input()
+        table.mark_dirty(rows[0])
+        table._prep_get_input()
+        assert item_filter.calls == 26
+
+    def test_marking_rows_again_later(self):
+        item_filter = CountingFilter()
+        rows = make_rows()
+        table = make_table(rows, item_filter=item_filter)
+        table._prep_get_input()
+
+        for i in (1, 2):
+            rows[i].values[0] = "changed {}".format(i)
+            table.mark_dirty(rows[i])
+            table._prep_get_input()
+
+        assert item_filter.calls == 12 + 2
+        assert [r.values[0] for r in table._rows[1:3]] == ["changed 1", "changed 2"]
+
+    def test_before_the_first_refresh(self):
+        rows = make_rows()
+        table = make_table(rows)
+        table.mark_dirty(rows[0])
+        assert shown(table) == shown(make_table(refresh=True))
+
+
+class TestAutoRefreshingMenus:
+    def test_an_action_that_changes_the_action_dict_shows(self, fake_input, capsys):
+        def bump(row, action_dict):
+            action_dict["count"] += 1
+
+        rows = [TableItem(["count is {count}"], tag="1", action=bump)]
+        table = Table(rows, col_names=["Value"], refresh=TABLE_REFRESH_AUTO, action_dict={"count": 0},
+                      required=False)
+        feeder = fake_input("1", "1", "")
+        assert table.run() is True
+        assert feeder.remaining == 0
+        rendered = capsys.readouterr().out
+        assert "count is 0" in rendered and "count is 1" in rendered and "count is 2" in rendered
+
+    def test_get_menu_accepts_auto(self, fake_input, capsys):
+        feeder = fake_input("2")
+        assert get_menu(["red", "green"], refresh=TABLE_REFRESH_AUTO) == 2
+        assert feeder.remaining == 0
@@ -0,0 +1,370 @@
+"""Tests for tables whose rows come from a TableDataSource, a page at a time.
+
+Most of these use ListSource, a data source over a list that records what it was asked
+for, so a test can check the table fetched only the page it showed. TestDBAPITableSource
+runs the same kind of table over an in-memory sqlite3 database.
+
+Len Wanger, 2026
+"""
+
+import array
+import sqlite3
+
+import pytest
+
+from cooked_input import (ColumnStore, DBAPITableSource, GetInputCommand, TABLE_REFRESH_AUTO, Table, TableDataSource,
+                          TableItem, TableStyle, next_page_cmd_action)
+
+
+class ListSource(TableDataSource):
+    def __init__(self, count):
+        self.items = [TableItem(["row {}".format(i)]) for i in range(count)]
+        self.counts = 0
+        self.fetches = []
+
+    def count(self):
+        self.counts += 1
+        return len(self.items)
+
+    def fetch(self, offset, limit):
+        self.fetches.append((offset, limit))
+        return self.items[offset:offset + limit]
+
+
+def make_table(source, rows_per_page=5, **kwargs):
+    return Table(source, col_names=["Value"], style=TableStyle(rows_per_page=rows_per_page), **kwargs)
+
+
+def page_tags(table):
+    return [row.tag for row in table._rows]
+
+
+class TestDataSourceProtocol:
+    def test_count_and_fetch_are_required(self):
+        with pytest.raises(TypeError):
+            TableDataSource()
+
+    def test_building_the_table_fetches_nothing(self):
+        source = ListSource(1000)
+        make_table(source)
+        assert source.fetches == [] and source.counts == 0
+
+    def test_without_col_names_the_first_row_gives_the_column_count(self):
+        source = ListSource(10)
+        table = Table(source)
+        assert table.field_names == ["", "col 1"]
+        assert source.fetches == [(0, 1)]
+
+
+class TestPaging:
+    def test_showing_the_table_fetches_one_page(self, capsys):
+        source = ListSource(1000)
+        table = make_table(source)
+        table.show_table()
+
+        assert source.fetches == [(0, 5)]
+        assert table.get_num_rows() == 1000
+        assert page_tags(table) == [1, 2, 3, 4, 5]
+        rendered = capsys.readouterr().out
+        assert "row 4" in rendered and "row 5" not in rendered
+
+    def test_paging_fetches_only_the_new_page(self, capsys):
+        source = ListSource(1000)
+        table = make_table(source)
+        table.show_table()
+
+        table.page_down()
+        table.goto_end()
+        table.scroll_up_one_row()
+        assert source.fetches == [(0, 5), (5, 5), (995, 5), (994, 5)]
+        assert page_tags(table) == [995, 996, 997, 998, 999]
+        assert "row 998" in capsys.readouterr().out
+
+    def test_the_same_page_is_not_fetched_again(self, capsys):
+        source = ListSource(3)
+        table = make_table(source)
+        table.show_table()
+        table.page_down()
+        assert source.fetches == [(0, 5)]
+
+    def test_refreshing_counts_and_fetches_again(self, capsys):
+        source = ListSource(20)
+        table = make_table(source)
+        table.show_table()
+        source.items.append(TableItem(["new"]))
+        table.show_table()
+
+        assert table.get_num_rows() == 21
+        assert source.counts == 2 and source.fetches == [(0, 5), (0, 5)]
+
+    def test_an_empty_source(self, capsys):
+        table = make_table(ListSource(0))
+        table.show_table()
+        assert table.get_num_rows() == 0 and table._rows == []
+
+    def test_no_rows_per_page_fetches_everything(self, capsys):
+        source = ListSource(12)
+        table = make_table(source, rows_per_page=None)
+        table.show_table()
+        assert source.fetches == [(0, 12)]
+
+
+class TestChoosing:
+    def test_the_rows_on_the_page_can_be_chosen(self, fake_input, capsys):
+        source = ListSource(100)
+        feeder = fake_input("3")
+        row = make_table(source, default_action="table_item").get_table_choice()
+        assert row.values == ["row 2"]
+        assert feeder.remaining == 0
+
+    def test_after_paging_the_new_page_can_be_chosen(self, fake_input, capsys):
+        source = ListSource(100)
+        commands = {">": GetInputCommand(next_page_cmd_action)}
+        feeder = fake_input(">", "8")
+        row = make_table(source, commands=commands, default_action="table_item").get_table_choice()
+        assert row.values == ["row 7"]
+        assert feeder.remaining == 0
+
+    def test_a_row_off_the_page_cannot_be_chosen(self, fake_input, capsys):
+        source = ListSource(100)
+        feeder = fake_input("50", "2")
+        assert make_table(source).get_table_choice() == 2
+        assert feeder.remaining == 0
+
+    def test_the_next_choice_starts_back_on_the_first_page(self, fake_input, capsys):
+        # The first call leaves the table on page 2; the second shows page 1 again, and its tags must be the ones
+        # that can be chosen -- not those of the page the table was left on.
+        source = ListSource(100)
+        commands = {">": GetInputCommand(next_page_cmd_action)}
+        table = make_table(source, commands=commands, default_action="table_item")
+
+        fake_input(">", "8")
+        assert table.get_table_choice().values == ["row 7"]
+
+        feeder = fake_input("3")
+        assert table.get_table_choice().values == ["row 2"]
+        assert feeder.remaining == 0
+
+        feeder = fake_input("8", "4")     # page 2's tags are off the page again
+        assert table.get_table_choice().values == ["row 3"]
+        assert feeder.remaining == 0
+
+    def test_a_menu_run_again_starts_back_on_the_first_page(self, fake_input, capsys):
+        chosen = []
+        source = ListSource(100)
+        commands = {">": GetInputCommand(next_page_cmd_action)}
+        table = make_table(source, commands=commands, default_action=lambda row, action_dict: chosen.append(row.tag),
+                           required=False)
+
+        fake_input(">", "9", "")
+        assert table.run() is True
+        fake_input("2", "")
+        assert table.run() is True
+        assert chosen == [9, 2]
+
+    def test_get_row_looks_on_the_page(self, capsys):
+        table = make_table(ListSource(100))
+        table.show_table()
+        assert table.get_row(2).values == ["row 1"]
+        with pytest.raises(ValueError):
+            table.get_row(50)
+
+    def test_the_exit_row_is_on_every_page(self, fake_input, capsys):
+        source = ListSource(100)
+        table = make_table(source, add_exit=True, required=False)
+        table.show_table()
+        assert page_tags(table)[-1] == "exit"
+        table.page_down()
+        assert page_tags(table) == [6, 7, 8, 9, 10, "exit"]
+
+        feeder = fake_input("exit")
+        assert table.run() is True
+        assert feeder.remaining == 0
+
+
+class TestItemFilters:
+    @staticmethod
+    def hide_odd_rows(row, action_dict):
+        odd = int(row.values[0].split()[1]) % 2 == 1
+        return odd, True
+
+    def test_hidden_rows_leave_gaps_in_the_numbering(self, capsys):
+        table = make_table(ListSource(100), item_filter=self.hide_odd_rows)
+        table.show_table()
+        assert page_tags(table) == [1, 3, 5]
+        table.page_down()
+        assert page_tags(table) == [7, 9]
+
+    def test_the_filter_is_only_run_on_the_page(self, capsys):
+        calls = []
+
+        def item_filter(row, action_dict):
+            calls.append(row)
+            return False, True
+
+        make_table(ListSource(1000), item_filter=item_filter).show_table()
+        assert len(calls) == 5
+
+    def test_a_bad_item_filter_is_still_rejected(self):
+        table = make_table(ListSource(10), item_filter="nope")
+        with pytest.raises(RuntimeError, match="item_filter"):
+            table.refresh_items(item_filter=table.item_filter)
+
+
+class TestRefreshModes:
+    def test_refresh_false_counts_once(self, capsys):
+        source = ListSource(20)
+        table = make_table(source, refresh=False)
+        table.show_table()
+        table.show_table()
+        table.page_down()
+        assert source.counts == 1
+        assert source.fetches == [(0, 5), (5, 5)]
+
+    def test_auto_refresh_waits_for_invalidate(self, capsys):
+        source = ListSource(20)
+        table = make_table(source, refresh=TABLE_REFRESH_AUTO)
+        table.show_table()
+        table.show_table()
+        assert source.counts == 1
+
+        table.invalidate()
+        table.show_table()
+        assert source.counts == 2
+
+    def test_mark_dirty_on_a_later_page(self, capsys):
+        source = ListSource(20)
+        table = make_table(source, refresh=TABLE_REFRESH_AUTO)
+        table.show_table()
+        table.page_down()
+
+        source.items[7].values[0] = "changed"
+        table.mark_dirty(source.items[7])
+        table.show_table()
+        assert source.counts == 1
+        assert table._rows[2].values == ["changed"]
+        assert page_tags(table) == [6, 7, 8, 9, 10]
+
+    def test_mark_dirty_with_a_filter_keeps_the_tags(self, capsys):
+        source = ListSource(20)
+        table = make_table(source, refresh=TABLE_REFRESH_AUTO, item_filter=TestItemFilters.hide_odd_rows)
+        table.show_table()
+
+        source.items[4].values[0] = "row 4 changed"
+        table.mark_dirty(source.items[4])
+        table.show_table()
+        assert page_tags(table) == [1, 3, 5]
+        assert table._rows[2].values == ["row 4 changed"]
+        assert source.counts == 1
+
+    def test_windowed_makes_no_difference(self, capsys):
+        plain = make_table(ListSource(20), action_dict={"x": "y"})
+        windowed = make_table(ListSource(20), action_dict={"x": "y"}, windowed=True)
+        plain.show_table()
+        windowed.show_table()
+        assert capsys.readouterr().out.count("row 3") == 2
+        assert windowed._rows[0].values == plain._rows[0].values
+
+
+@pytest.fixture
+def connection():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE parts (id INTEGER, name TEXT, price REAL)")
+    conn.executemany("INSERT INTO parts VALUES (?, ?, ?)", [(i, "part {}".format(i), i * 0.5) for i in range(200)])
+    yield conn
+    conn.close()
+
+
+class TestDBAPITableSource:
+    def test_count_and_fetch(self, connection):
+        source = DBAPITableSource(connection, "SELECT name, price FROM parts WHERE id >= ? ORDER BY id;", (50,))
+        assert source.count() == 150
+        assert [item.values for item in source.fetch(10, 2)] == [["part 60", 30.0], ["part 61", 30.5]]
+        assert source.fetch(149, 5)[0].values == ["part 199", 99.5]
+        assert source.fetch(500, 5) == []
+
+    def test_item_factory(self, connection):
+        source = DBAPITableSource(connection, "SELECT name, price FROM parts ORDER BY id",
+                                  item_factory=lambda row: TableItem(["${:.2f}".format(row[1])], tag=row[0]))
+        item = source.fetch(3, 1)[0]
+        assert item.tag == "part 3" and item.values == ["$1.50"]
+
+    def test_named_parameters(self, connection):
+        source = DBAPITableSource(connection, "SELECT name FROM parts WHERE price < :limit ORDER BY id",
+                                  {"limit": 2})
+        assert source.count() == 4
+
+    def test_a_menu_over_the_query(self, fake_input, capsys):
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE TABLE parts (id INTEGER, name TEXT)")
+        conn.executemany("INSERT INTO parts VALUES (?, ?)", [(i, "part {}".format(i)) for i in range(200)])
+        source = DBAPITableSource(conn, "SELECT name FROM parts ORDER BY id DESC")
+        commands = {">": GetInputCommand(next_page_cmd_action)}
+        table = Table(source, col_names=["Name"], commands=commands, default_action="first_value")
+
+        feeder = fake_input(">", "22")
+        assert table.get_table_choice() == "part 178"
+        assert feeder.remaining == 0
+        assert "part 199" in capsys.readouterr().out
+
+        feeder = fake_input("3")    # back on the first page for the next choice
+        assert table.get_table_choice() == "part 197"
+        assert feeder.remaining == 0
+        conn.close()
+
+    def test_repr(self, connection):
+        source = DBAPITableSource(connection, "SELECT name FROM parts")
+        assert repr(source) == "DBAPITableSource(query='SELECT name FROM parts', params=())"
+        assert "DBAPITableSource" in repr(Table(source, col_names=["Name"]))
+
+
+class TestColumnStore:
+    def test_rows_are_made_from_the_columns(self):
+        store = ColumnStore([["a", "b", "c"], array.array("d", [1.0, 2.0, 3.0])])
+        assert store.count() == 3
+        items = store.fetch(1, 5)
+        assert [(item.tag, item.values) for item in items] == [(None, ["b", 2.0]), (None, ["c", 3.0])]
+        assert store.fetch(3, 5) == []
+
+    def test_tags_and_action(self):
+        store = ColumnStore([["a", "b"]], tags=["x", "y"], action="exit")
+        item = store.fetch(1, 1)[0]
+        assert (item.tag, item.action, item.hidden, item.enabled) == ("y", "exit", False, True)
+
+    def test_columns_of_different_lengths_are_rejected(self):
+        with pytest.raises(ValueError, match=r"same length -- got lengths \[2, 1\]"):
+            ColumnStore([["a", "b"], ["c"]])
+        with pytest.raises(ValueError, match=r"got lengths \[2, 3\]"):
+            ColumnStore([["a", "b"]], tags=[1, 2, 3])
+
+    def test_no_columns(self):
+        store = ColumnStore([])
+        assert store.count() == 0 and store.fetch(0, 5) == []
+
+    def test_from_rows(self):
+        store = ColumnStore.from_rows(iter([("a", 1), ("b", 2)]), tags=["x", "y"])
+        assert store.columns == [["a", "b"], [1, 2]]
+        assert store.tags == ["x", "y"]
+        assert ColumnStore.from_rows([]).count() == 0
+        with pytest.raises(ValueError):
+            ColumnStore.from_rows([("a", 1), ("b",)])
+
+    def test_a_table_over_a_column_store(self, fake_input, capsys):
+        names = ["item {}".format(i) for i in range(1000)]
+        store = ColumnStore([names, array.array("d", range(1000))])
+        table = Table(store, col_names=["Name", "Weight"], default_action="row")
+        feeder = fake_input("3")
+        assert table.get_table_choice() == [3, "item 2", 2.0]
+        assert feeder.remaining == 0
+        assert len(table._rows) == 20
+
+    def test_appended_rows_show_after_a_refresh(self, capsys):
+        names = ["a", "b"]
+        table = make_table(ColumnStore([names]))
+        table.show_table()
+        names.append("c")
+        table.show_table()
+        assert table.get_num_rows() == 3
+
+    def test_repr(self):
+        assert repr(ColumnStore([[1, 2], [3, 4]])) == "ColumnStore(columns=2, rows=2)"
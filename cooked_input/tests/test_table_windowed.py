@@ -0,0 +1,131 @@
+"""Tests for windowed tables, which format and lay out only the page being shown.
+
+A windowed table must draw exactly what the same table drew before, page for page, while
+formatting only the rows on the page. Each test builds the same table both ways and compares
+the two.
+
+Len Wanger, 2026
+"""
+
+import pytest
+
+from cooked_input import RULE_ALL, Table, TableItem, TableStyle, create_table
+
+
+class CountingDict(dict):
+    """An action_dict that counts the lookups formatting makes in it."""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lookups = 0
+
+    def __getitem__(self, key):
+        self.lookups += 1
+        return super().__getitem__(key)
+
+
+def make_rows(count=25):
+    rows = [TableItem(["row {}".format(i), "{unit}", i * 1.5], tag=None if i % 3 else "t{}".format(i))
+            for i in range(count)]
+    rows[4].hidden = True
+    rows[7].enabled = False
+    rows[9].values[0] = "a {literal} and an {unmatched"
+    return rows
+
+
+def both(**kwargs):
+    """The same table, drawn the usual way and windowed."""
+    kwargs.setdefault("action_dict", {"unit": "kg"})
+    return [Table(make_rows(), col_names=["Name", "Unit", "Weight"], windowed=windowed, **kwargs)
+            for windowed in (False, True)]
+
+
+def draw_every_page(table, capsys):
+    table.show_table()
+    for step in (table.page_down, table.page_down, table.scroll_up_one_row, table.goto_end,
+                 table.scroll_down_one_row, table.page_up, table.goto_home):
+        step()
+        table.refresh_screen()
+    return capsys.readouterr().out
+
+
+class TestWindowedLooksTheSame:
+    @pytest.mark.parametrize("options", [
+        {},
+        {"style": TableStyle(rows_per_page=4)},
+        {"style": TableStyle(rows_per_page=None)},
+        {"style": TableStyle(rows_per_page=5, hrules=RULE_ALL, show_border=False)},
+        {"add_exit": True},
+        {"refresh": False},
+        {"item_filter": lambda row, action_dict: (row.values[2] > 20, True)},
+        {"title": "Weights", "header": "{unit} header", "footer": "footer"},
+    ])
+    def test_every_page_matches(self, capsys, options):
+        plain, windowed = both(**options)
+        assert draw_every_page(windowed, capsys) == draw_every_page(plain, capsys)
+
+    def test_the_row_count_matches(self):
+        plain, windowed = both(add_exit=True)
+        plain.refresh_items(add_exit=True)
+        windowed.refresh_items(add_exit=True)
+        assert windowed.get_num_rows() == plain.get_num_rows() == 26
+
+    def test_an_empty_page(self, capsys):
+        plain, windowed = both(item_filter=lambda row, action_dict: (True, True))
+        plain.show_table()
+        windowed.show_table()
+        rendered = capsys.readouterr().out
+        half = len(rendered) // 2
+        assert rendered[:half] == rendered[half:]
+
+
+class TestWindowedFormatsOnlyThePage:
+    def test_the_prettytable_is_empty_between_draws(self, capsys):
+        table = Table(make_rows(), col_names=["Name", "Unit", "Weight"], windowed=True,
+                      action_dict={"unit": "kg"})
+        table.show_table()
+        assert "row 0" in capsys.readouterr().out
+        assert table.table.rows == []
+
+    def test_only_the_shown_rows_are_formatted(self, capsys):
+        action_dict = CountingDict(unit="kg")
+        rows = [TableItem(["row {}".format(i), "{unit}"]) for i in range(1000)]
+        table = Table(rows, col_names=["Name", "Unit"], windowed=True, action_dict=action_dict,
+                      style=TableStyle(rows_per_page=10))
+        table.refresh_items()
+        assert action_dict.lookups == 0
+
+        table.refresh_screen()
+        assert action_dict.lookups == 10
+        assert capsys.readouterr().out.count("kg") == 10
+
+    def test_formatting_uses_the_action_dict_when_shown(self, capsys):
+        table = Table(make_rows(), col_names=["Name", "Unit", "Weight"], windowed=True, refresh=False,
+                      action_dict={"unit": "kg"})
+        table.action_dict["unit"] = "lb"
+        table.refresh_screen()
+        rendered = capsys.readouterr().out
+        assert "lb" in rendered and "kg" not in rendered
+
+
+class TestWindowedRows:
+    def test_a_chosen_row_is_formatted(self, fake_input, capsys):
+        plain, windowed = both(default_action="row")
+        fake_input("t0\nt0\n")
+        assert windowed.get_table_choice() == plain.get_table_choice() == ["t0", "row 0", "kg", 0.0]
+
+    def test_get_row_is_formatted(self):
+        plain, windowed = both()
+        plain.refresh_items()
+        windowed.refresh_items()
+        assert windowed.get_row("t3").values == plain.get_row("t3").values == ["row 3", "kg", 4.5]
+        assert windowed.get_action(2) == plain.get_action(2)
+
+    def test_a_disabled_row_cannot_be_chosen(self, fake_input, capsys):
+        _, windowed = both()
+        fake_input("8\nt3\n")
+        assert windowed.get_table_choice() == "t3"
+        assert capsys.readouterr().err
+
+    def test_create_table_passes_windowed_on(self):
+        table = create_table([{"name": "a"}, {"name": "b"}], ["name"], gen_tags=True, windowed=True)
+        assert table.windowed is True
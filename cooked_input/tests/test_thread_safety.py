@@ -0,0 +1,211 @@
+"""Tests for sharing one GetInput, and the built-in cleaners, convertors and validators, between threads.
+
+The stress tests run the same values through a shared instance from a pool of threads, each collecting
+its own errors, and check that every thread got exactly what one thread alone would have. The thread
+switch interval is turned right down while they run, so the threads are interrupted far more often
+than usual -- in the middle of a cache update, say -- which is where races show up.
+
+Len Wanger, 2026
+"""
+
+import pickle
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from cooked_input import (
+    CapitalizationCleaner,
+    ChoiceValidator,
+    DateConvertor,
+    GetInput,
+    IntConvertor,
+    LengthValidator,
+    ListConvertor,
+    PipelineMetrics,
+    RangeValidator,
+    StripCleaner,
+    print_error,
+    set_metrics,
+)
+
+THREADS = 8
+ROUNDS = 20
+
+
+@pytest.fixture(autouse=True)
+def switch_often():
+    """Switch threads as often as possible while the test runs."""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def error_collector():
+    """Return an error callback, and the list it appends the formatted messages to."""
+    errors = []
+
+    def collect(fmt_str, value, error_content):
+        errors.append(fmt_str.format(value=value, error_content=error_content))
+
+    return collect, errors
+
+
+def run_threads(work, values):
+    """Run ``work(values)`` in THREADS threads at once, returning what each returned."""
+    barrier = threading.Barrier(THREADS)
+
+    def start(_):
+        barrier.wait()  # all at once, rather than each finishing before the next starts
+        return work(values)
+
+    with ThreadPoolExecutor(THREADS) as executor:
+        return list(executor.map(start, range(THREADS)))
+
+
+def process_all(gi):
+    """Return work processing each value with its own error callback, as a server handling requests would."""
+    def work(values):
+        results = []
+        for _ in range(ROUNDS):
+            for value in values:
+                collect, errors = error_collector()
+                results.append((gi.process_value(value, error_callback=collect), errors))
+        return results
+
+    return work
+
+
+class TestSharedGetInput:
+    def test_dates_through_a_small_cache(self):
+        # A cache smaller than the number of distinct dates is forever dropping values other threads are using.
+        dc = DateConvertor(cache_size=3, languages=["en"])
+        gi = GetInput(StripCleaner(), dc, prompt="Date")
+        values = [" 2026-01-{:02d} ".format(day) for day in range(1, 10)] + ["2026-13-01", "not a date"]
+        expected = process_all(gi)(values)
+
+        for results in run_threads(process_all(gi), values):
+            assert results == expected
+
+        assert len(dc._cache) == 3
+
+    def test_lists(self):
+        elements = GetInput(convertor=IntConvertor(), validators=RangeValidator(0, 100))
+        gi = GetInput(convertor=ListConvertor(elements), validators=LengthValidator(1, 3))
+        values = ["1,2,3", "4, 5", "1,2,3,4", "1,x", "7", '"8",9']
+        expected = process_all(gi)(values)
+        assert [valid for (valid, _), _ in expected[:len(values)]] == [True, True, False, False, True, True]
+
+        for results in run_threads(process_all(gi), values):
+            assert results == expected
+
+    def test_cleaners_and_validators(self):
+        gi = GetInput([StripCleaner(), CapitalizationCleaner()], validators=ChoiceValidator(["Red", "Green"]))
+        values = ["  red", "GREEN ", "blue"]
+        expected = process_all(gi)(values)
+
+        for results in run_threads(process_all(gi), values):
+            assert results == expected
+
+    def test_bulk_calls_with_their_own_error_callback(self):
+        gi = GetInput(convertor=IntConvertor(), validators=RangeValidator(1, 9))
+        values = [str(v) for v in range(-5, 15)] + ["x"]
+
+        def work(values):
+            collect, errors = error_collector()
+            return gi.process_value_list(values, error_callback=collect), errors
+
+        results = run_threads(work, values)
+        assert all(result == results[0] for result in results)
+        assert len(results[0][1]) == 12
+
+
+class TestMetricsFromThreads:
+    def test_counts_are_exact(self):
+        metrics = PipelineMetrics()
+        previous = set_metrics(metrics)
+        gi = GetInput(convertor=IntConvertor(), validators=RangeValidator(1, 9), error_callback=lambda *args: None)
+
+        try:
+            run_threads(lambda values: [gi.process_value(v) for _ in range(ROUNDS) for v in values], ["5", "x", "50"])
+        finally:
+            set_metrics(previous)
+
+        total = THREADS * ROUNDS
+        assert metrics.values == 3 * total
+        assert metrics.conversion_failures == total
+        assert metrics.validation_failures == total
+        assert metrics.stages[("convertor", "IntConvertor")].count == 3 * total
+        assert metrics.stages[("validator", "RangeValidator")].count == 2 * total
+
+
+class TestPrintErrorFromThreads:
+    def test_messages_come_out_one_to_a_line(self, capsys):
+        def work(values):
+            for value in values:
+                print_error('"{value}" {error_content}', value, "is not wanted")
+
+        run_threads(work, range(ROUNDS))
+        lines = capsys.readouterr().err.splitlines()
+
+        assert len(lines) == THREADS * ROUNDS
+        assert set(lines) == {'"{}" is not wanted'.format(v) for v in range(ROUNDS)}
+
+
+class TestErrorCallbackArgument:
+    def test_used_in_place_of_the_instances(self, capsys):
+        gi = GetInput(convertor=IntConvertor())
+        collect, errors = error_collector()
+
+        assert gi.process_value("x", error_callback=collect) == (False, None)
+        assert list(gi.process_values(["y", "1"], error_callback=collect)) == [(False, None), (True, 1)]
+        assert list(gi.process_values(["z"], chunk_size=2, error_callback=collect)) == [[(False, None)]]
+        assert len(errors) == 3
+        assert capsys.readouterr().err == ""
+
+        gi.process_value("x")  # and the instance's is still used without one
+        assert '"x"' in capsys.readouterr().err
+
+    def test_parallel(self, capsys):
+        gi = GetInput(convertor=IntConvertor())
+        collect, errors = error_collector()
+
+        results = list(gi.process_values_parallel(["1", "x"], workers=1, error_callback=collect))
+        assert results == [(True, 1), (False, None)]
+        assert errors == ['"x" cannot be converted to an integer number']
+        assert capsys.readouterr().err == ""
+
+
+class TestDateConvertorParsers:
+    def test_dates_through_dateparser(self):
+        # Not ISO, so every value goes through dateparser -- and, with a cache, through both of its parsers.
+        dc = DateConvertor(cache_size=4)
+        gi = GetInput(convertor=dc, prompt="Date")
+        values = ["January {}, 2026".format(day) for day in range(1, 8)] + ["3 mars 2026", "May 5", "not a date"]
+        expected = process_all(gi)(values)
+
+        for results in run_threads(process_all(gi), values):
+            assert results == expected
+
+    def test_each_thread_has_its_own(self):
+        dc = DateConvertor(cache_size=4)
+        dc("January 5, 2020", print_error, "")
+
+        def work(values):
+            return dc._dateparser(), dc._dateparser(relative_base=True)
+
+        parsers = run_threads(work, [])
+        assert len({id(parser) for pair in parsers for parser in pair}) == 2 * THREADS
+        assert dc._parsers.parser not in [parser for parser, _ in parsers]
+
+    def test_pickled_after_use(self):
+        dc = DateConvertor(cache_size=4)
+        dc("January 5, 2020", print_error, "")
+        assert dc._parsers.parser is not None
+
+        copy = pickle.loads(pickle.dumps(dc))
+        assert not hasattr(copy._parsers, "parser")     # built again when needed
+        assert list(copy._cache) == ["January 5, 2020"]
+        assert copy("January 6, 2020", print_error, "").day == 6
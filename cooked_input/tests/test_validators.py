@@ -8,6 +8,7 @@ called directly.
 Len Wanger, 2026
 """
 
+import decimal
 import re
 
 import pytest
@@ -381,3 +382,63 @@ class TestLengthAndChoiceEdges:
         ChoiceValidator(["red", "green"])("blue", print_error, DEFAULT_VALIDATOR_ERROR)
         message = capsys.readouterr().err
         assert "red" in message and "green" in message
+
+    def test_choice_validator_message_is_bounded(self, capsys):
+        ChoiceValidator(["sku-{}".format(i) for i in range(1000)])("blue", print_error, DEFAULT_VALIDATOR_ERROR)
+        message = capsys.readouterr().err
+        assert "sku-19," in message and "sku-20" not in message
+        assert message.rstrip().endswith("and 980 more")
+
+    def test_choice_validator_message_with_exactly_the_limit(self, capsys):
+        ChoiceValidator([str(i) for i in range(20)])("blue", print_error, DEFAULT_VALIDATOR_ERROR)
+        assert "more" not in capsys.readouterr().err
+
+
+class TestChoiceValidatorMembership:
+    """The set lookup accepts exactly what the list scan it replaced did."""
+
+    def test_large_choice_list(self):
+        cv = ChoiceValidator(range(100_000))
+        assert quiet(99_999, cv) is True
+        assert quiet(100_000, cv) is False
+        assert quiet("5", cv) is False
+
+    def test_equal_values_of_other_types(self):
+        cv = ChoiceValidator([1, 2.5])
+        assert quiet(1.0, cv) is True
+        assert quiet(True, cv) is True
+        assert quiet(decimal.Decimal("2.5"), cv) is True
+
+    def test_unhashable_choices(self):
+        cv = ChoiceValidator([[1, 2], "a", {"k": 1}])
+        assert quiet([1, 2], cv) is True
+        assert quiet({"k": 1}, cv) is True
+        assert quiet("a", cv) is True
+        assert quiet([2, 1], cv) is False
+        assert quiet("b", cv) is False
+
+    def test_unhashable_value_against_hashable_choices(self):
+        cv = ChoiceValidator([(1, 2), "a"])
+        assert quiet([1, 2], cv) is False
+        assert quiet((1, 2), cv) is True
+
+    def test_hashable_value_equal_to_an_unhashable_choice(self):
+        class AnyString:
+            __hash__ = None
+
+            def __eq__(self, other):
+                return isinstance(other, str)
+
+        cv = ChoiceValidator([AnyString()])
+        assert quiet("whatever", cv) is True
+        assert quiet(3, cv) is False
+
+    def test_a_single_string_is_one_choice(self):
+        cv = ChoiceValidator("abc")
+        assert quiet("abc", cv) is True
+        assert quiet("a", cv) is False
+
+    def test_table_row_numbers(self):
+        cv = ChoiceValidator({"a": 0, "b": 1}.values())
+        assert quiet(1, cv) is True
+        assert quiet(2, cv) is False
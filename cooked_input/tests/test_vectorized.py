@@ -0,0 +1,142 @@
+"""Tests for process_column: converting and range checking a column of numbers into NumPy arrays.
+
+Most tests check process_column against what GetInput.process_values gives for the same values -- the
+mask, the values and the error messages, in order. Skipped when NumPy is not installed, but for the
+test of the error saying how to install it.
+
+Len Wanger, 2026
+"""
+
+import sys
+
+import pytest
+
+import cooked_input as ci
+from cooked_input import (
+    ColumnResponse,
+    FloatConvertor,
+    GetInput,
+    IntConvertor,
+    LengthValidator,
+    RangeValidator,
+    process_column,
+    silent_error,
+)
+from cooked_input import vectorized
+
+
+class Recorder:
+    """An error callback keeping the formatted messages."""
+    def __init__(self):
+        self.messages = []
+
+    def __call__(self, fmt_str, value, error_content):
+        self.messages.append(fmt_str.format(value=value, error_content=error_content))
+
+
+def scalar(values, convertor, validators=None):
+    """What GetInput.process_values gives: (valid, value) pairs and the error messages."""
+    errors = Recorder()
+    gi = GetInput(convertor=convertor, validators=validators, error_callback=errors)
+    return [tuple(response) for response in gi.process_values(values)], errors.messages
+
+
+def column(values, convertor, validators=None):
+    """What process_column gives, in the same form as scalar()."""
+    errors = Recorder()
+    response = process_column(values, convertor, validators, error_callback=errors)
+    pairs = [(valid, value if valid else None) for valid, value in zip(response.valid.tolist(),
+                                                                      response.values.tolist())]
+    return pairs, errors.messages
+
+
+class TestProcessColumn:
+    @pytest.fixture(autouse=True)
+    def needs_numpy(self):
+        pytest.importorskip("numpy")
+
+    def test_floats(self):
+        values = ["1.5", " 2 ", "x", "-3e2", "1_000.5", "", "nan", "inf", "7"]
+        validator = RangeValidator(-100.0, 100.0)
+        assert column(values, FloatConvertor(), validator) == scalar(values, FloatConvertor(), validator)
+
+    def test_ints(self):
+        values = ["1", "+2", " 3", "4.0", "0x5", "-6", "1_000", "abc", "150"]
+        validators = [RangeValidator(min_val=0), RangeValidator(max_val=100)]
+        assert column(values, IntConvertor(), validators) == scalar(values, IntConvertor(), validators)
+
+    def test_other_bases(self):
+        values = ["ff", "0x10", "g", "-1a"]
+        assert column(values, IntConvertor(base=16)) == scalar(values, IntConvertor(base=16))
+
+    def test_arrays(self):
+        np = pytest.importorskip("numpy")
+        response = process_column(np.array(["3", "4", "x"]), IntConvertor(), error_callback=silent_error)
+
+        assert isinstance(response, ColumnResponse)
+        assert response.valid.dtype == bool and response.values.dtype == np.int64
+        assert response.valid.tolist() == [True, True, False]
+        assert response.values.tolist() == [3, 4, 0]
+
+    def test_failures_are_zero_or_nan(self):
+        np = pytest.importorskip("numpy")
+        assert process_column(["x"], IntConvertor(), error_callback=silent_error).values.tolist() == [0]
+        assert np.isnan(process_column(["x"], FloatConvertor(), error_callback=silent_error).values[0])
+
+    def test_errors_are_in_order_across_blocks(self, monkeypatch):
+        # Small blocks, so the bad values are found by halving several blocks, last found first.
+        monkeypatch.setattr(vectorized, "_BLOCK_SIZE", 16)
+        monkeypatch.setattr(vectorized, "_SCALAR_BLOCK_SIZE", 2)
+        values = [str(i) if i % 7 else "bad{}".format(i) for i in range(100)]
+        validator = RangeValidator(0, 90)
+
+        assert column(values, IntConvertor(), validator) == scalar(values, IntConvertor(), validator)
+
+    def test_ints_too_big_for_int64(self):
+        big = str(2 ** 70)
+        response = process_column(["1", big, "x"], IntConvertor(), RangeValidator(0), error_callback=silent_error)
+
+        assert response.values.dtype == object
+        assert response.valid.tolist() == [True, True, False]
+        assert response.values.tolist() == [1, 2 ** 70, 0]
+
+    def test_a_rejected_int_too_big_for_int64_keeps_the_array_int64(self):
+        np = pytest.importorskip("numpy")
+        values = ["1", "x", "99999999999999999999999", "5", str(-2 ** 70)]
+        response = process_column(values, IntConvertor(), RangeValidator(0, 10), error_callback=silent_error)
+
+        assert response.values.dtype == np.int64
+        assert response.valid.tolist() == [True, False, False, True, False]
+        assert response.values.tolist() == [1, 0, 0, 5, 0]
+        assert column(values, IntConvertor(), RangeValidator(0, 10)) == scalar(values, IntConvertor(),
+                                                                                RangeValidator(0, 10))
+
+    def test_empty(self):
+        response = process_column([], FloatConvertor(), RangeValidator(0, 1))
+        assert response.valid.tolist() == [] and response.values.tolist() == []
+
+    def test_message_formats(self):
+        errors = Recorder()
+        process_column(["x", "9"], IntConvertor(), RangeValidator(0, 5), error_callback=errors,
+                       convertor_error_fmt="bad {value}", validator_error_fmt="{value}: {error_content}")
+        assert errors.messages == ["bad x", "9: too high (max_val=5)"]
+
+    def test_default_error_callback_prints(self, capsys):
+        process_column(["x"], IntConvertor())
+        assert '"x" cannot be converted to an integer number' in capsys.readouterr().err
+
+    def test_not_a_number_convertor(self):
+        with pytest.raises(TypeError, match="convertor must be an IntConvertor or FloatConvertor"):
+            process_column(["1"], ci.BooleanConvertor())  # ty: ignore[invalid-argument-type]
+
+    def test_not_a_range_validator(self):
+        with pytest.raises(TypeError, match="validators must be RangeValidators"):
+            process_column(["1"], IntConvertor(), LengthValidator(1))  # ty: ignore[invalid-argument-type]
+
+
+class TestWithoutNumpy:
+    def test_says_how_to_install_it(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "numpy", None)     # makes `import numpy` raise ImportError
+
+        with pytest.raises(ImportError, match=r"pip install cooked-input\[numpy\]"):
+            process_column(["1"], IntConvertor())
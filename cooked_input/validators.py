@@ -19,6 +19,9 @@ from ._typing import ErrorCallback, ValidatorArg
 from .error_callbacks import print_error, silent_error, DEFAULT_VALIDATOR_ERROR
 from .input_utils import put_in_a_list, isstring
 
+# The most choices ChoiceValidator lists when it rejects a value.
+_MAX_CHOICES_IN_ERROR = 20
+
 
 def _in_any(value: Any, validators: Any, error_callback: ErrorCallback,
             validator_fmt_str: str) -> bool:
@@ -308,18 +311,47 @@ class ChoiceValidator(Validator):
         cv = ChoiceValidator(colors]
         result = get_string(prompt="Enter a color", validators=cv)
 
+    Checking a value takes the same time however many choices there are, so long lists (every SKU, every country
+    code) are fine. Choices that cannot be hashed (e.g. lists) work too, but are compared one at a time. When a
+    value is rejected the error message lists the first 20 choices and says how many more there are.
     """
     def __init__(self, choices: Any) -> None:
-        # note: if choices is mutable, the choices can change after instantiation
+        # put_in_a_list copies choices, so changing the caller's collection afterwards does not
+        # change what this validator accepts.
         self._choices = put_in_a_list(choices)
 
-    def __call__(self, value: Any, error_callback: ErrorCallback, validator_fmt_str: str) -> bool:
-        result = value in self._choices
+        # Fixing: `value in self._choices` was a scan of the whole list on every value, and a
+        # Table validates against a list of every one of its row numbers. Choices that can be
+        # hashed go in a set; the rest (e.g. a list of lists) stay in a list that is still
+        # scanned, but is normally empty.
+        self._hashable_choices: set[Any] = set()
+        self._unhashable_choices: list[Any] = []
 
-        if result:
+        for choice in self._choices:
+            try:
+                self._hashable_choices.add(choice)
+            except TypeError:
+                self._unhashable_choices.append(choice)
+
+    def _is_choice(self, value: Any) -> bool:
+        try:
+            if value in self._hashable_choices:
+                return True
+        except TypeError:   # the value is unhashable, so the set cannot be asked
+            return value in self._choices
+
+        return bool(self._unhashable_choices) and value in self._unhashable_choices
+
+    def __call__(self, value: Any, error_callback: ErrorCallback, validator_fmt_str: str) -> bool:
+        if self._is_choice(value):
             return True
         else:
-            choice_strs = [str(c) for c in self._choices]
+            # Fixing: the message used to join every choice, which for a long list (every SKU,
+            # every country code) printed an enormous line. Only the first few are shown.
+            choice_strs = [str(c) for c in self._choices[:_MAX_CHOICES_IN_ERROR]]
+            if len(self._choices) > _MAX_CHOICES_IN_ERROR:
+                choice_strs.append('and {} more'.format(len(self._choices) - _MAX_CHOICES_IN_ERROR))
+
             error_callback(validator_fmt_str, value, 'value must be one of: {}'.format(', '.join(choice_strs)))
             return False
 
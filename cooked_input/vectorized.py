@@ -0,0 +1,190 @@
+"""
+Converting and range checking whole columns of numbers at once, with `NumPy <https://numpy.org>`_.
+
+:func:`process_column` does for a column of strings -- sensor readings or prices from an import, say -- what
+:meth:`GetInput.process_values` does with an :class:`IntConvertor` or :class:`FloatConvertor` and
+:class:`RangeValidator`, but a block at a time and with array comparisons, handing back a mask of which values
+passed and an array of the converted values. NumPy is an optional dependency (``pip install cooked-input[numpy]``), only imported when a
+column is processed.
+
+Author: Len Wanger
+Copyright: Len Wanger, 2017-2026
+"""
+
+from __future__ import annotations
+
+import collections
+import itertools
+from collections.abc import Iterable
+from typing import Any
+
+from ._typing import ErrorCallback
+from .convertors import ConvertorError, FloatConvertor, IntConvertor
+from .error_callbacks import DEFAULT_CONVERTOR_ERROR, DEFAULT_VALIDATOR_ERROR, print_error, silent_error
+from .input_utils import put_in_a_list
+from .validators import RangeValidator
+
+ColumnResponse = collections.namedtuple('ColumnResponse', 'valid values')
+ColumnResponse.__doc__ = """\
+The result of :func:`process_column`.
+
+``valid``: a NumPy array of **bool**, **True** for each value that was converted and passed validation
+
+``values``: a NumPy array of the converted values -- 0 for an integer (or NaN for a float) that failed
+"""
+
+# The number of values converted in one go. A block holding a value that cannot be converted is split in half and
+# each half tried again, down to _SCALAR_BLOCK_SIZE values, which are converted one at a time. So a bad value costs
+# a few block conversions and a few dozen single ones, rather than its whole block's worth.
+_BLOCK_SIZE = 4096
+_SCALAR_BLOCK_SIZE = 64
+
+
+def _numpy() -> Any:
+    """
+    Import NumPy, saying how to install it if it is not there.
+    """
+    # Imported here rather than at the top, as NumPy is optional and only column processing needs it.
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError('process_column needs NumPy, which is not installed. Install it with: '
+                          'pip install cooked-input[numpy]') from None
+
+    return numpy
+
+
+def process_column(values: Iterable[Any], convertor: IntConvertor | FloatConvertor,
+                   validators: RangeValidator | Iterable[RangeValidator] | None = None, *,
+                   error_callback: ErrorCallback = print_error,
+                   convertor_error_fmt: str = DEFAULT_CONVERTOR_ERROR,
+                   validator_error_fmt: str = DEFAULT_VALIDATOR_ERROR) -> ColumnResponse:
+    """
+    Convert and range check a column of values as array operations.
+
+    :param values: the values to process: a list (or other iterable) of strings, or a NumPy array of them
+    :param convertor: an :class:`IntConvertor` or :class:`FloatConvertor`
+    :param validators: (optional) a :class:`RangeValidator`, or list of them, to check the converted values with
+    :param error_callback: (optional) the callback to report errors to. Defaults to :func:`print_error`
+    :param convertor_error_fmt: (optional) format string for conversion errors. Defaults to
+        **DEFAULT_CONVERTOR_ERROR**
+    :param validator_error_fmt: (optional) format string for validation errors. Defaults to
+        **DEFAULT_VALIDATOR_ERROR**
+
+    :return: a :class:`ColumnResponse` namedtuple ``(valid, values)`` of NumPy arrays, one entry per value and in the
+        same order
+    :raises ImportError: if NumPy is not installed
+    :raises TypeError: if ``convertor`` is not an :class:`IntConvertor` or :class:`FloatConvertor`, or a validator is
+        not a :class:`RangeValidator`
+
+    The values are converted a block at a time into a NumPy ``int64`` or ``float64`` array, and the ranges checked
+    with array comparisons. The strings are read by the `int` and `float` calls the convertors make -- mapped over
+    the block rather than called value by value, and quicker than NumPy's own string parsing -- so the values
+    accepted are exactly the ones the convertor accepts.
+
+    The values that fail -- and only those -- then go back through ``convertor`` and ``validators`` one at a
+    time, as :meth:`GetInput.process_values` would run them, so the errors reported are the ones the scalar
+    convertors and validators give, in the order of the values. An integer too big for ``int64``, which
+    :class:`IntConvertor` accepts, is kept by making ``values`` an array of Python objects -- but only if it passes
+    validation: one that fails is marked failed and the array stays ``int64``.
+
+    For example::
+
+        readings = process_column(column, FloatConvertor(), RangeValidator(-40.0, 125.0))
+        good = readings.values[readings.valid]
+    """
+    np = _numpy()
+    validators = put_in_a_list(validators)
+
+    if isinstance(convertor, IntConvertor):
+        dtype = np.int64
+        base = convertor._base
+
+        def convert_block(block: list[Any]) -> list[Any]:
+            return list(map(int, block, itertools.repeat(base, len(block))))     # int(value, base), as the convertor
+    elif isinstance(convertor, FloatConvertor):
+        dtype = np.float64
+
+        def convert_block(block: list[Any]) -> list[Any]:
+            return list(map(float, block))
+    else:
+        raise TypeError('process_column: convertor must be an IntConvertor or FloatConvertor -- got {!r}'.format(
+            convertor))
+
+    for validator in validators:
+        if not isinstance(validator, RangeValidator):
+            raise TypeError('process_column: validators must be RangeValidators -- got {!r}'.format(validator))
+
+    strings = values.tolist() if isinstance(values, np.ndarray) else list(values)
+    converted = np.zeros(len(strings), dtype=dtype)
+    valid = np.ones(len(strings), dtype=bool)
+    too_big: dict[int, int | float] = {}     # the integers too big for int64 (floats never are), by index
+
+    # Convert a block at a time. A block that cannot be converted whole -- it holds a bad value, or an integer too
+    # big for int64 -- is halved until small, then converted by the convertor a value at a time, quietly: the errors
+    # come after. The blocks are kept on a stack, last first, so they are still converted in order.
+    blocks = [(start, min(start + _BLOCK_SIZE, len(strings))) for start in range(0, len(strings), _BLOCK_SIZE)]
+    blocks.reverse()
+
+    while blocks:
+        start, stop = blocks.pop()
+        block = strings[start:stop]
+
+        try:
+            converted[start:stop] = convert_block(block)
+            continue
+        except (ValueError, TypeError, OverflowError):
+            if stop - start > _SCALAR_BLOCK_SIZE:
+                middle = (start + stop) // 2
+                blocks += [(middle, stop), (start, middle)]
+                continue
+
+        for i, value in enumerate(block, start):
+            try:
+                number = convertor(value, silent_error, convertor_error_fmt)
+            except ConvertorError:
+                valid[i] = False
+                continue
+
+            try:
+                converted[i] = number
+            except OverflowError:
+                too_big[i] = number     # its place in converted is left at 0, and checked below
+
+    for validator in validators:
+        # Comparing NaN gives False, so a NaN fails a range with either end, as it does in RangeValidator.
+        if validator._min_val is not None:
+            valid &= converted >= validator._min_val
+        if validator._max_val is not None:
+            valid &= converted <= validator._max_val
+
+    # The integers too big for int64 are checked as Python ints. Only if one passes does converted become an array of
+    # Python objects to hold it -- a rejected value is zeroed anyway, and should not cost the caller an int64 array.
+    kept = []
+
+    for i, number in too_big.items():
+        valid[i] = all((validator._min_val is None or number >= validator._min_val)
+                       and (validator._max_val is None or number <= validator._max_val) for validator in validators)
+        if valid[i]:
+            kept.append(i)
+
+    if kept:
+        converted = converted.astype(object)
+        for i in kept:
+            converted[i] = too_big[i]
+
+    # Report the failures as the scalar pipeline would, value by value.
+    failed = np.flatnonzero(~valid)
+
+    for i in failed.tolist():
+        value = strings[i]
+        try:
+            number = convertor(value, error_callback, convertor_error_fmt)
+        except ConvertorError:
+            continue
+
+        # all() stops at the first validator that fails, as the pipeline does.
+        all(validator(number, error_callback, validator_error_fmt) for validator in validators)
+
+    converted[failed] = 0 if dtype is np.int64 else np.nan
+    return ColumnResponse(valid, converted)